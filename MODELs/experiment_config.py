@@ -105,3 +105,4 @@ OUTPUT_CSV = os.path.join(os.path.dirname(__file__), "evaluation_results.csv")
 MAX_RETRIES = 3
 API_TIMEOUT = 60
 RATE_LIMIT_RPM = 60
+RATE_LIMIT_TPM = None  # tokens per minute (None = unlimited)
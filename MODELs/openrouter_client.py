@@ -4,14 +4,38 @@ Provides a unified interface for making completion requests to various LLMs via
 """
 import os
 import time
+import logging
 import requests
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 
+# Share the main pipeline's cross-process rate limiter when the repository
+# root is importable (e.g. PYTHONPATH=.. when running from MODELs/)
+try:
+    from src.rate_limiter import TokenBucketRateLimiter, estimate_message_tokens
+    HAS_RATE_LIMITER = True
+except ImportError:
+    HAS_RATE_LIMITER = False
+
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
 
+def _env_int(name: str) -> Optional[int]:
+    """Read an optional positive integer from the environment, ignoring malformed values."""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        parsed = int(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: expected an integer")
+        return None
+    return parsed if parsed > 0 else None
+
+
 class OpenRouterClient:
     """Client for interacting with the OpenRouter API."""
     
@@ -23,7 +47,9 @@ class OpenRouterClient:
         app_name: Optional[str] = None,
         app_url: Optional[str] = None,
         max_retries: int = 3,
-        timeout: int = 60
+        timeout: int = 60,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
     ):
         """
         Initialize the OpenRouter client.
@@ -34,6 +60,10 @@ class OpenRouterClient:
             app_url: Application URL for analytics
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
+            requests_per_minute: Shared request limit for this API key
+                (defaults to LLM_RATE_LIMIT_RPM env var)
+            tokens_per_minute: Shared token limit for this API key
+                (defaults to LLM_RATE_LIMIT_TPM env var)
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
@@ -54,6 +84,19 @@ class OpenRouterClient:
             "X-Title": self.app_name,
             "Content-Type": "application/json"
         })
+        
+        # Shared with every process (including the main pipeline) using this key
+        requests_per_minute = requests_per_minute or _env_int("LLM_RATE_LIMIT_RPM")
+        tokens_per_minute = tokens_per_minute or _env_int("LLM_RATE_LIMIT_TPM")
+        self.rate_limiter = None
+        if (requests_per_minute or tokens_per_minute) and not HAS_RATE_LIMITER:
+            logger.warning("Rate limiting disabled: src.rate_limiter is not importable")
+        if HAS_RATE_LIMITER and (requests_per_minute or tokens_per_minute):
+            self.rate_limiter = TokenBucketRateLimiter(
+                key=self.api_key,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute
+            )
     
     def create_completion(
         self,
@@ -97,7 +140,13 @@ class OpenRouterClient:
             **kwargs
         }
         
+        reserved_tokens = estimate_message_tokens(messages) + max_tokens if self.rate_limiter else 0
+        
         for attempt in range(self.max_retries):
+            if self.rate_limiter:
+                self.rate_limiter.acquire(reserved_tokens)
+            settled = False
+            
             try:
                 response = self.session.post(
                     self.BASE_URL,
@@ -111,6 +160,13 @@ class OpenRouterClient:
                 # Parse response
                 data = response.json()
                 
+                if self.rate_limiter:
+                    self.rate_limiter.settle(
+                        reserved_tokens,
+                        (data.get("usage") or {}).get("total_tokens")
+                    )
+                settled = True
+                
                 # Extract the generated text
                 if "choices" in data and len(data["choices"]) > 0:
                     generated_text = data["choices"][0]["message"]["content"]
@@ -140,6 +196,8 @@ class OpenRouterClient:
                     }
                     
             except requests.exceptions.Timeout:
+                # The request may still be processed upstream, so its
+                # reservation is kept rather than refunded
                 error_msg = f"Request timeout (attempt {attempt + 1}/{self.max_retries})"
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
@@ -156,6 +214,7 @@ class OpenRouterClient:
                 }
                 
             except requests.exceptions.HTTPError as e:
+                self._release(reserved_tokens)
                 error_msg = f"HTTP error: {e.response.status_code} - {e.response.text}"
                 if attempt < self.max_retries - 1 and e.response.status_code in [429, 500, 502, 503, 504]:
                     # Retry on rate limit or server errors
@@ -173,6 +232,8 @@ class OpenRouterClient:
                 }
                 
             except Exception as e:
+                if not settled:
+                    self._release(reserved_tokens)
                 error_msg = f"Unexpected error: {str(e)}"
                 return {
                     "success": False,
@@ -196,6 +257,11 @@ class OpenRouterClient:
             }
         }
     
+    def _release(self, reserved_tokens: int) -> None:
+        """Refund a reservation for an attempt that consumed no tokens."""
+        if self.rate_limiter:
+            self.rate_limiter.settle(reserved_tokens, 0)
+    
     def __del__(self):
         """Close the session when the client is destroyed."""
         if hasattr(self, 'session'):
@@ -378,7 +378,10 @@ def main():
     
     # Initialize Client
     try:
-        client = OpenRouterClient()
+        client = OpenRouterClient(
+            requests_per_minute=config.RATE_LIMIT_RPM,
+            tokens_per_minute=config.RATE_LIMIT_TPM
+        )
         print("[OK] OpenRouter client initialized")
     except Exception as e:
         print(f"[ERROR] Failed to initialize client: {e}")
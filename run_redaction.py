@@ -12,18 +12,39 @@ PII Masking:
 - Phone numbers: Fully masked (e.g., [PHONE_1])
 - Person names: Masked (e.g., [PERSON_1])
 - Company names: Preserved (Flipkart, Puma, Myntra)
+
+Parallel mode (REDACTION_WORKERS > 1):
+- Files are redacted across a process pool
+- PII tokens are keyed hashes (e.g., [EMAIL_3f9a2c51d0e8]) so every worker
+  assigns the same token to the same value without shared state
+- The key comes from PII_TOKEN_KEY; without it files are redacted
+  sequentially so tokens stay reproducible between runs
+- Worker mappings are merged into a single pii_mapping.json
 """
 
 import os
 import re
+import hmac
 import json
 import csv
+import hashlib
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# Hex characters of the keyed hash kept in each PII token
+TOKEN_HASH_LENGTH = 12
+
 class PIIMasker:
     """Handles PII masking with consistent mapping"""
-    def __init__(self):
+    def __init__(self, token_key=None):
+        """
+        Args:
+            token_key: Secret bytes for keyed-hash tokens; None numbers tokens
+                in order of appearance (EMAIL_1, EMAIL_2, ...)
+        """
+        self.token_key = token_key
         self.email_map = {}  # Maps email -> EMAIL_N
         self.phone_map = {}  # Maps phone -> PHONE_N
         self.name_map = {}   # Maps name -> PERSON_N
@@ -37,12 +58,49 @@ class PIIMasker:
         
         # Company names to preserve
         self.preserve_companies = ['Flipkart', 'Puma', 'Myntra', 'PUMA']
+        
+        # Combined pattern, rebuilt if the name/company lists are changed
+        self._pattern_key = None
+        self._pii_pattern = None
+        self._company_pattern = None
+    
+    def _compile_patterns(self):
+        """Compile emails, phones and names into one alternation (emails win ties)"""
+        key = (tuple(self.common_names), tuple(self.preserve_companies))
+        if key == self._pattern_key:
+            return
+        
+        names = '|'.join(re.escape(name) for name in sorted(self.common_names, key=len, reverse=True))
+        email = r'\b(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'
+        phone = r'\b(?P<phone>\d{10})\b'
+        # A listed name that is not the start of an email username. The
+        # following capitalized word (First Last) is only looked at, not
+        # consumed, so a listed surname is matched again on its own
+        surname = r'(?P<surname>\s+[A-Z][a-z]+\b(?![\w.%+-]*@))?'
+        name = rf'\b(?P<name>{names})\b(?![\w.%+-]*@)(?={surname})' if names else r'(?!)'
+        self._pii_pattern = re.compile(f'{email}|{phone}|{name}')
+        
+        companies = '|'.join(re.escape(company) for company in self.preserve_companies)
+        self._company_pattern = re.compile(companies) if companies else None
+        self._pattern_key = key
+    
+    def _near_company(self, text, start, end):
+        """Check whether a company name appears within 20 characters of a span"""
+        if self._company_pattern is None:
+            return False
+        return self._company_pattern.search(text, max(0, start - 20), end + 20) is not None
+    
+    def _token(self, kind, value, mapping):
+        """Token for a value: keyed hash if a key is set, else the next counter"""
+        if self.token_key is not None:
+            digest = hmac.new(self.token_key, f"{kind}:{value}".encode('utf-8'), hashlib.sha256)
+            return f"{kind}_{digest.hexdigest()[:TOKEN_HASH_LENGTH]}"
+        return f"{kind}_{len(mapping) + 1}"
     
     def mask_email(self, email):
         """Mask email username but preserve domain"""
         if email not in self.email_map:
-            email_id = f"EMAIL_{len(self.email_map) + 1}"
-            self.email_map[email] = email_id
+            self.email_map[email] = self._token("EMAIL", email, self.email_map)
         
         # Extract domain
         if '@' in email:
@@ -53,54 +111,116 @@ class PIIMasker:
     def mask_phone(self, phone):
         """Mask phone number completely"""
         if phone not in self.phone_map:
-            phone_id = f"PHONE_{len(self.phone_map) + 1}"
-            self.phone_map[phone] = phone_id
+            self.phone_map[phone] = self._token("PHONE", phone, self.phone_map)
         return f"[{self.phone_map[phone]}]"
     
     def mask_name(self, name):
         """Mask person name"""
         if name not in self.name_map:
-            person_id = f"PERSON_{len(self.name_map) + 1}"
-            self.name_map[name] = person_id
+            self.name_map[name] = self._token("PERSON", name, self.name_map)
         return f"[{self.name_map[name]}]"
     
     def apply_pii_masking(self, text):
-        """Apply all PII masking to text"""
-        # Mask emails (preserve domain)
-        email_pattern = r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'
-        def replace_email(match):
-            return self.mask_email(match.group(1))
-        text = re.sub(email_pattern, replace_email, text)
+        """
+        Apply all PII masking to text.
         
-        # Mask phone numbers (10 digits)
-        phone_pattern = r'\b(\d{10})\b'
-        def replace_phone(match):
-            return self.mask_phone(match.group(1))
-        text = re.sub(phone_pattern, replace_phone, text)
+        Emails, phones and names are found in one scan of the text and the
+        output is assembled once. Names are then decided as the original
+        per-name replace loop did: listed names in list order, each occurrence
+        together with the capitalized word after it (First Last) unless that
+        word is already masked. An occurrence away from a company name masks
+        that value at every occurrence, including inside longer names.
+        """
+        self._compile_patterns()
+        spans = []
+        occurrences = {}
+        for match in self._pii_pattern.finditer(text):
+            kind = match.lastgroup
+            if kind == 'email':
+                spans.append((match.start(), match.end(), self.mask_email(match.group('email'))))
+            elif kind == 'phone':
+                spans.append((match.start(), match.end(), self.mask_phone(match.group('phone'))))
+            else:
+                occurrences.setdefault(match.group('name'), []).append(match)
         
-        # Mask person names (common names)
-        for name in self.common_names:
-            # Match full name patterns (First Last) or standalone names
-            name_pattern = rf'\b({name}(?:\s+[A-Z][a-z]+)?)\b'
-            matches = re.finditer(name_pattern, text)
-            for match in matches:
-                full_name = match.group(1)
-                # Don't mask if it's part of a company name
-                if not any(company in text[max(0, match.start()-20):match.end()+20] 
-                          for company in self.preserve_companies):
-                    text = text.replace(full_name, self.mask_name(full_name))
+        if occurrences:
+            spans.extend(self._name_spans(text, occurrences))
+            spans.sort()
+        if not spans:
+            return text
         
-        return text
+        pieces = []
+        position = 0
+        for start, end, replacement in spans:
+            pieces.append(text[position:start])
+            pieces.append(replacement)
+            position = end
+        pieces.append(text[position:])
+        return ''.join(pieces)
     
-    def save_mapping(self, output_path):
-        """Save PII mapping to JSON file"""
-        mapping = {
+    def _name_spans(self, text, occurrences):
+        """
+        Decide which name occurrences to mask.
+        
+        Args:
+            text: Text being masked
+            occurrences: Name matches grouped by listed name, in text order
+        
+        Returns:
+            List of (start, end, replacement) spans that do not overlap
+        """
+        masked = bytearray(len(text))  # 1 for each character already masked
+        spans = []
+        
+        def mask(start, value, replacement):
+            masked[start:start + len(value)] = b'\x01' * len(value)
+            spans.append((start, start + len(value), replacement))
+        
+        for name in dict.fromkeys(self.common_names):
+            # Values as seen when this name's turn comes: the surname counts
+            # unless an earlier listed name masked it
+            by_value = {}
+            values = []
+            for match in occurrences.get(name, ()):
+                value = name
+                if match.group('surname') is not None and not masked[match.end('surname') - 1]:
+                    value += match.group('surname')
+                values.append((match, value))
+                by_value.setdefault(value, []).append(match)
+            
+            for match, value in values:
+                if any(masked[match.start():match.start() + len(value)]):
+                    continue
+                if self._near_company(text, match.start(), match.start() + len(value)):
+                    continue
+                
+                # Mask the value everywhere; a bare name also inside longer values
+                replacement = self.mask_name(value)
+                targets = [m for m, _ in values] if value == name else by_value[value]
+                for other in targets:
+                    if not any(masked[other.start():other.start() + len(value)]):
+                        mask(other.start(), value, replacement)
+        
+        return spans
+    
+    def get_mapping(self):
+        """PII mapping as saved to pii_mapping.json"""
+        return {
             'emails': self.email_map,
             'phones': self.phone_map,
             'names': self.name_map
         }
+    
+    def merge_mapping(self, mapping):
+        """Merge a mapping produced by another masker with the same token key"""
+        self.email_map.update(mapping.get('emails', {}))
+        self.phone_map.update(mapping.get('phones', {}))
+        self.name_map.update(mapping.get('names', {}))
+    
+    def save_mapping(self, output_path):
+        """Save PII mapping to JSON file"""
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(mapping, f, indent=2, ensure_ascii=False)
+            json.dump(self.get_mapping(), f, indent=2, ensure_ascii=False)
 
 class EmailRedactor:
     def __init__(self, pii_masker=None):
@@ -291,9 +411,72 @@ class EmailRedactor:
         
         return result
 
-def process_extracted_files(input_base_dir, output_base_dir, enable_pii_masking=True):
+def load_token_key():
+    """PII token key from the PII_TOKEN_KEY environment variable, if set"""
+    key = os.environ.get('PII_TOKEN_KEY')
+    return key.encode('utf-8') if key else None
+
+def collect_input_files(input_path):
+    """Find extracted text files and CSV files in a single walk of the input tree"""
+    text_files = []
+    csv_files = []
+    for path in sorted(input_path.rglob('*')):
+        if path.name.endswith('_full_text.txt'):
+            text_files.append(path)
+        elif path.suffix == '.csv':
+            csv_files.append(path)
+    return text_files, csv_files
+
+def redact_file(source_file, output_file, redactor, pii_masker):
+    """
+    Redact one text file or mask one CSV file.
+    
+    Returns:
+        Status label for the log line
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    if source_file.suffix == '.csv':
+        if not pii_masker:
+            # Copy CSV file without modification
+            shutil.copy2(source_file, output_file)
+            return "Copied CSV"
+        
+        # Apply PII masking to CSV
+        with open(source_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(pii_masker.apply_pii_masking(content))
+        return "Masked CSV"
+    
+    # Read, redact and write text content
+    with open(source_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(redactor.redact_content(content))
+    return "Redacted"
+
+def _redact_file_worker(source_file, output_file, token_key, enable_pii_masking):
+    """
+    Redact one file in a worker process.
+    
+    Returns:
+        Tuple of (status label, PII mapping or None)
+    """
+    pii_masker = PIIMasker(token_key) if enable_pii_masking else None
+    status = redact_file(Path(source_file), Path(output_file), EmailRedactor(pii_masker), pii_masker)
+    return status, pii_masker.get_mapping() if pii_masker else None
+
+def process_extracted_files(input_base_dir, output_base_dir, enable_pii_masking=True, workers=1):
     """
     Process all extracted files and create redacted versions with PII masking
+    
+    Args:
+        input_base_dir: Folder with extracted *_full_text.txt and CSV files
+        output_base_dir: Folder for redacted files and pii_mapping.json
+        enable_pii_masking: Mask PII in text and CSV files
+        workers: Worker processes; >1 redacts files in parallel with keyed-hash
+            tokens and requires PII_TOKEN_KEY when masking (else runs sequentially)
     """
     input_path = Path(input_base_dir)
     output_path = Path(output_base_dir)
@@ -301,59 +484,61 @@ def process_extracted_files(input_base_dir, output_base_dir, enable_pii_masking=
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Initialize PII masker
-    pii_masker = PIIMasker() if enable_pii_masking else None
-    redactor = EmailRedactor(pii_masker)
+    # Text files first, then CSV files
+    text_files, csv_files = collect_input_files(input_path)
+    files = text_files + csv_files
     processed_count = 0
     
-    # Find all text files in extracted directory
-    for txt_file in input_path.rglob('*_full_text.txt'):
-        try:
-            # Read original content
-            with open(txt_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Redact content
-            redacted_content = redactor.redact_content(content)
-            
-            # Create corresponding output path
-            relative_path = txt_file.relative_to(input_path)
-            output_file = output_path / relative_path
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write redacted content
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(redacted_content)
-            
-            processed_count += 1
-            print(f"[OK] Redacted: {relative_path}")
-            
-        except Exception as e:
-            print(f"[ERROR] Error processing {txt_file}: {e}")
-    
-    # Process CSV files with PII masking
-    for csv_file in input_path.rglob('*.csv'):
-        try:
-            relative_path = csv_file.relative_to(input_path)
-            output_file = output_path / relative_path
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if pii_masker:
-                # Apply PII masking to CSV
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                masked_content = pii_masker.apply_pii_masking(content)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(masked_content)
-                print(f"[OK] Masked CSV: {relative_path}")
-            else:
-                # Copy CSV file without modification
-                import shutil
-                shutil.copy2(csv_file, output_file)
-                print(f"[OK] Copied CSV: {relative_path}")
+    token_key = load_token_key()
+    if workers > 1 and enable_pii_masking and token_key is None:
+        # Random per-run keys would change every token between runs
+        print("[WARN] PII_TOKEN_KEY not set; redacting sequentially")
+        workers = 1
+    
+    if workers > 1 and len(files) > 1:
+        # Collects the per-file mappings from the workers
+        pii_masker = PIIMasker(token_key) if enable_pii_masking else None
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            futures = [
+                executor.submit(
+                    _redact_file_worker,
+                    str(source_file),
+                    str(output_path / source_file.relative_to(input_path)),
+                    token_key,
+                    enable_pii_masking
+                )
+                for source_file in files
+            ]
+            for source_file, future in zip(files, futures):
+                relative_path = source_file.relative_to(input_path)
+                try:
+                    status, mapping = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Error processing {source_file}: {e}")
+                    continue
+                
+                if mapping:
+                    pii_masker.merge_mapping(mapping)
+                if status == "Redacted":
+                    processed_count += 1
+                print(f"[OK] {status}: {relative_path}")
+    else:
+        # Initialize PII masker
+        pii_masker = PIIMasker(token_key) if enable_pii_masking else None
+        redactor = EmailRedactor(pii_masker)
+        
+        for source_file in files:
+            relative_path = source_file.relative_to(input_path)
+            try:
+                status = redact_file(source_file, output_path / relative_path, redactor, pii_masker)
+            except Exception as e:
+                print(f"[ERROR] Error processing {source_file}: {e}")
+                continue
             
-        except Exception as e:
-            print(f"[ERROR] Error processing CSV {csv_file}: {e}")
+            if status == "Redacted":
+                processed_count += 1
+            print(f"[OK] {status}: {relative_path}")
     
     # Save PII mapping if masking was enabled
     if pii_masker:
@@ -367,16 +552,18 @@ if __name__ == "__main__":
     # Define paths
     extracted_dir = r"c:\Users\Admin\Desktop\data\data_extraction\Extracted_files"
     redacted_dir = r"c:\Users\Admin\Desktop\data\data_extraction\Redacted_and_PII_Files"
+    workers = int(os.environ.get('REDACTION_WORKERS', 1))
     
     print("=" * 60)
     print("EMAIL CONTENT REDACTION WITH PII MASKING")
     print("=" * 60)
     print(f"Input:  {extracted_dir}")
     print(f"Output: {redacted_dir}")
+    print(f"Workers: {workers}")
     print("=" * 60)
     
     # Process files
-    count = process_extracted_files(extracted_dir, redacted_dir)
+    count = process_extracted_files(extracted_dir, redacted_dir, workers=workers)
     
     print("=" * 60)
     print(f"[SUCCESS] Successfully redacted {count} files")
@@ -0,0 +1,227 @@
+"""
+Size-bounded on-disk JSON cache keyed by content hashes.
+
+Entries are stored one JSON file per key and evicted least-recently-used
+first once the cache directory grows past its size limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's bytes.
+
+    Args:
+        path: Path to the file
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_payload(payload: Any) -> str:
+    """
+    Compute a canonical SHA-256 hex digest of a JSON-serializable payload.
+
+    Args:
+        payload: Value to hash (dict keys are sorted before hashing)
+
+    Returns:
+        Hex digest string
+    """
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    JSON-file cache with size-based LRU eviction and optional TTL.
+
+    Safe to share between threads; several processes may also use the same
+    directory since writes are atomic and eviction tolerates missing files.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_bytes: int,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_bytes: Evict oldest entries once the cache exceeds this size
+            ttl_seconds: Treat entries older than this as missing (None = no expiry)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._size_bytes: Optional[int] = None
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the file holding an entry."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            self._discard(path)
+            return None
+
+        if self.ttl_seconds is not None:
+            if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+                self._discard(path)
+                return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store an entry, evicting old entries if the cache is over its limit.
+
+        Args:
+            key: Cache key (hex digest)
+            value: JSON-serializable value
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = json.dumps(
+            {"created_at": time.time(), "value": value},
+            ensure_ascii=False
+        ).encode("utf-8")
+
+        # Size of the entry being overwritten, so the running total stays exact
+        try:
+            replaced_size = path.stat().st_size
+        except OSError:
+            replaced_size = 0
+
+        try:
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
+            return
+
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = self._scan_size()
+            else:
+                self._size_bytes += len(data) - replaced_size
+
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.json"):
+                self._remove(path)
+            self._size_bytes = 0
+
+    def _scan_size(self) -> int:
+        """Total size in bytes of all entries on disk."""
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until under 90% of the limit."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_size_bytes * 0.9)
+        removed = 0
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+
+        self._size_bytes = total
+        logger.info(f"Cache eviction removed {removed} entries from {self.cache_dir}")
+
+    def _discard(self, path: Path) -> None:
+        """Delete an entry outside eviction and subtract it from the running total."""
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            if self._size_bytes is not None:
+                self._size_bytes -= size
+
+    def _remove(self, path: Path) -> None:
+        """Delete an entry file, ignoring races with other processes."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,154 @@
+"""Single-pass matching of many literal phrases.
+
+All phrases are compiled into one regular expression whose alternatives are
+factored through a character trie, so a text is scanned once and each
+position is tested against shared prefixes instead of against every phrase
+in turn. Optionally, whitespace inside a phrase matches any run of
+whitespace, which removes the need to normalize text before matching.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Set
+
+
+def normalize_phrase(text: str) -> str:
+    """
+    Lowercase text and collapse whitespace runs to single spaces.
+
+    Args:
+        text: Phrase or matched text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(text.lower().split())
+
+
+def _trie_pattern(node: Dict[str, dict], flexible_whitespace: bool = True) -> str:
+    """Regex for a trie node; '' marks the end of a phrase."""
+    branches = [
+        (r"\s+" if char == " " and flexible_whitespace else re.escape(char))
+        + _trie_pattern(child, flexible_whitespace)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if "" in node:
+        # Greedy optional group: prefer the longer phrase
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class PhraseMatcher:
+    """
+    Case-insensitive matcher for a fixed set of phrases.
+
+    Phrases may match anywhere in the text; prefixes match only at the
+    start of the text (after leading whitespace, if flexible). The regex is compiled
+    case-sensitively over lowercase phrases and run on lowercased text,
+    which keeps the regex engine's first-character scan (IGNORECASE
+    disables it).
+    """
+
+    def __init__(
+        self,
+        phrases: Iterable[str],
+        prefixes: Iterable[str] = (),
+        flexible_whitespace: bool = True
+    ):
+        """
+        Initialize phrase matcher.
+
+        Args:
+            phrases: Phrases to find anywhere in a text
+            prefixes: Phrases that only count at the start of a text
+            flexible_whitespace: Let a space in a phrase match any whitespace
+                run (False matches phrases exactly, like a substring check)
+        """
+        self.flexible_whitespace = flexible_whitespace
+        self._normalize = normalize_phrase if flexible_whitespace else str.lower
+        self.phrases: Set[str] = {self._normalize(p) for p in phrases if p.strip()}
+        self.prefixes: Set[str] = {self._normalize(p) for p in prefixes if p.strip()}
+
+        # A match is the longest phrase at its position; shorter phrases it
+        # starts with are found at the same time
+        known = self.phrases | self.prefixes
+        self._contained: Dict[str, Set[str]] = {
+            phrase: {p for p in known if phrase.startswith(p)} for phrase in known
+        }
+
+        alternatives = []
+        if self.prefixes:
+            anchor = r"\A\s*" if flexible_whitespace else r"\A"
+            alternatives.append(anchor + "(?:" + self._compile_trie(self.prefixes) + ")")
+        if self.phrases:
+            alternatives.append(self._compile_trie(self.phrases))
+
+        # Pattern over lowercase text (use case-insensitive matching elsewhere)
+        self.pattern = "|".join(alternatives) or r"(?!)"
+        self.regex = re.compile(self.pattern)
+
+    def _compile_trie(self, phrases: Set[str]) -> str:
+        """Build the trie-factored alternation for a phrase set."""
+        trie: Dict[str, dict] = {}
+        for phrase in phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return _trie_pattern(trie, self.flexible_whitespace)
+
+    def search(self, text: str) -> Optional[str]:
+        """
+        Find the first phrase in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            The normalized phrase found, or None
+        """
+        if not text:
+            return None
+        match = self.regex.search(text.lower())
+        return self._normalize(match.group(0)) if match else None
+
+    def contains_any(self, text: str) -> bool:
+        """
+        Check whether text contains any phrase.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True if a phrase (or a leading prefix) is found
+        """
+        return bool(text) and self.regex.search(text.lower()) is not None
+
+    def distinct_matches(self, text: str, limit: Optional[int] = None) -> Set[str]:
+        """
+        Collect the distinct phrases found in text, including overlapping ones.
+
+        Args:
+            text: Text to scan
+            limit: Stop scanning once this many distinct phrases are found
+
+        Returns:
+            Set of normalized phrases found
+        """
+        found: Set[str] = set()
+        if not text:
+            return found
+        lowered = text.lower()
+        search = self.regex.search
+        match = search(lowered)
+        while match is not None:
+            found |= self._contained[self._normalize(match.group(0))]
+            if limit is not None and len(found) >= limit:
+                break
+            # Restart just after the match start so overlapping phrases count
+            match = search(lowered, match.start() + 1)
+        return found
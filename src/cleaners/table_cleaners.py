@@ -1,11 +1,28 @@
 """Table content cleaning."""
 
+import numpy as np
 import pandas as pd
 import logging
 from typing import Optional
 
+from src.cleaners.phrase_matcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
+DISCLAIMER_KEYWORDS = [
+    "confidential",
+    "disclaimer",
+    "unauthorized",
+    "intended recipient",
+    "caution",
+]
+
+# Disclaimer keywords anywhere in a cell (case-insensitive)
+CELL_NOISE_MATCHER = PhraseMatcher(DISCLAIMER_KEYWORDS, flexible_whitespace=False)
+
+# Gmail placeholders at the very start of a cell (case-sensitive)
+GMAIL_CELL_PREFIXES = ("[image:", "[cid:")
+
 class TableCleaner:
     """Clean tables by removing disclaimer rows and empty content."""
     
@@ -53,16 +70,7 @@ class TableCleaner:
         if not isinstance(text, str):
             return False
         
-        text_lower = text.lower()
-        disclaimer_keywords = [
-            "confidential",
-            "disclaimer",
-            "unauthorized",
-            "intended recipient",
-            "caution",
-        ]
-        
-        return any(keyword in text_lower for keyword in disclaimer_keywords)
+        return CELL_NOISE_MATCHER.contains_any(text)
     
     def _clean_cell(self, val):
         """Clean a single table cell."""
@@ -70,12 +78,8 @@ class TableCleaner:
             return ""
         
         if isinstance(val, str):
-            # Check if cell contains disclaimer text
-            if self._looks_like_disclaimer(val):
-                return ""
-            
-            # Remove Gmail noise
-            if val.startswith("[image:") or val.startswith("[cid:"):
+            # Disclaimer text (one scan for all keywords) or Gmail noise
+            if CELL_NOISE_MATCHER.contains_any(val) or val.startswith(GMAIL_CELL_PREFIXES):
                 return ""
             
             # Clean whitespace
@@ -83,6 +87,50 @@ class TableCleaner:
         
         return val
     
+    def _clean_text_cells(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean all cells of text columns at once; equivalent to _clean_cell per cell.
+        
+        The cells are flattened into one Series and the string cells are
+        selected, so stripping and the disclaimer/Gmail-noise match each run
+        as a single string-accessor pass. Only non-string, non-null cells
+        (rare in extracted tables) fall back to the per-cell emptiness check.
+        
+        Args:
+            frame: Object/string columns of a table
+            
+        Returns:
+            Cleaned frame with the same shape, index and columns
+        """
+        values = pd.Series(frame.to_numpy(dtype=object).ravel(), dtype=object)
+        
+        is_na = values.isna().to_numpy()
+        is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+        blank = is_na.copy()
+        cleaned = values.copy()
+        
+        if is_str.any():
+            # The .str accessor only accepts Series that hold strings
+            texts = values[is_str].astype(object)
+            stripped = texts.str.strip()
+            blank[is_str] = (
+                stripped.eq("")
+                | texts.str.lower().str.contains(CELL_NOISE_MATCHER.pattern, regex=True)
+                | texts.str.startswith(GMAIL_CELL_PREFIXES)
+            ).to_numpy(dtype=bool)
+            cleaned[is_str] = stripped
+        
+        others = ~is_str & ~is_na
+        if others.any():
+            blank[others] = values[others].map(self._is_empty_value).to_numpy(dtype=bool)
+        
+        cleaned = cleaned.mask(blank, "")
+        return pd.DataFrame(
+            cleaned.to_numpy().reshape(frame.shape),
+            index=frame.index,
+            columns=frame.columns
+        )
+    
     def clean(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
         Clean a table DataFrame.
@@ -98,24 +146,23 @@ class TableCleaner:
         if df.empty:
             return None
         
-        # Create a copy to avoid modifying original
-        cleaned = df.copy()
-        
-        # Clean all cells
-        for col in cleaned.columns:
-            cleaned[col] = cleaned[col].apply(self._clean_cell)
-        
-        # Remove rows that are entirely empty
-        cleaned = cleaned[~cleaned.apply(
-            lambda row: all(self._is_empty_value(v) for v in row),
-            axis=1
-        )]
+        # Text columns are cleaned in one pass; other columns only lose nulls
+        cleaned = df.astype(object)
+        is_text = [
+            pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            for dtype in df.dtypes
+        ]
+        if any(is_text):
+            cleaned.iloc[:, is_text] = self._clean_text_cells(df.iloc[:, is_text])
+        other = [not flag for flag in is_text]
+        if any(other):
+            columns = df.iloc[:, other]
+            cleaned.iloc[:, other] = columns.astype(object).mask(columns.isna(), "")
+        cleaned = cleaned.infer_objects()
         
-        # Remove columns that are entirely empty
-        cleaned = cleaned.loc[:, ~cleaned.apply(
-            lambda col: all(self._is_empty_value(v) for v in col),
-            axis=0
-        )]
+        # Every empty cell is "" after cleaning; drop empty rows and columns in one pass
+        empty = cleaned.eq("").to_numpy(dtype=bool)
+        cleaned = cleaned.iloc[~empty.all(axis=1), ~empty.all(axis=0)]
         
         # If table is now empty, return None
         if cleaned.empty:
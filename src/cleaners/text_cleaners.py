@@ -1,9 +1,11 @@
 """Text content cleaning filters."""
 
 import re
-from typing import List
+from typing import Iterable, Iterator, List
 import logging
 
+from src.cleaners.phrase_matcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +42,13 @@ GMAIL_NOISE_PATTERNS = [
 
 SEPARATOR_LINE_RE = re.compile(r"^\s*-{5,}\s*$")
 
+# Compiled once: every line is scanned a single time for all phrases
+DISCLAIMER_MATCHER = PhraseMatcher(DISCLAIMER_KEY_PHRASES, flexible_whitespace=False)
+GMAIL_NOISE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in GMAIL_NOISE_PATTERNS),
+    re.IGNORECASE
+)
+
 
 class DisclaimerFilter:
     """Filter to remove email disclaimers and caution notices."""
@@ -58,37 +67,29 @@ class DisclaimerFilter:
         Returns:
             True if text appears to be a disclaimer
         """
-        text_lower = text.lower()
-        
-        # Check for disclaimer key phrases
-        phrase_count = sum(
-            1 for phrase in DISCLAIMER_KEY_PHRASES
-            if phrase in text_lower
-        )
+        # One scan finds up to two distinct key phrases
+        phrases = DISCLAIMER_MATCHER.distinct_matches(text, limit=2)
         
         # If multiple phrases found, likely a disclaimer
-        if phrase_count >= 2:
+        if len(phrases) >= 2:
             return True
         
         # Check for very long single-paragraph blocks (common in disclaimers)
-        if len(text) > 500 and "\n\n" not in text:
-            if any(phrase in text_lower for phrase in DISCLAIMER_KEY_PHRASES):
-                return True
+        if phrases and len(text) > 500 and "\n\n" not in text:
+            return True
         
         return False
     
-    def clean(self, text: str) -> str:
+    def filter_lines(self, lines: Iterable[str]) -> Iterator[str]:
         """
-        Remove disclaimer blocks from text.
+        Drop disclaimer blocks from a stream of lines.
         
         Args:
-            text: Input text
+            lines: Input lines
             
-        Returns:
-            Text with disclaimers removed
+        Yields:
+            Lines outside disclaimer blocks
         """
-        lines = text.split("\n")
-        cleaned_lines = []
         in_disclaimer = False
         
         for line in lines:
@@ -104,9 +105,19 @@ class DisclaimerFilter:
                     in_disclaimer = False
                 continue
             
-            cleaned_lines.append(line)
+            yield line
+    
+    def clean(self, text: str) -> str:
+        """
+        Remove disclaimer blocks from text.
         
-        return "\n".join(cleaned_lines)
+        Args:
+            text: Input text
+            
+        Returns:
+            Text with disclaimers removed
+        """
+        return "\n".join(self.filter_lines(text.split("\n")))
 
 
 class EmailHeaderFilter:
@@ -116,6 +127,20 @@ class EmailHeaderFilter:
     def name(self) -> str:
         return "Email Header Filter"
     
+    def filter_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Drop email header lines (but keep Subject) from a stream of lines.
+        
+        Args:
+            lines: Input lines
+            
+        Yields:
+            Non-header lines
+        """
+        for line in lines:
+            if not line.startswith(EMAIL_HEADER_PREFIXES):
+                yield line
+    
     def clean(self, text: str) -> str:
         """
         Remove email headers except Subject.
@@ -126,29 +151,34 @@ class EmailHeaderFilter:
         Returns:
             Text with headers removed
         """
-        lines = text.split("\n")
-        cleaned_lines = []
-        
-        for line in lines:
-            # Skip email headers (but keep Subject)
-            if line.startswith(EMAIL_HEADER_PREFIXES):
-                continue
-            
-            cleaned_lines.append(line)
-        
-        return "\n".join(cleaned_lines)
+        return "\n".join(self.filter_lines(text.split("\n")))
 
 
 class GmailNoiseFilter:
     """Filter to remove Gmail-specific noise (image placeholders, etc.)."""
     
     def __init__(self):
-        self.patterns = [re.compile(p, re.IGNORECASE) for p in GMAIL_NOISE_PATTERNS]
+        self.pattern = GMAIL_NOISE_RE
     
     @property
     def name(self) -> str:
         return "Gmail Noise Filter"
     
+    def filter_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Drop Gmail noise lines from a stream of lines.
+        
+        Args:
+            lines: Input lines
+            
+        Yields:
+            Lines that match no noise pattern
+        """
+        match = self.pattern.match
+        for line in lines:
+            if not match(line):
+                yield line
+    
     def clean(self, text: str) -> str:
         """
         Remove Gmail noise patterns.
@@ -159,21 +189,17 @@ class GmailNoiseFilter:
         Returns:
             Text with Gmail noise removed
         """
-        lines = text.split("\n")
-        cleaned_lines = []
-        
-        for line in lines:
-            # Check if line matches any noise pattern
-            if any(pattern.match(line) for pattern in self.patterns):
-                continue
-            
-            cleaned_lines.append(line)
-        
-        return "\n".join(cleaned_lines)
+        return "\n".join(self.filter_lines(text.split("\n")))
 
 
 class ContentCleaner:
-    """Main content cleaner that applies all filters."""
+    """
+    Main content cleaner that applies all filters.
+    
+    The filters are chained as line generators, so the text is split once,
+    every line flows through all filters in a single pass, and the output
+    is joined once at the end.
+    """
     
     def __init__(self):
         """Initialize with all available filters."""
@@ -193,13 +219,51 @@ class ContentCleaner:
         Returns:
             Cleaned text
         """
-        cleaned = text
+        lines: Iterable[str] = text.split("\n")
         
         for filter_obj in self.filters:
-            cleaned = filter_obj.clean(cleaned)
-            logger.debug(f"Applied {filter_obj.name}")
+            lines = filter_obj.filter_lines(lines)
+            logger.debug(f"Chained {filter_obj.name}")
+        
+        return "\n".join(self._tidy_lines(lines))
+    
+    def _tidy_lines(self, lines: Iterable[str]) -> List[str]:
+        """
+        Collapse blank-line runs and trim the edges of the cleaned lines.
+        
+        Same result as replacing three or more newlines with two and
+        stripping the joined text, without building intermediate strings.
+        
+        Args:
+            lines: Filtered lines
+            
+        Returns:
+            Lines ready to be joined
+        """
+        tidy: List[str] = []
+        previous_empty = False
+        
+        for line in lines:
+            if not tidy:
+                # Leading whitespace of the text is stripped
+                line = line.lstrip()
+                if not line:
+                    continue
+            
+            # Keep at most one empty line in a row
+            if not line:
+                if previous_empty:
+                    continue
+                previous_empty = True
+            else:
+                previous_empty = False
+            
+            tidy.append(line)
         
-        # Final cleanup: remove excessive blank lines
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        # Trailing whitespace of the text is stripped
+        while tidy and not tidy[-1].strip():
+            tidy.pop()
+        if tidy:
+            tidy[-1] = tidy[-1].rstrip()
         
-        return cleaned.strip()
+        return tidy
@@ -79,6 +79,58 @@ class ExtractionConfig(BaseSettings):
         description="Tesseract OCR language"
     )
     
+    hybrid_ocr: bool = Field(
+        default=True,
+        description="OCR only image-based pages and merge with native text page by page"
+    )
+    
+    ocr_page_min_chars: int = Field(
+        default=50,
+        ge=0,
+        description="Pages with fewer native text characters are treated as image-based"
+    )
+    
+    ocr_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Concurrent tesseract jobs when OCR'ing multiple pages"
+    )
+    
+    page_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for page-sharded pdfplumber extraction (1 disables)"
+    )
+    
+    parallel_page_threshold: int = Field(
+        default=8,
+        ge=1,
+        description="Minimum page count before page-sharded extraction is used"
+    )
+    
+    batch_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for concurrent multi-PDF extraction (1 disables)"
+    )
+    
+    # ===== Extraction Cache Configuration =====
+    extraction_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse raw extraction output for PDFs already seen with the same settings"
+    )
+    
+    extraction_cache_dir: Path = Field(
+        default=Path(".cache/extraction"),
+        description="Directory for the content-addressed extraction cache"
+    )
+    
+    extraction_cache_max_mb: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum extraction cache size in MB before LRU eviction"
+    )
+    
     # =====  LLM Configuration (OpenRouter) =====
     llm_model: str = Field(
         default="anthropic/claude-3.5-sonnet",
@@ -98,12 +150,69 @@ class ExtractionConfig(BaseSettings):
         description="Maximum tokens for LLM response"
     )
     
+    llm_input_token_budget: int = Field(
+        default=4000,
+        ge=500,
+        description="Maximum email body tokens sent to the LLM (most relevant blocks are kept)"
+    )
+    
+    llm_chunked_extraction: bool = Field(
+        default=False,
+        description="Extract bodies over the token budget in overlapping chunks and merge the schemes"
+    )
+    
+    llm_chunk_overlap_tokens: int = Field(
+        default=200,
+        ge=0,
+        description="Tokens of trailing context repeated at the start of the next chunk"
+    )
+    
     llm_timeout: int = Field(
         default=120,
         gt=0,
         description="LLM API call timeout in seconds"
     )
     
+    llm_max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum in-flight LLM requests when extracting schemes for many emails"
+    )
+    
+    llm_pool_size: int = Field(
+        default=10,
+        ge=1,
+        description="Keep-alive HTTP connections held open to the LLM API"
+    )
+    
+    # ===== LLM Response Cache Configuration =====
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Cache deterministic (temperature 0) LLM responses on disk"
+    )
+    
+    llm_cache_bypass: bool = Field(
+        default=False,
+        description="Ignore cached LLM responses (fresh responses are still stored)"
+    )
+    
+    llm_cache_dir: Path = Field(
+        default=Path(".cache/llm"),
+        description="Directory for cached LLM responses"
+    )
+    
+    llm_cache_max_mb: int = Field(
+        default=256,
+        gt=0,
+        description="Maximum LLM response cache size in MB before eviction"
+    )
+    
+    llm_cache_ttl_hours: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Expire cached LLM responses after this many hours (None = never)"
+    )
+    
     # ===== DSPy Configuration =====
     enable_chain_of_thought: bool = Field(
         default=True,
@@ -182,6 +291,54 @@ class ExtractionConfig(BaseSettings):
         ge=0.0,
         description="Cost per 1 million output tokens in USD"
     )
+    
+    # ===== Structured Output =====
+    llm_structured_output: bool = Field(
+        default=False,
+        description="Request JSON output constrained by the SchemeHeader schema (response_format)"
+    )
+    
+    # ===== Field Repair =====
+    llm_field_repair: bool = Field(
+        default=False,
+        description="Re-ask only missing/invalid dates, financial terms or vendor with narrow signatures (up to three extra LLM calls per email with gaps: dates, financials, vendor)"
+    )
+    
+    llm_repair_token_budget: int = Field(
+        default=1200,
+        ge=200,
+        description="Token budget of the trimmed context sent to field repair calls"
+    )
+    
+    # ===== Cascade Routing =====
+    llm_cascade_enabled: bool = Field(
+        default=False,
+        description="Try llm_cascade_small_model first and escalate to openrouter_model only when needed"
+    )
+    
+    llm_cascade_small_model: str = Field(
+        default="qwen/qwen3-30b-a3b-instruct-2507",
+        description="Small, fast OpenRouter model tried first in cascade mode"
+    )
+    
+    llm_cascade_small_input_cost_per_1m: float = Field(
+        default=0.08,
+        ge=0.0,
+        description="Small model cost per 1 million input tokens in USD"
+    )
+    
+    llm_cascade_small_output_cost_per_1m: float = Field(
+        default=0.33,
+        ge=0.0,
+        description="Small model cost per 1 million output tokens in USD"
+    )
+    
+    llm_cascade_min_confidence: float = Field(
+        default=0.8,
+        ge=0.0,
+        le=1.0,
+        description="Escalate small-model results whose reported average scheme confidence is below this"
+    )
 
     
     # ===== Retry Configuration =====
@@ -197,12 +354,120 @@ class ExtractionConfig(BaseSettings):
         description="Initial delay between retries in seconds"
     )
     
+    max_retry_delay: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Upper bound on a single LLM retry backoff delay in seconds"
+    )
+    
+    llm_circuit_breaker_enabled: bool = Field(
+        default=True,
+        description="Pause LLM dispatch when the upstream error rate spikes"
+    )
+    
+    llm_circuit_failure_rate: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Failure rate over the window that opens the circuit"
+    )
+    
+    llm_circuit_min_calls: int = Field(
+        default=5,
+        ge=1,
+        description="Minimum calls in the window before the failure rate is evaluated"
+    )
+    
+    llm_circuit_window_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Sliding window for circuit breaker failure rate"
+    )
+    
+    llm_circuit_cooldown_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds to pause dispatch after the circuit opens"
+    )
+    
+    # ===== Hedged Request Configuration =====
+    llm_hedging_enabled: bool = Field(
+        default=False,
+        description="Send a duplicate LLM request when a call outlives the latency percentile"
+    )
+    
+    llm_hedge_percentile: float = Field(
+        default=95.0,
+        ge=50.0,
+        lt=100.0,
+        description="Latency percentile after which a call is hedged"
+    )
+    
+    llm_hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Completed calls to observe before hedging starts"
+    )
+    
+    # ===== Rate Limit Configuration =====
+    llm_rate_limit_rpm: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Requests per minute shared by all processes using the API key (None = unlimited)"
+    )
+    
+    llm_rate_limit_tpm: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Tokens per minute shared by all processes using the API key (None = unlimited)"
+    )
+    
     # ===== Output Configuration =====
     scheme_header_filename: str = Field(
         default="scheme_header.json",
         description="Output filename for scheme headers"
     )
     
+    # ===== Scheme Gate =====
+    scheme_gate_enabled: bool = Field(
+        default=True,
+        description="Skip the LLM call for mails with no scheme signals (keywords, dates, amounts, tables)"
+    )
+    
+    scheme_gate_threshold: float = Field(
+        default=2.0,
+        description="Minimum gate score for a mail to be sent to the LLM"
+    )
+    
+    scheme_gate_audit_log: Path = Field(
+        default=Path("logs/gate_decisions.jsonl"),
+        description="JSONL audit log of gate decisions"
+    )
+    
+    # ===== Near-Duplicate Detection =====
+    near_duplicate_detection: bool = Field(
+        default=True,
+        description="Reuse schemes for emails that are near-duplicates of one already in the batch"
+    )
+    
+    near_duplicate_threshold: float = Field(
+        default=0.9,
+        gt=0.0,
+        le=1.0,
+        description="Minimum estimated Jaccard similarity (text and numbers) to treat emails as duplicates"
+    )
+    
+    # ===== Incremental Run Configuration =====
+    incremental_runs: bool = Field(
+        default=True,
+        description="Skip inputs already extracted / sent to the LLM (tracked in the run manifest)"
+    )
+    
+    manifest_filename: str = Field(
+        default="run_manifest.jsonl",
+        description="Run manifest filename (stored in output_dir)"
+    )
+    
     @field_validator('input_dir', 'output_dir', 'final_output_dir', 'logs_dir', 'cot_log_dir', 'llm_log_dir')
     @classmethod
     def ensure_directory_exists(cls, v: Path) -> Path:
@@ -222,6 +487,11 @@ class ExtractionConfig(BaseSettings):
     def scheme_header_path(self) -> Path:
         """Full path to the scheme header CSV file."""
         return self.final_output_dir / self.scheme_header_filename
+    
+    @property
+    def manifest_path(self) -> Path:
+        """Full path to the incremental run manifest."""
+        return self.output_dir / self.manifest_filename
 
 
 # Global config instance
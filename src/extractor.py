@@ -20,6 +20,7 @@ output/
 
 import io
 import json
+import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -37,6 +38,13 @@ try:
 except ImportError:
     from logger import setup_logging
 
+try:
+    from src.cleaners.phrase_matcher import PhraseMatcher
+except ImportError:
+    # Run as a script from src/: make the package importable
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from src.cleaners.phrase_matcher import PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 # try to import camelot (optional)
@@ -103,26 +111,20 @@ EMAIL_HEADER_PREFIXES = (
 SEPARATOR_LINE_RE = re.compile(r"^\s*-{5,}\s*$")
 FORWARDED_MSG_RE = re.compile(r"Begin forwarded message:?", re.IGNORECASE)
 
+# All key phrases (and the disclaimer:/caution: openers) in one matcher;
+# whitespace-tolerant, so text is not re-normalized per call
+DISCLAIMER_MATCHER = PhraseMatcher(DISCLAIMER_KEY_PHRASES, prefixes=("disclaimer:", "caution:"))
+EMAIL_NOISE_LINE_RE = re.compile("|".join(f"(?:{pat})" for pat in EMAIL_NOISE_LINE_PATTERNS))
+
 
 
 def looks_like_disclaimer(text: str) -> bool:
     """
     Heuristic: if text looks like a disclaimer / caution block.
     """
-    if not text:
-        return False
-
-    low = " ".join(text.lower().split())
-    # Paragraphs starting with "disclaimer:" or "caution:" are almost always disclaimers
-    if low.startswith("disclaimer:") or low.startswith("caution:"):
-        return True
-
-    # If any strong key phrase appears, treat as disclaimer
-    for phrase in DISCLAIMER_KEY_PHRASES:
-        if phrase in low:
-            return True
-
-    return False
+    # Paragraphs starting with "disclaimer:" or "caution:" are almost always
+    # disclaimers, as is any text containing a strong key phrase
+    return DISCLAIMER_MATCHER.contains_any(text)
 
 
 def clean_email_text(text: str) -> str:
@@ -180,7 +182,7 @@ def clean_email_text(text: str) -> str:
             continue
 
         # Drop gmail noise like [Quoted text hidden], Gmail URLs, etc.
-        if any(re.search(pat, stripped) for pat in EMAIL_NOISE_LINE_PATTERNS):
+        if EMAIL_NOISE_LINE_RE.search(stripped):
             continue
 
         # Drop pure "1/2", "2/2", etc.
@@ -254,7 +256,7 @@ def clean_email_table(df: pd.DataFrame) -> pd.DataFrame | None:
             txt = val
 
             # Remove Gmail noise like URLs, [Quoted text hidden], etc.
-            if any(re.search(pat, txt) for pat in EMAIL_NOISE_LINE_PATTERNS):
+            if EMAIL_NOISE_LINE_RE.search(txt):
                 return ""
 
             # Remove disclaimer / caution text
@@ -284,24 +286,68 @@ def clean_email_table(df: pd.DataFrame) -> pd.DataFrame | None:
 #  EXTRACTION
 # ==============================
 
-def extract_text_with_pdfplumber(pdf_path: str) -> str:
-    full_text = []
+def extract_page_texts_with_pdfplumber(pdf_path: str) -> list[str]:
+    """
+    Extract the text of every page with pdfplumber (one entry per page).
+    """
+    page_texts: list[str] = []
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages, start=1):
+            for page in pdf.pages:
                 try:
                     txt = page.extract_text()
                 except Exception:
                     txt = None
-                if not txt:
-                    txt = ""
-                page_header = f"\n\n--- PAGE {i} ---\n\n"
-                full_text.append(page_header + txt)
-        return "\n".join(full_text).strip()
-        return "\n".join(full_text).strip()
+                page_texts.append(txt or "")
     except Exception as e:
         logger.error(f"[pdfplumber] failed for {pdf_path}: {e}")
-        return ""
+    return page_texts
+
+
+def join_page_texts(page_texts: list[str], ocr_pages: set[int] = frozenset()) -> str:
+    """
+    Join per-page text with page headers (OCR'd pages get an OCR header).
+    """
+    parts = []
+    for i, txt in enumerate(page_texts, start=1):
+        if i in ocr_pages:
+            header = f"\n\n--- OCR PAGE {i} ---\n\n"
+        else:
+            header = f"\n\n--- PAGE {i} ---\n\n"
+        parts.append(header + txt)
+    return "\n".join(parts).strip()
+
+
+def extract_text_with_pdfplumber(pdf_path: str) -> str:
+    return join_page_texts(extract_page_texts_with_pdfplumber(pdf_path))
+
+
+def ocr_pdf_page_texts_with_pypdfium2(pdf_path: str, pages: list[int] | None = None,
+                                      dpi: int = 200, lang: str = "eng") -> dict[int, str]:
+    """
+    OCR the given 1-based pages (all pages if None); returns page -> text.
+    """
+    texts: dict[int, str] = {}
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except Exception as e:
+        logger.error(f"[pypdfium2] failed to open PDF for OCR: {pdf_path}: {e}")
+        return texts
+
+    if pages is None:
+        pages = list(range(1, len(pdf) + 1))
+
+    for i in pages:
+        try:
+            # Render the page to a PIL image
+            bitmap = pdf[i - 1].render(scale=dpi / 72)
+            pil_image = bitmap.to_pil()
+
+            # Run OCR
+            texts[i] = pytesseract.image_to_string(pil_image, lang=lang)
+        except Exception as e:
+            logger.error(f"[OCR] page {i} failed for {pdf_path}: {e}")
+    return texts
 
 
 def ocr_pdf_pages_with_pypdfium2(pdf_path: str, dpi: int = 200, lang: str = "eng") -> str:
@@ -371,14 +417,20 @@ def extract_tables_with_camelot(pdf_path: str) -> list[pd.DataFrame]:
     return dfs
 
 
+def is_text_image_based(text: str | None) -> bool:
+    """
+    Check if a page's extracted text is too short for a text-based page.
+    """
+    # If page has very little text, it's likely image-based
+    return not text or len(text.strip()) < 50
+
+
 def is_page_image_based(page) -> bool:
     """
     Check if a pdfplumber page is image-based (has little to no extractable text).
     """
     try:
-        text = page.extract_text()
-        # If page has very little text, it's likely image-based
-        return not text or len(text.strip()) < 50
+        return is_text_image_based(page.extract_text())
     except Exception:
         return True
 
@@ -483,25 +535,33 @@ def run_for_pdf(pdf_path: str, output_dir: str = OUT_DIR, ocr_if_empty: bool = T
     run_dir, safe_base, timestamp = prepare_run_output_dir(pdf_path, output_dir)
     logger.info(f"Output directory: {run_dir}")
 
-    # --- DETECT IMAGE-BASED PAGES ---
-    image_based_pages = []
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages, start=1):
-                if is_page_image_based(page):
-                    image_based_pages.append(i)
-        
-        if image_based_pages:
-            logger.info(f"Detected image-based pages: {image_based_pages}")
-    except Exception as e:
-        logger.error(f"Failed to detect image-based pages: {e}")
+    # --- TEXT EXTRACTION + IMAGE-BASED PAGE DETECTION ---
+    page_texts = extract_page_texts_with_pdfplumber(pdf_path)
+    image_based_pages = [
+        i for i, txt in enumerate(page_texts, start=1) if is_text_image_based(txt)
+    ]
+    if image_based_pages:
+        logger.info(f"Detected image-based pages: {image_based_pages}")
 
-    # --- TEXT EXTRACTION ---
-    text = extract_text_with_pdfplumber(pdf_path)
+    text = join_page_texts(page_texts)
     logger.info(f"pdfplumber extracted {len(text)} chars")
 
-    # OCR fallback for text if needed
-    if ocr_if_empty and (not text or len(text.strip()) < 50 or image_based_pages):
+    # OCR only the image-based pages and merge with native text page by page
+    if ocr_if_empty and image_based_pages:
+        logger.warning(
+            f"Running OCR for {len(image_based_pages)}/{len(page_texts)} image-based pages..."
+        )
+        ocr_texts = ocr_pdf_page_texts_with_pypdfium2(pdf_path, pages=image_based_pages)
+        ocr_pages = set()
+        for i, ocr_txt in ocr_texts.items():
+            if ocr_txt.strip():
+                page_texts[i - 1] = ocr_txt
+                ocr_pages.add(i)
+        if ocr_pages:
+            text = join_page_texts(page_texts, ocr_pages)
+            logger.info(f"OCR extracted text for {len(ocr_pages)} pages, {len(text)} chars total")
+    elif ocr_if_empty and not page_texts:
+        # pdfplumber could not read the document at all; OCR every page
         logger.warning("Running OCR for text extraction...")
         ocr_text = ocr_pdf_pages_with_pypdfium2(pdf_path)
         if ocr_text:
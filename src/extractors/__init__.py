@@ -6,10 +6,12 @@ from src.extractors.base import (
     BaseTableExtractor,
     BaseContentCleaner
 )
+from src.extractors.document import PDFDocumentSession
 
 __all__ = [
     'BaseExtractor',
     'BaseTextExtractor',
     'BaseTableExtractor',
     'BaseContentCleaner',
+    'PDFDocumentSession',
 ]
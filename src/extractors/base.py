@@ -6,18 +6,24 @@ from typing import List, Optional
 import pandas as pd
 
 from src.models import ExtractionResult
+from src.extractors.document import PDFDocumentSession
 
 
 class BaseExtractor(ABC):
     """Abstract base class for all extractors."""
     
     @abstractmethod
-    def extract(self, pdf_path: Path) -> any:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> any:
         """
         Extract content from a PDF file.
         
         Args:
             pdf_path: Path to the PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             Extracted content (type depends on extractor)
@@ -35,12 +41,17 @@ class BaseTextExtractor(BaseExtractor):
     """Base class for text extraction strategies."""
     
     @abstractmethod
-    def extract(self, pdf_path: Path) -> str:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> str:
         """
         Extract text content from PDF.
         
         Args:
             pdf_path: Path to the PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             Extracted text as string
@@ -52,12 +63,17 @@ class BaseTableExtractor(BaseExtractor):
     """Base class for table extraction strategies."""
     
     @abstractmethod
-    def extract(self, pdf_path: Path) -> List[pd.DataFrame]:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> List[pd.DataFrame]:
         """
         Extract tables from PDF.
         
         Args:
             pdf_path: Path to the PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             List of pandas DataFrames, one per table
@@ -0,0 +1,123 @@
+"""Content-addressed cache of raw PDF extraction results."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+import pandas as pd
+
+from src.cache import DiskCache, hash_file, hash_payload
+from src.config import ExtractionConfig
+
+logger = logging.getLogger(__name__)
+
+# Bump when extractor output for the same input and settings changes
+EXTRACTION_CACHE_VERSION = 1
+
+
+@dataclass
+class CachedExtraction:
+    """Raw (pre-cleaning) extraction output stored in the cache."""
+
+    text: str
+    page_count: int
+    used_ocr: bool
+    tables: List[pd.DataFrame] = field(default_factory=list)
+
+
+class ExtractionCache:
+    """
+    On-disk cache of raw extraction output keyed by PDF bytes and settings.
+
+    Entries hold text and tables before cleaning, so cleaner changes still
+    apply on a cache hit while the expensive parsing and OCR are skipped.
+    """
+
+    def __init__(self, config: ExtractionConfig):
+        """
+        Initialize extraction cache.
+
+        Args:
+            config: Application configuration
+        """
+        self.config = config
+        self.store = DiskCache(
+            cache_dir=config.extraction_cache_dir,
+            max_size_bytes=config.extraction_cache_max_mb * 1024 * 1024
+        )
+
+    def key_for(self, pdf_path: Path) -> str:
+        """
+        Build the cache key for a PDF under the current settings.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Hex digest of the PDF bytes and extraction-relevant settings
+        """
+        return hash_payload({
+            "version": EXTRACTION_CACHE_VERSION,
+            "pdf_sha256": hash_file(pdf_path),
+            "ocr_enabled": self.config.ocr_enabled,
+            "ocr_dpi": self.config.ocr_dpi,
+            "ocr_language": self.config.ocr_language,
+            "hybrid_ocr": self.config.hybrid_ocr,
+            "ocr_page_min_chars": self.config.ocr_page_min_chars,
+            "camelot_enabled": self.config.camelot_enabled,
+        })
+
+    def get(self, key: str) -> Optional[CachedExtraction]:
+        """
+        Look up cached extraction output.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            CachedExtraction on a hit, None on a miss
+        """
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+
+        try:
+            return CachedExtraction(
+                text=entry["text"],
+                page_count=entry["page_count"],
+                used_ocr=entry["used_ocr"],
+                tables=[self._table_from_dict(t) for t in entry["tables"]]
+            )
+        except Exception as e:
+            logger.warning(f"Ignoring malformed extraction cache entry: {e}")
+            return None
+
+    def put(self, key: str, extraction: CachedExtraction) -> None:
+        """
+        Store extraction output.
+
+        Args:
+            key: Key from key_for()
+            extraction: Raw extraction output to store
+        """
+        self.store.set(key, {
+            "text": extraction.text,
+            "page_count": extraction.page_count,
+            "used_ocr": extraction.used_ocr,
+            "tables": [self._table_to_dict(t) for t in extraction.tables],
+        })
+
+    def _table_to_dict(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Serialize a raw table with its metadata."""
+        return {
+            "columns": df.columns.tolist(),
+            "rows": df.values.tolist(),
+            "attrs": dict(df.attrs),
+        }
+
+    def _table_from_dict(self, data: Dict[str, Any]) -> pd.DataFrame:
+        """Rebuild a raw table with its metadata."""
+        df = pd.DataFrame(data["rows"], columns=data["columns"])
+        df.attrs.update(data.get("attrs", {}))
+        return df
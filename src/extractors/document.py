@@ -0,0 +1,166 @@
+"""Shared PDF document session so each file is opened and parsed only once."""
+
+from pathlib import Path
+from typing import Dict, List
+import logging
+
+try:
+    import pdfplumber
+    HAS_PDFPLUMBER = True
+except ImportError:
+    HAS_PDFPLUMBER = False
+
+try:
+    from pypdfium2 import PdfDocument
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+logger = logging.getLogger(__name__)
+
+
+class PDFDocumentSession:
+    """
+    Holds the parsed handles of a single PDF for the duration of processing.
+
+    The pdfplumber document and the pypdfium2 handle are opened lazily on
+    first use and shared by every extractor and helper. Per-page text and
+    tables are memoised, so text extraction, table extraction, page counting
+    and the extractability check all reuse the same parse.
+    """
+
+    def __init__(self, pdf_path: Path):
+        """
+        Initialize document session.
+
+        Args:
+            pdf_path: Path to the PDF file
+        """
+        self.pdf_path = Path(pdf_path)
+        self._plumber = None
+        self._pdfium = None
+        self._page_text: Dict[int, str] = {}
+        self._page_tables: Dict[int, List[list]] = {}
+
+    def __enter__(self) -> "PDFDocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def plumber(self):
+        """Parsed pdfplumber document (opened on first access)."""
+        if self._plumber is None:
+            if not HAS_PDFPLUMBER:
+                raise RuntimeError("pdfplumber not available")
+            self._plumber = pdfplumber.open(str(self.pdf_path))
+        return self._plumber
+
+    @property
+    def pdfium(self):
+        """pypdfium2 document handle used for rendering (opened on first access)."""
+        if self._pdfium is None:
+            if not HAS_PDFIUM:
+                raise RuntimeError("pypdfium2 not available")
+            self._pdfium = PdfDocument(str(self.pdf_path))
+        return self._pdfium
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        return len(self.plumber.pages)
+
+    def page_text(self, page_num: int) -> str:
+        """
+        Get the pdfplumber text of a page.
+
+        Args:
+            page_num: 1-based page number
+
+        Returns:
+            Extracted page text ("" if the page could not be read)
+        """
+        if page_num not in self._page_text:
+            try:
+                text = self.plumber.pages[page_num - 1].extract_text() or ""
+            except Exception as e:
+                logger.warning(f"Text extraction failed for page {page_num}: {e}")
+                text = ""
+            self._page_text[page_num] = text
+        return self._page_text[page_num]
+
+    def page_has_images(self, page_num: int) -> bool:
+        """
+        Check if a page contains embedded images.
+
+        Args:
+            page_num: 1-based page number
+
+        Returns:
+            True if pdfplumber finds at least one image on the page
+        """
+        try:
+            return bool(self.plumber.pages[page_num - 1].images)
+        except Exception as e:
+            logger.warning(f"Image detection failed for page {page_num}: {e}")
+            return False
+
+    def page_tables(self, page_num: int) -> List[list]:
+        """
+        Get the raw pdfplumber tables of a page.
+
+        Args:
+            page_num: 1-based page number
+
+        Returns:
+            List of tables, each a list of rows
+        """
+        if page_num not in self._page_tables:
+            try:
+                tables = self.plumber.pages[page_num - 1].extract_tables() or []
+            except Exception as e:
+                logger.warning(f"Table extraction failed for page {page_num}: {e}")
+                tables = []
+            self._page_tables[page_num] = tables
+        return self._page_tables[page_num]
+
+    def preload_pages(self, max_workers: int) -> None:
+        """
+        Extract text and tables for all pages in parallel worker processes.
+
+        Results populate the per-page caches, so extractors read them back in
+        page order exactly as if they had been extracted sequentially. On any
+        pool failure the caches are left empty and pages are parsed lazily.
+
+        Args:
+            max_workers: Number of worker processes
+        """
+        from src.extractors.parallel import extract_pages_parallel
+
+        try:
+            pages = extract_pages_parallel(self.pdf_path, self.page_count, max_workers)
+        except Exception as e:
+            logger.warning(f"Parallel page extraction failed, falling back to sequential: {e}")
+            return
+
+        for page_num, (text, tables) in pages.items():
+            self._page_text[page_num] = text
+            self._page_tables[page_num] = tables
+
+    def close(self) -> None:
+        """Release all open document handles."""
+        if self._plumber is not None:
+            try:
+                self._plumber.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pdfplumber document: {e}")
+            self._plumber = None
+
+        if self._pdfium is not None:
+            try:
+                self._pdfium.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pdfium document: {e}")
+            self._pdfium = None
+
@@ -0,0 +1,115 @@
+"""Page-sharded pdfplumber extraction across a process pool.
+
+pdfplumber is pure Python and holds the GIL, so large documents are split
+into contiguous page shards that are parsed in separate worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+import logging
+import math
+
+try:
+    import pdfplumber
+    HAS_PDFPLUMBER = True
+except ImportError:
+    HAS_PDFPLUMBER = False
+
+logger = logging.getLogger(__name__)
+
+# Shards per worker; more than one keeps workers busy when page cost varies
+SHARDS_PER_WORKER = 2
+
+PageContent = Tuple[str, List[list]]
+
+
+def _extract_page_shard(
+    pdf_path: str,
+    page_numbers: List[int]
+) -> List[Tuple[int, str, List[list]]]:
+    """
+    Extract text and raw tables for a shard of pages (runs in a worker process).
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: 1-based page numbers to extract
+
+    Returns:
+        List of (page_num, text, tables) tuples
+    """
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in page_numbers:
+            page = pdf.pages[page_num - 1]
+
+            try:
+                text = page.extract_text() or ""
+            except Exception:
+                text = ""
+
+            try:
+                tables = page.extract_tables() or []
+            except Exception:
+                tables = []
+
+            results.append((page_num, text, tables))
+    return results
+
+
+def shard_pages(page_count: int, shard_count: int) -> List[List[int]]:
+    """
+    Split page numbers into contiguous shards.
+
+    Args:
+        page_count: Number of pages in the document
+        shard_count: Desired number of shards
+
+    Returns:
+        List of shards, each a list of 1-based page numbers
+    """
+    if page_count <= 0:
+        return []
+    size = math.ceil(page_count / max(1, shard_count))
+    pages = list(range(1, page_count + 1))
+    return [pages[i:i + size] for i in range(0, page_count, size)]
+
+
+def extract_pages_parallel(
+    pdf_path: Path,
+    page_count: int,
+    max_workers: int
+) -> Dict[int, PageContent]:
+    """
+    Extract text and raw tables for every page using a process pool.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_count: Number of pages in the document
+        max_workers: Number of worker processes
+
+    Returns:
+        Mapping of 1-based page number to (text, tables)
+    """
+    if not HAS_PDFPLUMBER:
+        logger.error("pdfplumber not available")
+        return {}
+
+    shards = shard_pages(page_count, max_workers * SHARDS_PER_WORKER)
+    workers = min(max_workers, len(shards))
+
+    pages: Dict[int, PageContent] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_extract_page_shard, str(pdf_path), shard)
+            for shard in shards
+        ]
+        for future in futures:
+            for page_num, text, tables in future.result():
+                pages[page_num] = (text, tables)
+
+    logger.info(
+        f"Extracted {len(pages)} pages in {len(shards)} shards "
+        f"across {workers} worker processes"
+    )
+    return pages
@@ -1,7 +1,7 @@
 """Main PDF processor orchestrator that coordinates extraction and cleaning."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import logging
 import hashlib
@@ -10,10 +10,12 @@ import pandas as pd
 
 from src.config import ExtractionConfig
 from src.models import ExtractionResult, ProcessingMetadata
+from src.extractors.document import PDFDocumentSession
+from src.extractors.cache import CachedExtraction, ExtractionCache
 from src.extractors.text_extractors import (
     PDFPlumberTextExtractor,
     OCRTextExtractor,
-    is_text_extractable
+    join_page_texts
 )
 from src.extractors.table_extractors import (
     PDFPlumberTableExtractor,
@@ -46,7 +48,8 @@ class PDFProcessor:
         self.text_extractor = PDFPlumberTextExtractor()
         self.ocr_text_extractor = OCRTextExtractor(
             dpi=config.ocr_dpi,
-            lang=config.ocr_language
+            lang=config.ocr_language,
+            max_workers=config.ocr_workers
         )
         
         self.table_extractors = [PDFPlumberTableExtractor()]
@@ -58,6 +61,9 @@ class PDFProcessor:
         # Initialize cleaners
         self.content_cleaner = ContentCleaner()
         self.table_cleaner = TableCleaner()
+        
+        # Raw extraction cache keyed by PDF bytes and settings
+        self.cache = ExtractionCache(config) if config.extraction_cache_enabled else None
     
     def _generate_pdf_id(self, pdf_path: Path) -> str:
         """
@@ -112,22 +118,17 @@ class PDFProcessor:
         pdf_path = Path(pdf_path)
         logger.info(f"Processing PDF: {pdf_path.name}")
         
-        # Extract text
-        text = self._extract_text(pdf_path)
-        
-        # Extract tables
-        tables = self._extract_tables(pdf_path)
+        # Extract raw content (cached by PDF bytes and settings)
+        extraction = self._extract_raw(pdf_path)
+        page_count = extraction.page_count
         
         # Clean content
-        cleaned_text = self.content_cleaner.clean_text(text)
-        cleaned_tables = self._clean_tables(tables)
+        cleaned_text = self.content_cleaner.clean_text(extraction.text)
+        cleaned_tables = self._clean_tables(extraction.tables)
         
         # Extract subject
         subject = self._extract_subject(cleaned_text)
         
-        # Count pages
-        page_count = self._count_pages(pdf_path)
-        
         # Create result
         result = ExtractionResult(
             pdf_path=pdf_path,
@@ -136,7 +137,7 @@ class PDFProcessor:
             tables=[self._table_to_dict(t) for t in cleaned_tables],
             page_count=page_count,
             table_count=len(cleaned_tables),
-            used_ocr=not is_text_extractable(pdf_path)
+            used_ocr=extraction.used_ocr
         )
         
         logger.info(
@@ -146,26 +147,162 @@ class PDFProcessor:
         
         return result
     
-    def _extract_text(self, pdf_path: Path) -> str:
-        """Extract text with fallback to OCR if needed."""
+    def _extract_raw(self, pdf_path: Path) -> CachedExtraction:
+        """
+        Extract raw text and tables, reusing the extraction cache when possible.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Raw (pre-cleaning) extraction output
+        """
+        cache_key = None
+        if self.cache:
+            try:
+                cache_key = self.cache.key_for(pdf_path)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Extraction cache hit: {pdf_path.name}")
+                    return cached
+            except Exception as e:
+                logger.warning(f"Extraction cache lookup failed: {e}")
+        
+        # Open the document once and share it with every extractor
+        with PDFDocumentSession(pdf_path) as session:
+            # Parse large documents page-sharded across worker processes
+            if self._should_preload_pages(session):
+                session.preload_pages(self.config.page_workers)
+            
+            # Extract text
+            text, used_ocr = self._extract_text(pdf_path, session)
+            
+            # Extract tables
+            tables = self._extract_tables(pdf_path, session)
+            
+            # Count pages
+            page_count = self._count_pages(session)
+        
+        extraction = CachedExtraction(
+            text=text,
+            page_count=page_count,
+            used_ocr=used_ocr,
+            tables=tables
+        )
+        
+        # Don't cache empty results; they may come from a transient failure
+        if cache_key and (text.strip() or tables):
+            try:
+                self.cache.put(cache_key, extraction)
+            except Exception as e:
+                logger.warning(f"Failed to cache extraction for {pdf_path.name}: {e}")
+        
+        return extraction
+    
+    def _should_preload_pages(self, session: PDFDocumentSession) -> bool:
+        """Check if the document is large enough for page-sharded extraction."""
+        if self.config.page_workers <= 1:
+            return False
+        try:
+            return session.page_count >= self.config.parallel_page_threshold
+        except Exception:
+            return False
+    
+    def _extract_text(
+        self,
+        pdf_path: Path,
+        session: PDFDocumentSession
+    ) -> Tuple[str, bool]:
+        """
+        Extract text with fallback to OCR if needed.
+        
+        Returns:
+            Tuple of (text, whether OCR was used)
+        """
         # Try regular extraction first
-        text = self.text_extractor.extract(pdf_path)
+        page_texts = self.text_extractor.extract_pages(pdf_path, session=session)
+        text = join_page_texts(page_texts)
         
-        # If insufficient text and OCR enabled, use OCR
-        if len(text.strip()) < 100 and self.config.ocr_enabled:
+        if not self.config.ocr_enabled:
+            return text, False
+        
+        if self.config.hybrid_ocr and page_texts:
+            return self._extract_text_hybrid(pdf_path, session, page_texts)
+        
+        # If insufficient text, OCR the whole document
+        if len(text.strip()) < 100:
             logger.info("Text extraction yielded little content, trying OCR")
-            text = self.ocr_text_extractor.extract(pdf_path)
+            return self.ocr_text_extractor.extract(pdf_path, session=session), True
+        
+        return text, False
+    
+    def _extract_text_hybrid(
+        self,
+        pdf_path: Path,
+        session: PDFDocumentSession,
+        page_texts: dict
+    ) -> Tuple[str, bool]:
+        """
+        OCR only image-based pages and merge with native text page by page.
+        
+        Args:
+            pdf_path: Path to PDF file
+            session: Open document session
+            page_texts: Native pdfplumber text per page
+            
+        Returns:
+            Tuple of (merged text, whether OCR was used)
+        """
+        image_pages = [
+            page_num for page_num, page_text in page_texts.items()
+            if self._is_image_based_page(session, page_num, page_text)
+        ]
+        
+        if not image_pages:
+            return join_page_texts(page_texts), False
         
-        return text
+        logger.info(
+            f"OCR on {len(image_pages)}/{len(page_texts)} image-based pages: {image_pages}"
+        )
+        ocr_texts = self.ocr_text_extractor.extract_pages(
+            pdf_path, pages=image_pages, session=session
+        )
+        
+        # Prefer OCR text only where it actually recovered more content
+        merged = dict(page_texts)
+        ocr_pages = []
+        for page_num, ocr_text in ocr_texts.items():
+            if len(ocr_text.strip()) > len(merged[page_num].strip()):
+                merged[page_num] = ocr_text
+                ocr_pages.append(page_num)
+        
+        return join_page_texts(merged, ocr_pages=ocr_pages), bool(ocr_pages)
+    
+    def _is_image_based_page(
+        self,
+        session: PDFDocumentSession,
+        page_num: int,
+        page_text: str
+    ) -> bool:
+        """Check if a page needs OCR (little native text and a scanned image)."""
+        stripped = page_text.strip()
+        if len(stripped) >= self.config.ocr_page_min_chars:
+            return False
+        # Short text-only pages (e.g. a trailing signature) don't need OCR
+        return not stripped or session.page_has_images(page_num)
     
-    def _extract_tables(self, pdf_path: Path) -> List[pd.DataFrame]:
+    def _extract_tables(
+        self,
+        pdf_path: Path,
+        session: PDFDocumentSession
+    ) -> List[pd.DataFrame]:
         """Extract tables using multiple strategies."""
         all_tables = []
         
         # Try each table extractor
         for extractor in self.table_extractors:
             try:
-                tables = extractor.extract(pdf_path)
+                tables = extractor.extract(pdf_path, session=session)
                 all_tables.extend(tables)
             except Exception as e:
                 logger.warning(f"{extractor.name} failed: {e}")
@@ -174,7 +311,7 @@ class PDFProcessor:
         if not all_tables and self.config.ocr_enabled:
             logger.info("No tables found, trying OCR table extraction")
             try:
-                ocr_tables = self.ocr_table_extractor.extract(pdf_path)
+                ocr_tables = self.ocr_table_extractor.extract(pdf_path, session=session)
                 all_tables.extend(ocr_tables)
             except Exception as e:
                 logger.warning(f"OCR table extraction failed: {e}")
@@ -202,12 +339,10 @@ class PDFProcessor:
             'extractor': df.attrs.get('extractor', None),
         }
     
-    def _count_pages(self, pdf_path: Path) -> int:
+    def _count_pages(self, session: PDFDocumentSession) -> int:
         """Count pages in PDF."""
         try:
-            import pdfplumber
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                return len(pdf.pages)
+            return session.page_count
         except Exception:
             return 0
     
@@ -1,7 +1,7 @@
 """Table extraction implementations using various strategies."""
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import logging
 
 import pandas as pd
@@ -26,6 +26,7 @@ except ImportError:
     HAS_IMG2TABLE = False
 
 from src.extractors.base import BaseTableExtractor
+from src.extractors.document import PDFDocumentSession
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +38,17 @@ class PDFPlumberTableExtractor(BaseTableExtractor):
     def name(self) -> str:
         return "PDFPlumber Table Extractor"
     
-    def extract(self, pdf_path: Path) -> List[pd.DataFrame]:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> List[pd.DataFrame]:
         """
         Extract tables from PDF using pdfplumber.
         
         Args:
             pdf_path: Path to PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             List of DataFrames, one per table
@@ -51,23 +57,26 @@ class PDFPlumberTableExtractor(BaseTableExtractor):
             logger.error("pdfplumber not available")
             return []
         
+        owns_session = session is None
+        if owns_session:
+            session = PDFDocumentSession(pdf_path)
+        
         try:
             all_tables = []
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    tables = page.extract_tables()
-                    
-                    for table_idx, table in enumerate(tables):
-                        if table and len(table) > 0:
-                            # Convert to DataFrame
-                            df = pd.DataFrame(table[1:], columns=table[0])
-                            
-                            # Add metadata
-                            df.attrs['page'] = page_num
-                            df.attrs['table_index'] = table_idx
-                            df.attrs['extractor'] = self.name
-                            
-                            all_tables.append(df)
+            for page_num in range(1, session.page_count + 1):
+                tables = session.page_tables(page_num)
+                
+                for table_idx, table in enumerate(tables):
+                    if table and len(table) > 0:
+                        # Convert to DataFrame
+                        df = pd.DataFrame(table[1:], columns=table[0])
+                        
+                        # Add metadata
+                        df.attrs['page'] = page_num
+                        df.attrs['table_index'] = table_idx
+                        df.attrs['extractor'] = self.name
+                        
+                        all_tables.append(df)
             
             logger.info(f"PDFPlumber extracted {len(all_tables)} tables")
             return all_tables
@@ -75,6 +84,9 @@ class PDFPlumberTableExtractor(BaseTableExtractor):
         except Exception as e:
             logger.error(f"PDFPlumber table extraction failed: {e}")
             return []
+        finally:
+            if owns_session:
+                session.close()
 
 
 class CamelotTableExtractor(BaseTableExtractor):
@@ -93,12 +105,17 @@ class CamelotTableExtractor(BaseTableExtractor):
     def name(self) -> str:
         return f"Camelot Table Extractor ({self.flavor})"
     
-    def extract(self, pdf_path: Path) -> List[pd.DataFrame]:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> List[pd.DataFrame]:
         """
         Extract tables from PDF using Camelot.
         
         Args:
             pdf_path: Path to PDF file
+            session: Unused; this library reads the file from disk itself
             
         Returns:
             List of DataFrames, one per table
@@ -152,12 +169,17 @@ class OCRTableExtractor(BaseTableExtractor):
     def name(self) -> str:
         return f"OCR Table Extractor (Lang={self.lang})"
     
-    def extract(self, pdf_path: Path) -> List[pd.DataFrame]:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> List[pd.DataFrame]:
         """
         Extract tables using OCR.
         
         Args:
             pdf_path: Path to PDF file
+            session: Unused; this library reads the file from disk itself
             
         Returns:
             List of DataFrames, one per table
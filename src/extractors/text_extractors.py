@@ -1,8 +1,12 @@
 """Text extraction implementations using various strategies."""
 
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 import logging
+import os
+import threading
 
 try:
     import pdfplumber
@@ -19,10 +23,75 @@ except ImportError:
     HAS_OCR = False
 
 from src.extractors.base import BaseTextExtractor
+from src.extractors.document import PDFDocumentSession
 
 logger = logging.getLogger(__name__)
 
 
+# Overlapping OCR pools share one OMP_THREAD_LIMIT setting: the first to
+# enter sets it (unless the user already did), the last to leave removes it
+_omp_lock = threading.Lock()
+_omp_holders = 0
+_omp_set_by_us = False
+
+
+@contextmanager
+def _omp_thread_limit(limit: int) -> Iterator[None]:
+    """Set OMP_THREAD_LIMIT while any caller is inside the block unless already set."""
+    global _omp_holders, _omp_set_by_us
+    with _omp_lock:
+        if _omp_holders == 0:
+            _omp_set_by_us = "OMP_THREAD_LIMIT" not in os.environ
+            if _omp_set_by_us:
+                os.environ["OMP_THREAD_LIMIT"] = str(limit)
+        _omp_holders += 1
+    try:
+        yield
+    finally:
+        with _omp_lock:
+            _omp_holders -= 1
+            if _omp_holders == 0 and _omp_set_by_us:
+                os.environ.pop("OMP_THREAD_LIMIT", None)
+
+
+def format_page_text(page_num: int, text: str, ocr: bool = False) -> str:
+    """
+    Format a page of text with its page marker.
+    
+    Args:
+        page_num: 1-based page number
+        text: Page text
+        ocr: Whether the text came from OCR
+        
+    Returns:
+        Page text prefixed with a '--- Page N ---' marker
+    """
+    suffix = " (OCR)" if ocr else ""
+    return f"--- Page {page_num}{suffix} ---\n{text}"
+
+
+def join_page_texts(
+    page_texts: Dict[int, str],
+    ocr_pages: Iterable[int] = ()
+) -> str:
+    """
+    Join per-page text in page order, skipping empty pages.
+    
+    Args:
+        page_texts: Mapping of 1-based page number to text
+        ocr_pages: Page numbers whose text came from OCR
+        
+    Returns:
+        Combined text with page markers
+    """
+    ocr_pages = set(ocr_pages)
+    return "\n\n".join(
+        format_page_text(page_num, text, ocr=page_num in ocr_pages)
+        for page_num, text in sorted(page_texts.items())
+        if text.strip()
+    )
+
+
 class PDFPlumberTextExtractor(BaseTextExtractor):
     """Extract text using pdfplumber library."""
     
@@ -30,101 +99,227 @@ class PDFPlumberTextExtractor(BaseTextExtractor):
     def name(self) -> str:
         return "PDFPlumber Text Extractor"
     
-    def extract(self, pdf_path: Path) -> str:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> str:
         """
         Extract text from PDF using pdfplumber.
         
         Args:
             pdf_path: Path to PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             Extracted text content
         """
+        full_text = join_page_texts(self.extract_pages(pdf_path, session=session))
+        logger.info(f"Extracted {len(full_text)} characters using pdfplumber")
+        return full_text
+    
+    def extract_pages(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> Dict[int, str]:
+        """
+        Extract text from every page using pdfplumber.
+        
+        Args:
+            pdf_path: Path to PDF file
+            session: Open document session to reuse (opens the file if None)
+            
+        Returns:
+            Mapping of 1-based page number to page text
+        """
         if not HAS_PDFPLUMBER:
             logger.error("pdfplumber not available")
-            return ""
+            return {}
+        
+        owns_session = session is None
+        if owns_session:
+            session = PDFDocumentSession(pdf_path)
         
         try:
-            text_parts = []
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text() or ""
-                    if page_text.strip():
-                        text_parts.append(f"--- Page {page_num} ---\n{page_text}")
-            
-            full_text = "\n\n".join(text_parts)
-            logger.info(f"Extracted {len(full_text)} characters using pdfplumber")
-            return full_text
+            return {
+                page_num: session.page_text(page_num)
+                for page_num in range(1, session.page_count + 1)
+            }
             
         except Exception as e:
             logger.error(f"PDFPlumber extraction failed: {e}")
-            return ""
+            return {}
+        finally:
+            if owns_session:
+                session.close()
 
 
 class OCRTextExtractor(BaseTextExtractor):
     """Extract text using OCR (for image-based PDFs)."""
     
-    def __init__(self, dpi: int = 200, lang: str = "eng"):
+    def __init__(self, dpi: int = 200, lang: str = "eng", max_workers: int = 1):
         """
         Initialize OCR extractor.
         
         Args:
             dpi: Resolution for rendering PDF pages
             lang: Tesseract language code
+            max_workers: Concurrent tesseract jobs (1 runs pages sequentially)
         """
         self.dpi = dpi
         self.lang = lang
+        self.max_workers = max(1, max_workers)
     
     @property
     def name(self) -> str:
         return f"OCR Text Extractor (DPI={self.dpi}, Lang={self.lang})"
     
-    def extract(self, pdf_path: Path) -> str:
+    def extract(
+        self,
+        pdf_path: Path,
+        session: Optional[PDFDocumentSession] = None
+    ) -> str:
         """
         Extract text using OCR.
         
         Args:
             pdf_path: Path to PDF file
+            session: Open document session to reuse (opens the file if None)
             
         Returns:
             OCR-extracted text content
         """
+        page_texts = self.extract_pages(pdf_path, session=session)
+        full_text = join_page_texts(page_texts, ocr_pages=page_texts)
+        logger.info(f"OCR extracted {len(full_text)} characters from {len(page_texts)} pages")
+        return full_text
+    
+    def extract_pages(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+        session: Optional[PDFDocumentSession] = None
+    ) -> Dict[int, str]:
+        """
+        OCR selected pages of a PDF.
+        
+        Args:
+            pdf_path: Path to PDF file
+            pages: 1-based page numbers to OCR (all pages if None)
+            session: Open document session to reuse (opens the file if None)
+            
+        Returns:
+            Mapping of 1-based page number to OCR text
+        """
         if not HAS_OCR:
             logger.error("OCR dependencies not available")
-            return ""
+            return {}
+        
+        owns_session = session is None
+        if owns_session:
+            session = PDFDocumentSession(pdf_path)
         
         try:
-            text_parts = []
-            pdf = PdfDocument(str(pdf_path))
+            pdf = session.pdfium
+            if pages is None:
+                pages = list(range(1, len(pdf) + 1))
             
-            for page_num in range(len(pdf)):
-                page = pdf[page_num]
-                # Render page to image
-                bitmap = page.render(scale=self.dpi/72)
-                pil_image = bitmap.to_pil()
-                
-                # Perform OCR
-                page_text = pytesseract.image_to_string(pil_image, lang=self.lang)
-                
-                if page_text.strip():
-                    text_parts.append(f"--- Page {page_num + 1} (OCR) ---\n{page_text}")
+            if self.max_workers > 1 and len(pages) > 1:
+                return self._extract_pages_parallel(pdf, pages)
             
-            full_text = "\n\n".join(text_parts)
-            logger.info(f"OCR extracted {len(full_text)} characters from {len(pdf)} pages")
-            return full_text
+            page_texts = {}
+            for page_num in pages:
+                try:
+                    pil_image = self._render_page(pdf, page_num)
+                    page_texts[page_num] = self._ocr_image(pil_image)
+                except Exception as e:
+                    logger.error(f"OCR failed for page {page_num}: {e}")
+            
+            return page_texts
             
         except Exception as e:
             logger.error(f"OCR extraction failed: {e}")
-            return ""
+            return {}
+        finally:
+            if owns_session:
+                session.close()
+    
+    def _render_page(self, pdf, page_num: int):
+        """Render a 1-based page to a PIL image."""
+        bitmap = pdf[page_num - 1].render(scale=self.dpi/72)
+        return bitmap.to_pil()
+    
+    def _ocr_image(self, pil_image) -> str:
+        """Run tesseract on a rendered page image."""
+        return pytesseract.image_to_string(pil_image, lang=self.lang)
+    
+    def _extract_pages_parallel(self, pdf, pages: List[int]) -> Dict[int, str]:
+        """
+        OCR pages with a bounded pool of concurrent tesseract jobs.
+        
+        Rendering stays on the calling thread (pdfium is not thread-safe);
+        each tesseract call runs in its own subprocess, so worker threads
+        only wait on it. At most twice the worker count of rendered pages
+        are held in memory at once. A page that fails to render or OCR is
+        logged and skipped, as in the sequential path.
+        
+        While any pool runs, OMP_THREAD_LIMIT=1 is set in the process
+        environment (unless already set) so the tesseract subprocesses do
+        not each spawn OpenMP threads; pytesseract offers no per-call
+        environment. It is removed once the last overlapping pool finishes.
+        The variable is process-wide, so other subprocesses started
+        meanwhile also inherit it.
+        
+        Args:
+            pdf: Open pypdfium2 document
+            pages: 1-based page numbers to OCR
+            
+        Returns:
+            Mapping of 1-based page number to OCR text
+        """
+        page_texts: Dict[int, str] = {}
+        pending = {}
+        
+        def collect(futures) -> None:
+            for future in futures:
+                page_num = pending.pop(future)
+                try:
+                    page_texts[page_num] = future.result()
+                except Exception as e:
+                    logger.error(f"OCR failed for page {page_num}: {e}")
+        
+        with _omp_thread_limit(1), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for page_num in pages:
+                try:
+                    pil_image = self._render_page(pdf, page_num)
+                except Exception as e:
+                    logger.error(f"OCR failed for page {page_num}: {e}")
+                    continue
+                pending[executor.submit(self._ocr_image, pil_image)] = page_num
+                
+                if len(pending) >= self.max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            
+            collect(list(pending))
+        
+        logger.info(f"OCR'd {len(page_texts)} pages with {self.max_workers} workers")
+        return page_texts
 
 
-def is_text_extractable(pdf_path: Path, min_chars: int = 100) -> bool:
+def is_text_extractable(
+    pdf_path: Path,
+    min_chars: int = 100,
+    session: Optional[PDFDocumentSession] = None
+) -> bool:
     """
     Check if PDF has extractable text (not image-based).
     
     Args:
         pdf_path: Path to PDF file
         min_chars: Minimum characters to consider as extractable
+        session: Open document session to reuse (opens the file if None)
         
     Returns:
         True if text can be extracted, False if OCR is needed
@@ -132,13 +327,19 @@ def is_text_extractable(pdf_path: Path, min_chars: int = 100) -> bool:
     if not HAS_PDFPLUMBER:
         return False
     
+    owns_session = session is None
+    if owns_session:
+        session = PDFDocumentSession(pdf_path)
+    
     try:
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            # Check first few pages
-            for page in pdf.pages[:3]:
-                text = page.extract_text() or ""
-                if len(text.strip()) >= min_chars:
-                    return True
+        # Check first few pages
+        for page_num in range(1, min(session.page_count, 3) + 1):
+            text = session.page_text(page_num)
+            if len(text.strip()) >= min_chars:
+                return True
         return False
     except Exception:
         return False
+    finally:
+        if owns_session:
+            session.close()
@@ -0,0 +1,426 @@
+"""Token-aware input budgeting for LLM prompts.
+
+Email bodies are split into paragraph and table blocks, each block is
+scored for scheme relevance, and the best blocks are packed into a token
+budget in their original order. This replaces blind character truncation,
+which could cut a scheme table in half while keeping quoted boilerplate.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+logger = logging.getLogger(__name__)
+
+# Characters per token when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+# Marker inserted where blocks were left out
+OMISSION_MARKER = "[...]"
+
+# Joins the blocks of a chunk
+CHUNK_SEPARATOR = "\n\n"
+
+# Smallest leftover budget worth filling with part of an oversized block
+MIN_PARTIAL_TOKENS = 100
+
+_BLOCK_SPLIT = re.compile(r"\n\s*\n")
+_TABLE_HEADER = re.compile(r"^(TABLE\b|TABLE FROM\b|SUMMARY:)", re.IGNORECASE)
+_PAGE_MARKER = re.compile(r"^---\s*(OCR\s+)?PAGE\b", re.IGNORECASE)
+
+_SCHEME_TERMS = re.compile(
+    r"\b(scheme|offer|discount|cash\s?back|margin|payout|support|claim|"
+    r"price\s+protection|price\s+drop|buy\s?side|sell\s?side|one[-\s]?off|"
+    r"pdc|bbd|bank\s+offer|exchange|slab|target|incentive|rebate|"
+    r"valid(ity)?|period|start\s+date|end\s+date|duration|"
+    r"fsn|sku|model|brand|vendor|category|mrp|nlc|dp|cp|per\s+unit)\b",
+    re.IGNORECASE
+)
+_DATE = re.compile(
+    r"\b\d{1,2}[/\-.]\d{1,2}[/\-.]\d{2,4}\b|"
+    r"\b\d{1,2}(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b|"
+    r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2}\b",
+    re.IGNORECASE
+)
+_AMOUNT = re.compile(r"(₹|rs\.?|inr)\s?\d|\d+(\.\d+)?\s?%", re.IGNORECASE)
+_BOILERPLATE = re.compile(
+    r"^\s*(>|from:|sent:|to:|cc:|bcc:|on .+ wrote:)|"
+    r"disclaimer|confidential|intended recipient|unsubscribe|"
+    r"do not reply|privacy policy|all rights reserved|virus",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+class TokenCounter:
+    """Count tokens with tiktoken when available, else estimate from length."""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        """
+        Initialize token counter.
+
+        Args:
+            encoding_name: tiktoken encoding to use
+        """
+        self.encoding = None
+        if HAS_TIKTOKEN:
+            try:
+                self.encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                # Encodings are downloaded on first use; fall back offline
+                logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Token count (estimated if no tokenizer is available)
+        """
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ContentBlock:
+    """A paragraph or table of the input with its budgeting score."""
+
+    index: int
+    text: str
+    tokens: int
+    score: float
+    is_table: bool = False
+
+
+class InputBudgeter:
+    """
+    Pack the most scheme-relevant blocks of an email body into a token budget.
+
+    Bodies already within budget are returned unchanged.
+    """
+
+    def __init__(self, token_budget: int, counter: Optional[TokenCounter] = None):
+        """
+        Initialize input budgeter.
+
+        Args:
+            token_budget: Maximum tokens of body text sent to the LLM
+            counter: Token counter (creates a default one if None)
+        """
+        self.token_budget = token_budget
+        self.counter = counter or TokenCounter()
+
+    def pack(self, body: str) -> str:
+        """
+        Fit a body into the token budget.
+
+        Args:
+            body: Full email body with tables
+
+        Returns:
+            Body restricted to the highest-value blocks, in original order
+        """
+        if self.counter.count(body) <= self.token_budget:
+            return body
+
+        blocks = self.split_blocks(body)
+        selected = self._select(blocks)
+        packed = self._fit(blocks, selected)
+
+        kept = sum(selected.values())
+        total = sum(b.tokens for b in blocks)
+        logger.info(
+            f"Input budget: kept {len(selected)}/{len(blocks)} blocks, "
+            f"~{kept}/{total} tokens (budget {self.token_budget})"
+        )
+        return packed
+
+    def chunk(self, body: str, overlap_tokens: int = 200) -> List[str]:
+        """
+        Split a body into overlapping, section-aware chunks within the budget.
+
+        Chunks break between paragraph and table blocks. Consecutive chunks
+        share up to overlap_tokens of trailing blocks so a scheme described
+        across a boundary is seen whole at least once. Blocks larger than a
+        chunk are split by lines, repeating a table's header lines in every
+        piece. The opening block (subject and headers) is repeated in each
+        chunk when it is small. The separators joining blocks are counted,
+        so every chunk fits the budget as sent.
+
+        Args:
+            body: Full email body with tables
+            overlap_tokens: Tokens of trailing context carried into the next chunk
+
+        Returns:
+            Chunk texts in order (the body itself if it fits the budget)
+        """
+        if self.counter.count(body) <= self.token_budget:
+            return [body]
+
+        blocks = self.split_blocks(body)
+        preamble = None
+        if blocks and blocks[0].tokens <= self.token_budget // 10:
+            preamble = blocks.pop(0)
+
+        separator = self.counter.count(CHUNK_SEPARATOR)
+        limit = self.token_budget - (preamble.tokens + separator if preamble else 0)
+        pieces = []
+        for block in blocks:
+            if block.tokens <= limit:
+                pieces.append((block.text, block.tokens))
+            else:
+                pieces.extend(self._split_oversized(block, limit))
+
+        # Each piece costs its tokens plus one separator; the first piece of
+        # a chunk has no separator, hence the extra one in the capacity
+        pieces = [(text, tokens + separator) for text, tokens in pieces]
+        capacity = limit + separator
+
+        chunks: List[List[tuple]] = []
+        current: List[tuple] = []
+        used = 0
+        for text, tokens in pieces:
+            if current and used + tokens > capacity:
+                chunks.append(current)
+                # Carry trailing pieces forward as overlap
+                carried: List[tuple] = []
+                carried_tokens = 0
+                for prev in reversed(current):
+                    if carried_tokens + prev[1] > overlap_tokens or carried_tokens + prev[1] + tokens > capacity:
+                        break
+                    carried.insert(0, prev)
+                    carried_tokens += prev[1]
+                current, used = carried, carried_tokens
+            current.append((text, tokens))
+            used += tokens
+        if current:
+            chunks.append(current)
+
+        head = [preamble.text] if preamble else []
+        logger.info(f"Split {sum(b.tokens for b in blocks)} tokens into {len(chunks)} chunks")
+        return [CHUNK_SEPARATOR.join(head + [text for text, _ in chunk]) for chunk in chunks]
+
+    def _split_oversized(self, block: ContentBlock, limit: int) -> List[tuple]:
+        """Split a block larger than a chunk into line groups of (text, tokens)."""
+        lines = block.text.splitlines()
+        # Tables keep their title and column header in every piece
+        header = lines[:2] if block.is_table else []
+        body_lines = lines[len(header):]
+        header_tokens = sum(self.counter.count(line) + 1 for line in header)
+        if header_tokens > limit // 2:
+            header, header_tokens = [], 0
+
+        pieces = []
+        current: List[str] = []
+        used = header_tokens
+        for line, tokens in self._fit_lines(body_lines, limit - header_tokens):
+            if current and used + tokens > limit:
+                pieces.append(("\n".join(header + current), used))
+                current, used = [], header_tokens
+            current.append(line)
+            used += tokens
+        if current:
+            pieces.append(("\n".join(header + current), used))
+        return pieces
+
+    def _fit_lines(self, lines: List[str], max_tokens: int) -> List[tuple]:
+        """(line, tokens incl. newline) pairs, splitting lines over max_tokens at spaces."""
+        fitted = []
+        for line in lines:
+            tokens = self.counter.count(line) + 1
+            if tokens <= max_tokens:
+                fitted.append((line, tokens))
+                continue
+
+            current: List[str] = []
+            used = 1
+            for word in line.split(" "):
+                word_tokens = self.counter.count(word) + 1
+                if word_tokens > max_tokens:
+                    # A single word over the limit is cut into slices
+                    if current:
+                        fitted.append((" ".join(current), used))
+                        current, used = [], 1
+                    fitted.extend(self._slice_text(word, max_tokens))
+                    continue
+                if current and used + word_tokens > max_tokens:
+                    fitted.append((" ".join(current), used))
+                    current, used = [], 1
+                current.append(word)
+                used += word_tokens
+            if current:
+                fitted.append((" ".join(current), used))
+        return fitted
+
+    def _slice_text(self, text: str, max_tokens: int) -> List[tuple]:
+        """Cut text without spaces into slices of at most max_tokens (incl. newline)."""
+        slices = []
+        size = max(1, max_tokens - 1)
+        while text:
+            piece = text[:size]
+            while len(piece) > 1 and self.counter.count(piece) + 1 > max_tokens:
+                piece = piece[:len(piece) // 2]
+            slices.append((piece, self.counter.count(piece) + 1))
+            text = text[len(piece):]
+        return slices
+
+    def split_blocks(self, body: str) -> List[ContentBlock]:
+        """
+        Split a body into scored paragraph and table blocks.
+
+        Args:
+            body: Email body
+
+        Returns:
+            Non-empty blocks in original order
+        """
+        blocks = []
+        for text in _BLOCK_SPLIT.split(body):
+            text = text.strip("\n")
+            if not text.strip():
+                continue
+            index = len(blocks)
+            is_table = bool(_TABLE_HEADER.match(text.lstrip()))
+            blocks.append(ContentBlock(
+                index=index,
+                text=text,
+                tokens=self.counter.count(text),
+                score=self.score_block(text, index, is_table),
+                is_table=is_table
+            ))
+        return blocks
+
+    def score_block(self, text: str, index: int = 0, is_table: bool = False) -> float:
+        """
+        Score a block's relevance to scheme extraction.
+
+        Args:
+            text: Block text
+            index: Position of the block in the body
+            is_table: Whether the block is a table
+
+        Returns:
+            Relevance score (higher is more relevant)
+        """
+        score = (
+            2.0 * len(_SCHEME_TERMS.findall(text))
+            + 3.0 * len(_DATE.findall(text))
+            + 1.5 * len(_AMOUNT.findall(text))
+        )
+        if is_table:
+            score += 5.0
+
+        boilerplate = len(_BOILERPLATE.findall(text))
+        score -= 3.0 * boilerplate
+
+        # Earlier content (latest message, first pages) matters more
+        score += max(0.0, 3.0 - 0.25 * index)
+
+        # Page markers alone carry no information
+        if _PAGE_MARKER.match(text) and len(text.splitlines()) == 1:
+            score = 0.0
+
+        return score
+
+    def _select(self, blocks: List[ContentBlock]) -> dict:
+        """
+        Choose blocks by relevance per token; returns index -> tokens kept.
+
+        Whole blocks are packed first so one oversized table cannot crowd
+        out short, dense paragraphs; leftover budget then goes to the head
+        of the best block that did not fit.
+        """
+        remaining = self.token_budget
+        selected = {}
+
+        ranked = sorted(
+            (b for b in blocks if b.index == 0 or b.score > 0),
+            key=self._rank
+        )
+
+        skipped = []
+        for block in ranked:
+            if block.tokens <= remaining:
+                selected[block.index] = block.tokens
+                remaining -= block.tokens
+            else:
+                skipped.append(block)
+
+        if skipped and remaining >= MIN_PARTIAL_TOKENS:
+            # Keep the head of the best oversized block (table header and first rows)
+            selected[skipped[0].index] = remaining
+
+        return selected
+
+    @staticmethod
+    def _rank(block: ContentBlock) -> tuple:
+        """Sort key putting the most valuable blocks per token first."""
+        # The opening block carries subject/headers and always ranks first
+        return (block.index != 0, -block.score / max(1, block.tokens), block.index)
+
+    def _fit(self, blocks: List[ContentBlock], selected: dict) -> str:
+        """
+        Join selected blocks, trimming until the joined text fits the budget.
+
+        Selection counts block tokens only; separators and omission markers
+        added by the join can push the result over, so the lowest-ranked
+        block is dropped until it fits (the last one left is cut shorter).
+        """
+        while True:
+            packed = self._join(blocks, selected)
+            excess = self.counter.count(packed) - self.token_budget
+            if excess <= 0 or not selected:
+                return packed
+
+            if len(selected) > 1:
+                lowest = max(selected, key=lambda i: self._rank(blocks[i]))
+                del selected[lowest]
+            else:
+                index, kept = next(iter(selected.items()))
+                if kept - excess > 0:
+                    selected[index] = kept - excess
+                else:
+                    del selected[index]
+
+    def _join(self, blocks: List[ContentBlock], selected: dict) -> str:
+        """Join selected blocks in order, marking gaps."""
+        parts = []
+        previous = -1
+        for block in blocks:
+            if block.index not in selected:
+                continue
+            if block.index != previous + 1 and parts:
+                parts.append(OMISSION_MARKER)
+
+            text = block.text
+            if selected[block.index] < block.tokens:
+                text = self._truncate_lines(text, selected[block.index])
+            parts.append(text)
+            previous = block.index
+
+        if previous != len(blocks) - 1:
+            parts.append(OMISSION_MARKER)
+        return "\n\n".join(parts)
+
+    def _truncate_lines(self, text: str, max_tokens: int) -> str:
+        """Keep whole leading lines of text within max_tokens."""
+        kept = []
+        used = 0
+        for line in text.splitlines():
+            tokens = self.counter.count(line) + 1
+            if used + tokens > max_tokens:
+                break
+            kept.append(line)
+            used += tokens
+        kept.append(OMISSION_MARKER)
+        return "\n".join(kept)
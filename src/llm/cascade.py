@@ -0,0 +1,133 @@
+"""Cascade routing: try a small model first, escalate to a larger one when unsure."""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CascadeTier:
+    """One model tier of the cascade."""
+
+    name: str
+    extractor: Any
+    llm: Any = None
+    input_cost_per_1m: float = 0.0
+    output_cost_per_1m: float = 0.0
+    calls: int = 0
+    accepted: int = 0
+    escalations: Dict[str, int] = field(default_factory=dict)
+
+
+class CascadeExtractor:
+    """
+    Route each email through extractor tiers ordered from cheapest to largest.
+
+    A tier's response is accepted unless the call failed, its JSON could not
+    be parsed, a scheme asked for escalation, or the confidence the model
+    reported is below min_confidence. An empty scheme list is accepted (most
+    mail has no scheme), and responses without a reported confidence are
+    not escalated for it. The last tier's response is always returned.
+    Exposes the same extract() interface as the extractors it wraps.
+    """
+
+    def __init__(self, tiers: List[CascadeTier], min_confidence: float = 0.8):
+        """
+        Initialize cascade extractor.
+
+        Args:
+            tiers: Tiers ordered from cheapest to most capable
+            min_confidence: Lowest average scheme confidence accepted below the last tier
+        """
+        if not tiers:
+            raise ValueError("Cascade needs at least one tier")
+
+        self.tiers = tiers
+        self.min_confidence = min_confidence
+        self._lock = threading.Lock()
+
+    def extract(self, email_subject: str, email_body: str) -> LLMResponse:
+        """
+        Extract schemes, escalating through tiers until a response is accepted.
+
+        Args:
+            email_subject: Email subject line
+            email_body: Full email body with tables
+
+        Returns:
+            LLMResponse from the first accepted tier (or the last tier)
+        """
+        response = None
+        for position, tier in enumerate(self.tiers):
+            response = tier.extractor.extract(email_subject, email_body)
+            is_last = position == len(self.tiers) - 1
+            reason = None if is_last else self.escalation_reason(response)
+
+            with self._lock:
+                tier.calls += 1
+                if reason is None:
+                    tier.accepted += 1
+                else:
+                    tier.escalations[reason] = tier.escalations.get(reason, 0) + 1
+
+            if reason is None:
+                break
+            logger.info(
+                f"Escalating from {tier.name} tier ({reason}): {email_subject[:60]}"
+            )
+
+        return response
+
+    def escalation_reason(self, response: LLMResponse) -> Optional[str]:
+        """
+        Why a response should be escalated to the next tier.
+
+        Args:
+            response: Response from a tier
+
+        Returns:
+            Reason label, or None if the response is accepted
+        """
+        if response.error is not None:
+            return "error"
+        if response.parse_failed:
+            return "parse_failed"
+        if response.needs_escalation:
+            return "needs_escalation"
+        confidence = response.reported_confidence
+        if confidence is not None and confidence < self.min_confidence:
+            return "low_confidence"
+        return None
+
+    def get_tier_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-tier routing and cost statistics.
+
+        Returns:
+            Mapping of tier name to calls, accepted responses, hit rate,
+            escalation reasons, token usage and cost
+        """
+        stats = {}
+        with self._lock:
+            for tier in self.tiers:
+                entry = {
+                    "calls": tier.calls,
+                    "accepted": tier.accepted,
+                    "hit_rate": tier.accepted / tier.calls if tier.calls else 0.0,
+                    "escalations": dict(tier.escalations),
+                }
+                if tier.llm is not None:
+                    entry["model"] = tier.llm.model_name
+                    usage = tier.llm.get_usage_stats()
+                    entry["usage"] = usage
+                    entry["cost"] = (
+                        usage["prompt_tokens"] / 1_000_000 * tier.input_cost_per_1m
+                        + usage["completion_tokens"] / 1_000_000 * tier.output_cost_per_1m
+                    )
+                stats[tier.name] = entry
+        return stats
@@ -6,13 +6,16 @@ while maintaining DSPy structure and logging.
 
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
 
 import dspy
 
 from src.config import ExtractionConfig
+from src.llm.budget import InputBudgeter
+from src.llm.scheme_merge import merge_schemes
+from src.llm.structured_output import parse_json_tolerant, schemes_response_format
 from src.models import LLMResponse, SchemeHeader
 from pydantic import ValidationError
 
@@ -39,9 +42,19 @@ class DSPySchemeExtractor:
         # Configure DSPy
         dspy.settings.configure(lm=llm)
         
+        # Fit bodies into the token budget by relevance, not by position
+        self.budgeter = InputBudgeter(config.llm_input_token_budget)
+        
         # Initialize DSPy ChainOfThought module with Expert Signature
         self.extract_module = dspy.ChainOfThought(ExpertSchemeExtractionSignature)
         
+        # Structured mode: JSON adapter plus a response schema for the API
+        self.response_format = None
+        self.adapter = None
+        if config.llm_structured_output:
+            self.response_format = schemes_response_format()
+            self.adapter = dspy.JSONAdapter()
+        
         logger.info(f"✓ Initialized DSPy CoT extractor (model: {llm.model_name})")
     
     def extract(
@@ -49,12 +62,78 @@ class DSPySchemeExtractor:
         email_subject: str,
         email_body: str
     ) -> LLMResponse:
-        """Extract scheme headers using expert-engineered prompt via DSPy with CoT.
+        """Extract scheme headers, chunking bodies over the token budget if enabled.
         
         Args:
             email_subject: Email subject line
             email_body: Full email body with tables
             
+        Returns:
+            LLMResponse with extracted schemes and CoT reasoning
+        """
+        if self.config.llm_chunked_extraction:
+            chunks = self.budgeter.chunk(
+                email_body, overlap_tokens=self.config.llm_chunk_overlap_tokens
+            )
+            if len(chunks) > 1:
+                return self._extract_chunked(email_subject, chunks)
+        
+        return self._extract_single(email_subject, email_body)
+    
+    def _extract_chunked(self, email_subject: str, chunks: List[str]) -> LLMResponse:
+        """Map-reduce extraction: extract each chunk, then merge schemes.
+        
+        Chunks run one after another: the caller already runs emails
+        llm_max_concurrency at a time, and nesting another pool here would
+        multiply the number of in-flight requests.
+        
+        Args:
+            email_subject: Email subject line
+            chunks: Body chunks from InputBudgeter.chunk()
+            
+        Returns:
+            LLMResponse with deduplicated schemes from all chunks; error is set
+            if any chunk failed so the email is retried as a whole
+        """
+        logger.info(f"Chunked extraction: {len(chunks)} chunks for {email_subject[:60]}")
+        
+        # Chunks already fit the budget; packing them again could drop blocks
+        responses = [
+            self._extract_single(email_subject, chunk, pack=False) for chunk in chunks
+        ]
+        
+        schemes = merge_schemes([s for r in responses for s in r.schemes])
+        errors = [
+            f"chunk {i}: {r.error}" for i, r in enumerate(responses, 1) if r.error is not None
+        ]
+        
+        return LLMResponse(
+            schemes=schemes,
+            raw_response="\n\n".join(r.raw_response or "" for r in responses),
+            tokens_used=self.llm.get_usage_stats().get("total_tokens"),
+            model_used=self.llm.model_name,
+            reasoning="\n\n".join(
+                f"[Chunk {i}/{len(responses)}]\n{r.reasoning or ''}"
+                for i, r in enumerate(responses, 1)
+            ),
+            cot_steps=[],
+            error=(f"{len(errors)}/{len(chunks)} chunks failed: " + "; ".join(errors)) if errors else None,
+            parse_failed=any(r.parse_failed for r in responses)
+        )
+    
+    def _extract_single(
+        self,
+        email_subject: str,
+        email_body: str,
+        pack: bool = True
+    ) -> LLMResponse:
+        """Extract scheme headers using expert-engineered prompt via DSPy with CoT.
+        
+        Args:
+            email_subject: Email subject line
+            email_body: Email body (packed into the token budget if too long)
+            pack: Pack the body into the token budget (False for chunks)
+            
         Returns:
             LLMResponse with extracted schemes and CoT reasoning
         """
@@ -68,10 +147,19 @@ class DSPySchemeExtractor:
             logger.debug(f"Input Subject: {email_subject}")
             logger.debug(f"Input Body Length: {len(email_body)}")
             
-            prediction = self.extract_module(
-                mail_subject=email_subject,
-                mail_body=email_body[:15000]  # Truncate to avoid context limits
-            )
+            # Bind this extractor's LM for the call; other extractors (e.g. cascade
+            # tiers) may share the DSPy settings
+            context = {"lm": self.llm}
+            call_config = {}
+            if self.adapter is not None:
+                context["adapter"] = self.adapter
+                call_config["response_format"] = self.response_format
+            with dspy.context(**context):
+                prediction = self.extract_module(
+                    mail_subject=email_subject,
+                    mail_body=self.budgeter.pack(email_body) if pack else email_body,
+                    config=call_config
+                )
             
             # Extract reasoning and JSON response
             reasoning_text = prediction.reasoning
@@ -91,6 +179,8 @@ class DSPySchemeExtractor:
             
             # Parse and validate JSON
             schemes = self._parse_schemes_json(response_text)
+            parse_failed = schemes is None
+            schemes = schemes or []
             
             # Get usage stats
             usage_stats = self.llm.get_usage_stats()
@@ -109,7 +199,8 @@ class DSPySchemeExtractor:
                 tokens_used=usage_stats.get("total_tokens"),
                 model_used=self.llm.model_name,
                 reasoning=reasoning_text,
-                cot_steps=[]
+                cot_steps=[],
+                parse_failed=parse_failed
             )
             
         except Exception as e:
@@ -119,7 +210,8 @@ class DSPySchemeExtractor:
                 raw_response=str(e),
                 model_used=self.llm.model_name,
                 reasoning=f"Extraction failed: {str(e)}",
-                cot_steps=[]
+                cot_steps=[],
+                error=str(e)
             )
     
     def _log_field_reasoning(self, reasoning_text: str):
@@ -149,30 +241,21 @@ class DSPySchemeExtractor:
     
     # _build_extraction_prompt is no longer needed as it's in the Signature docstring
     
-    def _parse_schemes_json(self, json_str: str) -> List[SchemeHeader]:
+    def _parse_schemes_json(self, json_str: str) -> Optional[List[SchemeHeader]]:
         """Parse and validate schemes JSON with 21 fields.
         
         Args:
             json_str: Raw JSON string from LLM
             
         Returns:
-            List of SchemeHeader objects
+            List of SchemeHeader objects, or None if the output could not be
+            parsed (invalid JSON, unexpected structure, or no valid scheme)
         """
         try:
-            # Clean markdown if present
-            cleaned = json_str.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-            cleaned = cleaned.strip()
-            
-            logger.debug(f"Cleaned JSON length: {len(cleaned)} chars")
-            
-            # Parse JSON
-            data = json.loads(cleaned)
+            # Fenced, truncated or otherwise malformed output is repaired locally
+            data, repaired = parse_json_tolerant(json_str)
+            if repaired:
+                logger.warning("Schemes JSON was malformed; parsed a repaired copy")
             
             # Handle list output (e.g. [{"scheme_name": ...}])
             if isinstance(data, list):
@@ -187,11 +270,11 @@ class DSPySchemeExtractor:
                     data = {"schemes": [data]}
                 else:
                     logger.warning(f"JSON missing 'schemes' key. Keys found: {list(data.keys())}")
-                    return []
+                    return None
             
             if "schemes" not in data or not isinstance(data["schemes"], list):
                 logger.error(f"Invalid JSON structure: {type(data)}")
-                return []
+                return None
             
             # Parse each scheme
             schemes = []
@@ -210,15 +293,17 @@ class DSPySchemeExtractor:
                     continue
             
             logger.info(f"Successfully parsed {len(schemes)}/{len(data['schemes'])} schemes")
+            if data["schemes"] and not schemes:
+                return None
             return schemes
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Invalid JSON: {e}")
             logger.debug(f"Raw response: {json_str[:1000]}...")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Parsing error: {e}", exc_info=True)
-            return []
+            return None
     
     def _map_to_scheme_header(self, data: Dict[str, Any]) -> SchemeHeader:
         """Map JSON data to SchemeHeader model with 21 fields.
@@ -290,9 +375,9 @@ class DSPySchemeExtractor:
             scheme_document=data.get("scheme_document", "No"),
             best_bet=data.get("best_bet", "No"),
             
-            # Legacy fields (optional)
-            confidence=data.get("confidence", 0.7),
-            needs_escalation=data.get("needs_escalation", False)
+            # Legacy fields (optional); confidence keeps its default unless the model reported one
+            needs_escalation=data.get("needs_escalation", False),
+            **({"confidence": data["confidence"]} if data.get("confidence") is not None else {})
         )
     
     def _save_cot_reasoning_log(
@@ -319,10 +404,12 @@ class DSPySchemeExtractor:
         filename = f"{safe_subject}_{timestamp}_cot.json"
         filepath = self.config.cot_log_dir / filename
         
-        # Get last LLM call metadata from history
+        # Get this thread's last LLM call (history[-1] may belong to another thread)
         llm_metadata = {}
-        if hasattr(self.llm, 'history') and len(self.llm.history) > 0:
+        last_call = getattr(self.llm, 'last_call', None)
+        if last_call is None and getattr(self.llm, 'history', None):
             last_call = self.llm.history[-1]
+        if last_call:
             llm_metadata = {
                 "model": last_call.get("model"),
                 "temperature": last_call.get("temperature"),
@@ -0,0 +1,341 @@
+"""Targeted repair of missing or invalid scheme fields with narrow signatures.
+
+Instead of re-running the full expert extraction when a scheme's dates,
+financial terms or vendor are missing or malformed, only the failing field
+group is re-asked with its small signature over a trimmed context. Values
+the expert prompt prescribes for absent information ("Not Specified",
+"Not Applicable") count as answered, and identical re-asks for several
+schemes of one email are sent once.
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import dspy
+
+from src.config import ExtractionConfig
+from src.llm.budget import InputBudgeter
+from src.llm.signatures import (
+    DateExtractionSignature,
+    FinancialExtractionSignature,
+    VendorExtractionSignature,
+)
+from src.llm.structured_output import parse_json_tolerant
+from src.models import SchemeHeader
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = "%d/%m/%Y"
+DISCOUNT_TYPES = {"Percentage of NLC", "Percentage of MRP", "Absolute"}
+# Answers the expert prompt prescribes when a value is absent
+ABSENT_VALUES = {"not specified", "not applicable", "n/a", "na"}
+
+_DDMMYYYY = re.compile(r"^\d{2}/\d{2}/\d{4}$")
+
+
+def parse_scheme_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a DD/MM/YYYY scheme date.
+
+    Args:
+        value: Date string
+
+    Returns:
+        datetime, or None if missing or invalid
+    """
+    if not value or not _DDMMYYYY.match(value.strip()):
+        return None
+    try:
+        return datetime.strptime(value.strip(), DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def to_scheme_date(value: Optional[str]) -> Optional[str]:
+    """
+    Convert a YYYY-MM-DD (or DD/MM/YYYY) date to the scheme's DD/MM/YYYY format.
+
+    Args:
+        value: Date from a narrow signature
+
+    Returns:
+        DD/MM/YYYY string, or None if the value is not a valid date
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    for fmt in ("%Y-%m-%d", DATE_FORMAT):
+        try:
+            return datetime.strptime(value, fmt).strftime(DATE_FORMAT)
+        except ValueError:
+            continue
+    return None
+
+
+def is_absent_answer(value: Optional[str]) -> bool:
+    """
+    Check whether a field holds the prompt's answer for absent information.
+
+    Args:
+        value: Field value
+
+    Returns:
+        True for "Not Specified", "Not Applicable" and similar
+    """
+    return isinstance(value, str) and value.strip().lower() in ABSENT_VALUES
+
+
+def _needs_date(value: Optional[str]) -> bool:
+    """A date field needs repair if it is neither a valid date nor an absent answer."""
+    return parse_scheme_date(value) is None and not is_absent_answer(value)
+
+
+def _needs_amount(value: Optional[str]) -> bool:
+    """An amount field needs repair if it is neither a number nor an absent answer."""
+    if is_absent_answer(value):
+        return False
+    try:
+        float(str(value).replace(",", "").strip())
+        return False
+    except ValueError:
+        return True
+
+
+def _format_amount(value: Optional[float]) -> Optional[str]:
+    """Render a numeric amount without a trailing .0."""
+    if value is None:
+        return None
+    return f"{value:g}"
+
+
+class FieldRepairer:
+    """Re-ask only the failing field groups of a scheme and patch them in."""
+
+    def __init__(self, llm: dspy.LM, config: ExtractionConfig):
+        """
+        Initialize field repairer.
+
+        Args:
+            llm: DSPy LM used for the repair calls
+            config: Application configuration
+        """
+        self.llm = llm
+        self.budgeter = InputBudgeter(config.llm_repair_token_budget)
+
+        self.date_module = dspy.Predict(DateExtractionSignature)
+        self.financial_module = dspy.Predict(FinancialExtractionSignature)
+        self.vendor_module = dspy.Predict(VendorExtractionSignature)
+
+    def find_issues(self, scheme: SchemeHeader) -> Dict[str, List[str]]:
+        """
+        Find missing or invalid fields, grouped by repair signature.
+
+        Args:
+            scheme: Extracted scheme
+
+        Returns:
+            Mapping of group ("dates", "financial", "vendor") to failing fields
+        """
+        issues: Dict[str, List[str]] = {}
+
+        start = parse_scheme_date(scheme.start_date)
+        end = parse_scheme_date(scheme.end_date)
+        dates = []
+        if _needs_date(scheme.start_date):
+            dates.append("start_date")
+        # Event schemes may run for a single day without an end date
+        if _needs_date(scheme.end_date) and scheme.scheme_period != "Event":
+            dates.append("end_date")
+        if start is not None and end is not None and end < start:
+            dates.extend(["start_date", "end_date"])
+        if scheme.scheme_subtype == "PDC" and _needs_date(scheme.price_drop_date):
+            dates.append("price_drop_date")
+        if dates:
+            issues["dates"] = dates
+
+        financial = []
+        if (
+            scheme.discount_type is not None
+            and scheme.discount_type not in DISCOUNT_TYPES
+            and not is_absent_answer(scheme.discount_type)
+        ):
+            financial.append("discount_type")
+        if scheme.scheme_type == "ONE_OFF" and _needs_amount(scheme.brand_support_absolute):
+            financial.append("brand_support_absolute")
+        if financial:
+            issues["financial"] = financial
+
+        if not (scheme.vendor_name or "").strip():
+            issues["vendor"] = ["vendor_name"]
+
+        return issues
+
+    def repair(self, scheme: SchemeHeader, subject: str, body: str) -> SchemeHeader:
+        """
+        Repair a scheme's failing fields; valid fields are never changed.
+
+        Args:
+            scheme: Extracted scheme
+            subject: Email subject line
+            body: Email body the scheme was extracted from
+
+        Returns:
+            Patched copy of the scheme (or the scheme itself if nothing failed)
+        """
+        return self.repair_all([scheme], subject, body)[0]
+
+    def repair_all(self, schemes: List[SchemeHeader], subject: str, body: str) -> List[SchemeHeader]:
+        """
+        Repair the schemes of one email, sending each distinct re-ask once.
+
+        Args:
+            schemes: Schemes extracted from the email
+            subject: Email subject line
+            body: Email body the schemes were extracted from
+
+        Returns:
+            Schemes in the same order, patched where possible
+        """
+        issues = [self.find_issues(scheme) for scheme in schemes]
+        if not any(issues):
+            return list(schemes)
+
+        context = self.budgeter.pack(body)
+        text, tables = self._split_tables(context)
+        memo: Dict[tuple, Any] = {}
+
+        return [
+            self._repair_scheme(scheme, scheme_issues, subject, context, text, tables, memo)
+            if scheme_issues else scheme
+            for scheme, scheme_issues in zip(schemes, issues)
+        ]
+
+    def _repair_scheme(
+        self,
+        scheme: SchemeHeader,
+        issues: Dict[str, List[str]],
+        subject: str,
+        context: str,
+        text: str,
+        tables: str,
+        memo: Dict[tuple, Any]
+    ) -> SchemeHeader:
+        """Patch one scheme's failing field groups."""
+        scheme_context = (
+            f"Subject: {subject}\n"
+            f"Scheme: {scheme.scheme_name or ''}\n"
+            f"Description: {scheme.scheme_description or ''}"
+        )
+
+        updates = {}
+        try:
+            with dspy.context(lm=self.llm):
+                if "dates" in issues:
+                    updates.update(self._repair_dates(issues["dates"], context, scheme_context, memo))
+                if "financial" in issues:
+                    updates.update(self._repair_financial(
+                        issues["financial"], f"{scheme_context}\n\n{text}", tables, memo
+                    ))
+                if "vendor" in issues:
+                    # The vendor is the same for every scheme of an email
+                    updates.update(self._repair_vendor(f"Subject: {subject}\n\n{text}", tables, memo))
+        except Exception as e:
+            logger.warning(f"Field repair failed for '{scheme.scheme_name}': {e}")
+
+        if "start_date" in updates or "end_date" in updates:
+            start = updates.get("start_date", scheme.start_date)
+            end = updates.get("end_date", scheme.end_date)
+            start_date, end_date = parse_scheme_date(start), parse_scheme_date(end)
+            if start_date and end_date and end_date < start_date:
+                # Patched dates contradict each other; keep the originals
+                updates.pop("start_date", None)
+                updates.pop("end_date", None)
+            elif start_date and end_date:
+                updates["duration"] = f"{start} to {end}"
+
+        if updates:
+            logger.info(f"Repaired {sorted(updates)} for '{scheme.scheme_name}'")
+            return scheme.model_copy(update=updates)
+
+        logger.info(f"Could not repair {issues} for '{scheme.scheme_name}'")
+        return scheme
+
+    def _predict(self, module: dspy.Predict, memo: Dict[tuple, Any], **inputs: str) -> Any:
+        """Run a narrow signature once per distinct input within an email."""
+        key = (id(module), tuple(sorted(inputs.items())))
+        if key not in memo:
+            try:
+                memo[key] = module(**inputs)
+            except Exception as e:
+                memo[key] = e
+        if isinstance(memo[key], Exception):
+            raise memo[key]
+        return memo[key]
+
+    def _repair_dates(
+        self,
+        fields: List[str],
+        context: str,
+        scheme_context: str,
+        memo: Dict[tuple, Any]
+    ) -> Dict[str, str]:
+        """Re-ask scheme dates and convert them to DD/MM/YYYY."""
+        prediction = self._predict(self.date_module, memo, text_content=context, context=scheme_context)
+
+        candidates = {
+            "start_date": to_scheme_date(prediction.starting_at) or to_scheme_date(prediction.duration_start_date),
+            "end_date": to_scheme_date(prediction.ending_at) or to_scheme_date(prediction.duration_end_date),
+            "price_drop_date": to_scheme_date(prediction.price_drop_date),
+        }
+
+        return {
+            name: value for name, value in candidates.items()
+            if name in fields and value is not None
+        }
+
+    def _repair_financial(
+        self,
+        fields: List[str],
+        text: str,
+        tables: str,
+        memo: Dict[tuple, Any]
+    ) -> Dict[str, str]:
+        """Re-ask financial terms and map them to the scheme vocabulary."""
+        prediction = self._predict(self.financial_module, memo, text_content=text, table_data=tables)
+
+        updates = {}
+        # Only FLAT maps unambiguously; a percentage could be of NLC or MRP
+        if "discount_type" in fields and str(prediction.discount_type or "").upper() == "FLAT":
+            updates["discount_type"] = "Absolute"
+
+        if "brand_support_absolute" in fields:
+            amount = _format_amount(prediction.brand_support_absolute)
+            if amount is not None:
+                updates["brand_support_absolute"] = amount
+
+        return updates
+
+    def _repair_vendor(self, text: str, tables: str, memo: Dict[tuple, Any]) -> Dict[str, str]:
+        """Re-ask the vendor and take the first named one."""
+        prediction = self._predict(self.vendor_module, memo, table_data=tables, text_content=text)
+        try:
+            vendors, _ = parse_json_tolerant(prediction.vendors_json or "")
+        except ValueError:
+            return {}
+
+        if isinstance(vendors, dict):
+            vendors = [vendors]
+        for vendor in vendors if isinstance(vendors, list) else []:
+            name = vendor.get("name") if isinstance(vendor, dict) else vendor
+            if isinstance(name, str) and name.strip():
+                return {"vendor_name": name.strip()}
+        return {}
+
+    def _split_tables(self, context: str) -> tuple:
+        """Split trimmed context into (text, tables) for the narrow signatures."""
+        text_blocks, table_blocks = [], []
+        for block in self.budgeter.split_blocks(context):
+            (table_blocks if block.is_table else text_blocks).append(block.text)
+        return "\n\n".join(text_blocks), "\n\n".join(table_blocks)
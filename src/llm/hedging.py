@@ -0,0 +1,118 @@
+"""Hedged requests: duplicate a slow call and keep whichever finishes first."""
+
+import logging
+import math
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeOutcome:
+    """What happened during a hedged call."""
+
+    fired: bool = False
+    hedge_won: bool = False
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies for percentile estimates."""
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window: Number of most recent latencies to keep
+        """
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_seconds: float) -> None:
+        """
+        Record a completed call's latency.
+
+        Args:
+            latency_seconds: Observed latency
+        """
+        with self._lock:
+            self._samples.append(latency_seconds)
+
+    def percentile(self, pct: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Nearest-rank percentile of recorded latencies.
+
+        Args:
+            pct: Percentile in (0, 100]
+            min_samples: Return None until at least this many samples exist
+
+        Returns:
+            Latency in seconds, or None if there are too few samples
+        """
+        with self._lock:
+            if len(self._samples) < max(1, min_samples):
+                return None
+            ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+def run_hedged(
+    executor: Executor,
+    call: Callable[[], T],
+    hedge_after: float,
+    on_loser: Callable[[Future], None]
+) -> Tuple[T, HedgeOutcome]:
+    """
+    Run a call, sending a duplicate if it has not finished after hedge_after seconds.
+
+    The first copy to succeed wins. The other copy is cancelled if it has
+    not started yet; otherwise it runs to completion in the background and
+    on_loser is called with its future so its cost can be accounted for.
+
+    Args:
+        executor: Executor that runs both copies
+        call: Zero-argument callable performing the request
+        hedge_after: Seconds to wait before sending the duplicate
+        on_loser: Callback receiving the losing copy's future
+
+    Returns:
+        Tuple of (winning result, HedgeOutcome)
+
+    Raises:
+        Exception: The first copy's error if both copies fail
+    """
+    primary = executor.submit(call)
+    done, _ = wait([primary], timeout=hedge_after)
+    if done:
+        return primary.result(), HedgeOutcome()
+
+    logger.info(f"Call still running after {hedge_after:.1f}s; sending hedged duplicate")
+    hedge = executor.submit(call)
+    outcome = HedgeOutcome(fired=True)
+
+    pending = {primary, hedge}
+    first_error: Optional[BaseException] = None
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        # Prefer the primary if both finished together
+        for future in sorted(done, key=lambda f: f is hedge):
+            if future.exception() is not None:
+                first_error = first_error or future.exception()
+                continue
+
+            loser = hedge if future is primary else primary
+            if not loser.cancel():
+                loser.add_done_callback(on_loser)
+
+            outcome.hedge_won = future is hedge
+            return future.result(), outcome
+
+    raise first_error
@@ -2,13 +2,20 @@
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 
 import dspy
 
+from src.llm.hedging import LatencyTracker, run_hedged
 from src.llm.llm_logger import LLMLogger
+from src.llm.resilience import CircuitBreaker, RETRYABLE_STATUS_CODES, backoff_delay, parse_retry_after
+from src.llm.response_cache import LLMResponseCache
+from src.rate_limiter import TokenBucketRateLimiter, estimate_message_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +41,17 @@ class OpenRouterLLM(dspy.LM):
         enable_logging: bool = True,
         llm_logger: Optional[LLMLogger] = None,
         input_cost_per_1m: float = 0.50,
-        output_cost_per_1m: float = 1.50
+        output_cost_per_1m: float = 1.50,
+        pool_size: int = 10,
+        response_cache: Optional[LLMResponseCache] = None,
+        bypass_cache: bool = False,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+        max_retry_delay: float = 60.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20
     ):
         """
         Initialize OpenRouter LLM client.
@@ -53,6 +70,17 @@ class OpenRouterLLM(dspy.LM):
             llm_logger: Optional LLMLogger instance (creates new if None)
             input_cost_per_1m: Cost per 1M input tokens
             output_cost_per_1m: Cost per 1M output tokens
+            pool_size: Keep-alive connections kept open to the API host
+            response_cache: Optional cache of deterministic (temperature 0) responses
+            bypass_cache: Skip cache reads but still store fresh responses
+            max_retries: Retries after the first attempt for throttling/transient errors
+            retry_delay: Base delay in seconds for jittered exponential backoff
+            max_retry_delay: Upper bound on a single backoff delay in seconds
+            circuit_breaker: Optional breaker that pauses dispatch when upstream fails
+            rate_limiter: Optional shared request/token budget consulted before each attempt
+            hedge_percentile: Send a duplicate request once a call runs longer than
+                this percentile of recent latencies (None disables hedging)
+            hedge_min_samples: Latencies to observe before hedging starts
         """
         super().__init__(model=model)
         
@@ -76,7 +104,48 @@ class OpenRouterLLM(dspy.LM):
         else:
             self.llm_logger = None
         
+        self.response_cache = response_cache
+        self.bypass_cache = bypass_cache
+        
+        self.max_retries = max(0, max_retries)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        
+        # Hedged requests: both copies run on a dedicated pool
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency_tracker = LatencyTracker()
+        self._hedge_executor = None
+        if hedge_percentile is not None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=max(2, pool_size * 2),
+                thread_name_prefix="llm-hedge"
+            )
+        
+        # Pooled keep-alive session, shared by concurrent calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        
         self.history: List[Dict[str, Any]] = []
+        
+        # Cleared when the API rejects a response_format for this model
+        self.response_format_supported = True
+        
+        # Per-thread view of the latest call, for callers running concurrently
+        self._local = threading.local()
+    
+    @property
+    def last_call(self) -> Optional[Dict[str, Any]]:
+        """History entry of the most recent successful call made on this thread."""
+        return getattr(self._local, "last_call", None)
     
     def __call__(
         self,
@@ -90,7 +159,8 @@ class OpenRouterLLM(dspy.LM):
         Args:
             prompt: Single prompt string (converted to messages)
             messages: List of message dicts with 'role' and 'content'
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (bypass_cache=True forces a network call;
+                response_format is sent as the structured output constraint)
             
         Returns:
             List of response strings (typically single item)
@@ -122,11 +192,6 @@ class OpenRouterLLM(dspy.LM):
             )
         
         # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model_name,
             "messages": messages,
@@ -142,20 +207,53 @@ class OpenRouterLLM(dspy.LM):
         if presence_penalty is not None:
             payload["presence_penalty"] = presence_penalty
         
+        # Structured output schema, unless this model has rejected it before
+        response_format = kwargs.get("response_format")
+        if isinstance(response_format, dict) and self.response_format_supported:
+            payload["response_format"] = response_format
+        
+        # Serve repeated deterministic requests from the response cache
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cacheable(payload):
+            cache_key = self.response_cache.key_for(payload, self.base_url)
+            if not (self.bypass_cache or kwargs.get("bypass_cache", False)):
+                cached = self.response_cache.get(cache_key)
+                if self.enable_logging and self.llm_logger and call_id:
+                    self.llm_logger.log_cache_lookup(call_id, hit=cached is not None)
+                if cached is not None:
+                    return [self._record_cache_hit(cached, payload, call_id)]
+        
         # Start timing
         start_time = time.time()
         
         try:
             logger.debug(f"Calling OpenRouter API with model: {self.model_name}")
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
-            )
+            # Reserve the worst case; unused tokens are returned once usage is known
+            reserved_tokens = estimate_message_tokens(messages) + max_tokens
+            response = self._send(payload, reserved_tokens, call_id)
             
-            # Calculate latency
+            if "response_format" in payload and self._rejects_response_format(response):
+                logger.warning(
+                    f"{self.model_name} rejected response_format; "
+                    f"falling back to prompt-only JSON for this client"
+                )
+                # The rejected attempt was not billed; return its reservation
+                if self.rate_limiter is not None:
+                    self.rate_limiter.settle(reserved_tokens, 0)
+                self.response_format_supported = False
+                del payload["response_format"]
+                response = self._send(payload, reserved_tokens, call_id)
+            
+            # Retryable statuses were settled by the retry loop; settle other errors here
+            if (
+                not response.ok
+                and response.status_code not in RETRYABLE_STATUS_CODES
+                and self.rate_limiter is not None
+            ):
+                self.rate_limiter.settle(reserved_tokens, 0)
+            
+            # Calculate latency (including any retries)
             latency = time.time() - start_time
             
             response.raise_for_status()
@@ -164,7 +262,10 @@ class OpenRouterLLM(dspy.LM):
             # Extract response text
             if "choices" in result and len(result["choices"]) > 0:
                 response_text = result["choices"][0]["message"]["content"]
-                usage = result.get("usage", {})
+                usage = result.get("usage") or {}
+                
+                if self.rate_limiter is not None:
+                    self.rate_limiter.settle(reserved_tokens, usage.get("total_tokens"))
                 
                 # Store in history with complete metadata
                 history_entry = {
@@ -181,6 +282,11 @@ class OpenRouterLLM(dspy.LM):
                     "call_id": call_id
                 }
                 self.history.append(history_entry)
+                self._local.last_call = history_entry
+                self.latency_tracker.record(latency)
+                
+                if cache_key and response_text:
+                    self.response_cache.put(cache_key, response_text, usage)
                 
                 # Log response if enabled
                 if self.enable_logging and self.llm_logger and call_id:
@@ -275,6 +381,252 @@ class OpenRouterLLM(dspy.LM):
                 )
             raise
     
+    @staticmethod
+    def _rejects_response_format(response: requests.Response) -> bool:
+        """Check whether an HTTP 400 was caused by the structured output constraint."""
+        if response.status_code != 400:
+            return False
+        try:
+            body = response.text.lower()
+        except Exception:
+            return False
+        return "response_format" in body or "json_schema" in body
+    
+    def _send(
+        self,
+        payload: Dict[str, Any],
+        reserved_tokens: int,
+        call_id: Optional[str]
+    ) -> requests.Response:
+        """
+        Send a request, hedging it if it outlives the configured latency percentile.
+        
+        Args:
+            payload: Chat completion request payload
+            reserved_tokens: Tokens to take from the rate limiter per attempt
+            call_id: Call ID from the LLM logger (None if logging is disabled)
+            
+        Returns:
+            The winning response
+        """
+        hedge_after = None
+        if self._hedge_executor is not None:
+            hedge_after = self.latency_tracker.percentile(
+                self.hedge_percentile, min_samples=self.hedge_min_samples
+            )
+        
+        if hedge_after is None:
+            return self._post_with_retries(payload, reserved_tokens)
+        
+        response, outcome = run_hedged(
+            self._hedge_executor,
+            lambda: self._post_with_retries(payload, reserved_tokens),
+            hedge_after,
+            on_loser=lambda future: self._account_hedge_loser(
+                future, payload, reserved_tokens, call_id
+            )
+        )
+        
+        if outcome.fired and self.enable_logging and self.llm_logger and call_id:
+            self.llm_logger.log_hedge(call_id, hedge_won=outcome.hedge_won)
+        
+        return response
+    
+    def _account_hedge_loser(
+        self,
+        future: Future,
+        payload: Dict[str, Any],
+        reserved_tokens: int,
+        call_id: Optional[str]
+    ) -> None:
+        """
+        Record the cost of the losing copy of a hedged request.
+        
+        An in-flight HTTP request cannot be aborted, so the loser still
+        completes and is billed; its usage is added to history and logged
+        as hedge overhead.
+        
+        Args:
+            future: Finished future of the losing copy
+            payload: Request payload
+            reserved_tokens: Tokens the copy took from the rate limiter
+            call_id: Call ID of the hedged call (None if logging is disabled)
+        """
+        try:
+            response = future.result()
+            usage = (response.json().get("usage") or {}) if response.ok else {}
+        except Exception:
+            return
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.settle(reserved_tokens, usage.get("total_tokens", 0))
+        
+        self.history.append({
+            "prompt": payload["messages"],
+            "response": "",
+            "model": self.model_name,
+            "usage": usage,
+            "hedge_loser": True,
+            "temperature": payload["temperature"],
+            "max_tokens": payload["max_tokens"],
+            "call_id": call_id
+        })
+        
+        if self.enable_logging and self.llm_logger and call_id:
+            self.llm_logger.log_response(
+                call_id=f"{call_id}_hedge",
+                model_name=self.model_name,
+                response_text="",
+                usage=usage,
+                latency_seconds=0.0,
+                temperature=payload["temperature"],
+                max_tokens=payload["max_tokens"],
+                input_messages=payload["messages"],
+                hedge=True
+            )
+    
+    def _post_with_retries(
+        self,
+        payload: Dict[str, Any],
+        reserved_tokens: int = 0
+    ) -> requests.Response:
+        """
+        POST a chat completion, retrying throttling and transient failures.
+        
+        Retries 408/429/5xx responses, timeouts and connection errors with
+        jittered exponential backoff, waiting at least as long as any
+        Retry-After header asks. Each attempt first takes its share of the
+        rate limit, then passes the circuit breaker, which pauses dispatch
+        while upstream is failing.
+        
+        Args:
+            payload: Chat completion request payload
+            reserved_tokens: Tokens to take from the rate limiter per attempt
+            
+        Returns:
+            The final response (may carry an error status once retries run out)
+            
+        Raises:
+            requests.exceptions.RequestException: If the last attempt fails to connect
+        """
+        url = f"{self.base_url}/chat/completions"
+        breaker = self.circuit_breaker
+        
+        limiter = self.rate_limiter
+        
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire(reserved_tokens)
+            if breaker is not None:
+                breaker.acquire()
+            
+            retry_after = None
+            try:
+                response = self.session.post(url, json=payload, timeout=self.timeout)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                reason = type(e).__name__
+            except Exception:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return response
+                
+                # Rejected requests are not billed; return their tokens
+                if limiter is not None:
+                    limiter.settle(reserved_tokens, 0)
+                
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt >= self.max_retries:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                reason = f"HTTP {response.status_code}"
+            
+            delay = backoff_delay(attempt, self.retry_delay, self.max_retry_delay, retry_after)
+            logger.warning(
+                f"OpenRouter call failed ({reason}); retrying in {delay:.1f}s "
+                f"(retry {attempt + 1}/{self.max_retries})"
+            )
+            time.sleep(delay)
+    
+    def _record_cache_hit(
+        self,
+        cached: Dict[str, Any],
+        payload: Dict[str, Any],
+        call_id: Optional[str]
+    ) -> str:
+        """
+        Record a cached response in history and the LLM log.
+        
+        No tokens are billed for a hit, so usage is left empty; the original
+        call's usage is kept under 'cached_usage'.
+        
+        Args:
+            cached: Cache entry with 'response' and 'usage'
+            payload: Request payload that was looked up
+            call_id: Call ID from the LLM logger (None if logging is disabled)
+            
+        Returns:
+            Cached response text
+        """
+        response_text = cached["response"]
+        
+        history_entry = {
+            "prompt": payload["messages"],
+            "response": response_text,
+            "model": self.model_name,
+            "usage": {},
+            "cached_usage": cached.get("usage", {}),
+            "cached": True,
+            "temperature": payload["temperature"],
+            "max_tokens": payload["max_tokens"],
+            "top_p": payload.get("top_p"),
+            "frequency_penalty": payload.get("frequency_penalty"),
+            "presence_penalty": payload.get("presence_penalty"),
+            "latency_seconds": 0.0,
+            "call_id": call_id
+        }
+        self.history.append(history_entry)
+        self._local.last_call = history_entry
+        
+        if self.enable_logging and self.llm_logger and call_id:
+            self.llm_logger.log_response(
+                call_id=call_id,
+                model_name=self.model_name,
+                response_text=response_text,
+                usage={},
+                latency_seconds=0.0,
+                temperature=payload["temperature"],
+                max_tokens=payload["max_tokens"],
+                input_messages=payload["messages"],
+                top_p=payload.get("top_p"),
+                frequency_penalty=payload.get("frequency_penalty"),
+                presence_penalty=payload.get("presence_penalty"),
+                cached=True
+            )
+        
+        logger.info(f"LLM response served from cache: {len(response_text)} chars")
+        return response_text
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections and the hedging pool."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.session.close()
+    
+    def __del__(self):
+        """Close the session when the client is destroyed."""
+        if hasattr(self, 'session'):
+            self.session.close()
+    
     def get_usage_stats(self) -> Dict[str, int]:
         """
         Get cumulative token usage statistics.
@@ -296,5 +648,7 @@ class OpenRouterLLM(dspy.LM):
             "prompt_tokens": total_prompt_tokens,
             "completion_tokens": total_completion_tokens,
             "total_tokens": total_tokens,
-            "num_calls": len(self.history)
+            "num_calls": len(self.history),
+            "cached_calls": sum(1 for entry in self.history if entry.get("cached")),
+            "hedge_losers": sum(1 for entry in self.history if entry.get("hedge_loser"))
         }
@@ -10,6 +10,7 @@ This module provides structured logging for all LLM API calls, including:
 
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -54,6 +55,8 @@ class LLMCallMetrics:
     # Status
     success: bool = True
     error_message: Optional[str] = None
+    cached: bool = False
+    hedge: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -88,8 +91,19 @@ class LLMLogger:
         if self.enable_file_logging:
             self.log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Call counter for unique IDs
+        # Call counter for unique IDs (requests may be logged from several threads)
         self.call_counter = 0
+        self._counter_lock = threading.Lock()
+        
+        # Response cache lookups
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Hedged requests and the cost of their losing duplicates
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+        self.hedge_extra_tokens = 0
+        self.hedge_extra_cost = 0.0
         
         logger.info(f"LLM Logger initialized (file logging: {enable_file_logging})")
     
@@ -114,8 +128,10 @@ class LLMLogger:
         Returns:
             Call ID for tracking this request
         """
-        self.call_counter += 1
-        call_id = f"llm_call_{self.call_counter}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        with self._counter_lock:
+            self.call_counter += 1
+            call_number = self.call_counter
+        call_id = f"llm_call_{call_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Create input preview
         if messages:
@@ -144,6 +160,65 @@ class LLMLogger:
         
         return call_id
     
+    def log_cache_lookup(self, call_id: str, hit: bool) -> None:
+        """
+        Record a response cache lookup.
+        
+        Args:
+            call_id: Call ID from log_request
+            hit: Whether the response was served from the cache
+        """
+        with self._counter_lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        
+        logger.info(f"LLM CACHE {'HIT' if hit else 'MISS'} [{call_id}]")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counts for this logger.
+        
+        Returns:
+            Dictionary with hits, misses and hit rate
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / lookups if lookups > 0 else 0.0
+        }
+    
+    def log_hedge(self, call_id: str, hedge_won: bool) -> None:
+        """
+        Record that a duplicate request was sent for a slow call.
+        
+        Args:
+            call_id: Call ID from log_request
+            hedge_won: Whether the duplicate finished first
+        """
+        with self._counter_lock:
+            self.hedges_fired += 1
+            if hedge_won:
+                self.hedge_wins += 1
+        
+        logger.info(f"LLM HEDGE [{call_id}]: {'duplicate' if hedge_won else 'original'} won")
+    
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """
+        Get hedged request counts and the extra cost of losing duplicates.
+        
+        Returns:
+            Dictionary with hedges fired, wins and extra tokens/cost
+        """
+        return {
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+            "hedge_extra_tokens": self.hedge_extra_tokens,
+            "hedge_extra_cost": self.hedge_extra_cost
+        }
+    
     def log_response(
         self,
         call_id: str,
@@ -170,7 +245,8 @@ class LLMLogger:
             max_tokens: Max tokens used
             input_messages: Input messages for context
             error: Error message if call failed
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (top_p, ..., cached=True for cache hits,
+                hedge=True for the losing copy of a hedged request)
         """
         # Extract token counts
         input_tokens = usage.get('prompt_tokens', 0)
@@ -190,12 +266,24 @@ class LLMLogger:
         input_preview = input_text[:200] + "..." if len(input_text) > 200 else input_text
         
         # Log to console
+        cached = kwargs.get('cached', False)
+        hedge = kwargs.get('hedge', False)
+        
+        if hedge:
+            with self._counter_lock:
+                self.hedge_extra_tokens += total_tokens
+                self.hedge_extra_cost += total_cost
+        
         logger.info("="*80)
         logger.info(f"LLM RESPONSE [{call_id}]")
         logger.info("="*80)
         
         if error:
             logger.error(f"Status: FAILED - {error}")
+        elif cached:
+            logger.info("Status: SUCCESS (cached, no tokens billed)")
+        elif hedge:
+            logger.info("Status: HEDGE LOSER (billed, response discarded)")
         else:
             logger.info("Status: SUCCESS")
         
@@ -235,7 +323,9 @@ class LLMLogger:
             input_preview=input_preview,
             output_preview=output_preview,
             success=error is None,
-            error_message=error
+            error_message=error,
+            cached=cached,
+            hedge=hedge
         )
         
         # Save detailed log to file
@@ -323,6 +413,9 @@ class LLMLogger:
         total_cost = 0.0
         total_latency = 0.0
         failed_calls = 0
+        cached_calls = 0
+        hedge_calls = 0
+        hedge_cost = 0.0
         
         for log_file in log_files:
             try:
@@ -337,6 +430,11 @@ class LLMLogger:
                     
                     if not metrics.get('success', True):
                         failed_calls += 1
+                    if metrics.get('cached', False):
+                        cached_calls += 1
+                    if metrics.get('hedge', False):
+                        hedge_calls += 1
+                        hedge_cost += metrics.get('total_cost', 0.0)
                         
             except Exception as e:
                 logger.warning(f"Failed to read log file {log_file}: {e}")
@@ -346,6 +444,9 @@ class LLMLogger:
             "total_calls": total_calls,
             "successful_calls": total_calls - failed_calls,
             "failed_calls": failed_calls,
+            "cached_calls": cached_calls,
+            "hedge_calls": hedge_calls,
+            "hedge_cost": hedge_cost,
             "total_input_tokens": total_input_tokens,
             "total_output_tokens": total_output_tokens,
             "total_tokens": total_input_tokens + total_output_tokens,
@@ -0,0 +1,195 @@
+"""Retry backoff and circuit breaking for upstream LLM API calls."""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient upstream failures
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Compute the wait before the next retry.
+
+    Uses exponential backoff with full jitter so concurrent callers that
+    failed together do not retry together. A server-provided Retry-After
+    is treated as a floor.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base_delay: Delay scale in seconds for the first retry
+        max_delay: Upper bound on the backoff delay in seconds
+        retry_after: Server-requested delay in seconds, if any
+
+    Returns:
+        Seconds to sleep
+    """
+    delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+    if retry_after is not None:
+        # Small jitter on top so throttled callers do not return in lockstep
+        delay = max(delay, retry_after + random.uniform(0, base_delay))
+    return delay
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker shared by concurrent callers.
+
+    Outcomes of recent calls are tracked over a sliding time window. Once
+    at least min_calls have completed in the window and the failure rate
+    reaches the threshold, the circuit opens and acquire() blocks new
+    dispatches for the cooldown period. After the cooldown one probe call
+    is let through: success closes the circuit, failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 60.0,
+        cooldown_seconds: float = 30.0
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_rate_threshold: Failure fraction in the window that opens the circuit
+            min_calls: Minimum outcomes in the window before the rate is evaluated
+            window_seconds: Length of the sliding outcome window
+            cooldown_seconds: How long dispatch pauses once the circuit opens
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._outcomes: deque = deque()
+        self._cond = threading.Condition()
+
+    @property
+    def state(self) -> str:
+        """Current circuit state."""
+        with self._cond:
+            return self._state
+
+    def acquire(self) -> None:
+        """Block until a call may be dispatched."""
+        with self._cond:
+            while True:
+                if self._state == self.CLOSED:
+                    return
+
+                if self._state == self.OPEN:
+                    remaining = self._opened_at + self.cooldown_seconds - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    self._state = self.HALF_OPEN
+                    logger.info("Circuit half-open: sending probe request")
+
+                if not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    return
+
+                # Another thread is probing; wait for its outcome
+                self._cond.wait()
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._cond:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                logger.info("Circuit closed: upstream recovered")
+            self._probe_in_flight = False
+            self._add_outcome(True)
+            self._cond.notify_all()
+
+    def record_failure(self) -> None:
+        """Record a failed call (retryable upstream error)."""
+        with self._cond:
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN:
+                self._open("probe request failed")
+            else:
+                self._add_outcome(False)
+                if self._state == self.CLOSED and self._should_open():
+                    self._open("upstream error rate spiked")
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        """Release a dispatch slot without recording an outcome (non-upstream errors)."""
+        with self._cond:
+            if self._state == self.HALF_OPEN and self._probe_in_flight:
+                self._probe_in_flight = False
+                self._cond.notify_all()
+
+    def _add_outcome(self, ok: bool) -> None:
+        """Add an outcome and drop those outside the window."""
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _should_open(self) -> bool:
+        """Check the failure rate over the current window."""
+        if len(self._outcomes) < self.min_calls:
+            return False
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes) >= self.failure_rate_threshold
+
+    def _open(self, reason: str) -> None:
+        """Open the circuit and start the cooldown."""
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        logger.warning(
+            f"Circuit open ({reason}): pausing LLM dispatch for {self.cooldown_seconds:.0f}s"
+        )
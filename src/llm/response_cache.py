@@ -0,0 +1,102 @@
+"""Persistent cache of LLM responses keyed by a hash of the request payload."""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.cache import DiskCache, hash_payload
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached response format changes
+LLM_CACHE_VERSION = 1
+
+
+class LLMResponseCache:
+    """
+    On-disk cache of chat completion responses.
+
+    Keys are a canonical hash of the full request payload (model, messages,
+    sampling parameters) plus the API base URL. Only deterministic requests
+    (temperature 0) are cached, since sampled responses are not meant to
+    repeat.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_mb: int = 256,
+        ttl_hours: Optional[float] = None
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_mb: Evict least-recently-used entries beyond this size
+            ttl_hours: Treat entries older than this as missing (None = no expiry)
+        """
+        self.store = DiskCache(
+            cache_dir=cache_dir,
+            max_size_bytes=max_size_mb * 1024 * 1024,
+            ttl_seconds=ttl_hours * 3600 if ttl_hours is not None else None
+        )
+
+    def is_cacheable(self, payload: Dict[str, Any]) -> bool:
+        """
+        Check whether a request is deterministic enough to cache.
+
+        Args:
+            payload: Chat completion request payload
+
+        Returns:
+            True if the request uses temperature 0
+        """
+        return payload.get("temperature") == 0
+
+    def key_for(self, payload: Dict[str, Any], base_url: str) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            payload: Chat completion request payload
+            base_url: API base URL the request is sent to
+
+        Returns:
+            Hex digest of the canonical request
+        """
+        return hash_payload({
+            "version": LLM_CACHE_VERSION,
+            "base_url": base_url,
+            "payload": payload,
+        })
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Dict with 'response' text and original 'usage', or None on a miss
+        """
+        entry = self.store.get(key)
+        if not isinstance(entry, dict) or "response" not in entry:
+            return None
+        return entry
+
+    def put(self, key: str, response_text: str, usage: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from key_for()
+            response_text: Response content
+            usage: Token usage reported for the original call
+        """
+        self.store.set(key, {"response": response_text, "usage": usage})
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.store.clear()
@@ -0,0 +1,78 @@
+"""Merge and deduplicate schemes extracted from overlapping inputs."""
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from src.models import SchemeHeader
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize(value: Optional[str]) -> str:
+    """Lowercase and strip punctuation/whitespace for identity comparison."""
+    return _NON_ALNUM.sub(" ", (value or "").lower()).strip()
+
+
+def scheme_identity(scheme: SchemeHeader) -> Tuple[str, ...]:
+    """
+    Identity of a scheme for deduplication.
+
+    Args:
+        scheme: Extracted scheme
+
+    Returns:
+        Tuple of normalized vendor, name, type, subtype and dates
+    """
+    return (
+        _normalize(scheme.vendor_name),
+        _normalize(scheme.scheme_name),
+        scheme.scheme_type,
+        scheme.scheme_subtype,
+        _normalize(scheme.start_date),
+        _normalize(scheme.end_date),
+    )
+
+
+def merge_schemes(schemes: List[SchemeHeader]) -> List[SchemeHeader]:
+    """
+    Deduplicate schemes by identity, combining duplicates.
+
+    The most confident copy of each scheme is kept; fields it left empty
+    are filled from the other copies, and it is flagged for escalation if
+    any copy was.
+
+    Args:
+        schemes: Schemes in extraction order (may contain duplicates)
+
+    Returns:
+        Unique schemes in order of first appearance
+    """
+    groups: Dict[Tuple[str, ...], List[SchemeHeader]] = {}
+    for scheme in schemes:
+        groups.setdefault(scheme_identity(scheme), []).append(scheme)
+
+    merged = []
+    for copies in groups.values():
+        if len(copies) == 1:
+            merged.append(copies[0])
+            continue
+
+        ranked = sorted(copies, key=lambda s: s.confidence or 0.0, reverse=True)
+        best = ranked[0]
+        updates = {}
+        for field_name in SchemeHeader.model_fields:
+            if getattr(best, field_name) is None:
+                for other in ranked[1:]:
+                    value = getattr(other, field_name)
+                    if value is not None:
+                        updates[field_name] = value
+                        break
+        updates["needs_escalation"] = any(s.needs_escalation for s in copies)
+        merged.append(best.model_copy(update=updates))
+
+    if len(merged) < len(schemes):
+        logger.info(f"Merged {len(schemes)} schemes into {len(merged)} unique schemes")
+    return merged
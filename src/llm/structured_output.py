@@ -0,0 +1,206 @@
+"""Structured output helpers: the scheme response schema and a tolerant JSON parser.
+
+The response schema constrains models that support OpenAI-style
+``response_format`` to emit valid scheme JSON. For models that do not, the
+tolerant parser recovers fenced, Python-literal, trailing-comma or
+truncated output locally instead of paying for another LLM call.
+"""
+
+import ast
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.models import SchemeHeader
+
+logger = logging.getLogger(__name__)
+
+# Fields filled by the pipeline, not by the model
+_PIPELINE_FIELDS = {"source_file", "extracted_at"}
+
+_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+_WORD = re.compile(r"[A-Za-z_]+")
+# A number or literal at the very end of truncated output may itself be cut off
+_TRAILING_SCALAR = re.compile(r"(?<=[:\[,])\s*(?:-?[0-9.eE+-]+|true|false|null)$")
+
+
+def schemes_response_format(name: str = "scheme_extraction") -> Dict[str, Any]:
+    """
+    Build the OpenAI-style response_format for scheme extraction.
+
+    The schema mirrors the DSPy output fields: a reasoning string and a
+    schemes_json object holding a list of SchemeHeader objects.
+
+    Args:
+        name: Schema name sent to the API
+
+    Returns:
+        response_format payload
+    """
+    scheme_schema = SchemeHeader.model_json_schema()
+    for field_name in _PIPELINE_FIELDS:
+        scheme_schema["properties"].pop(field_name, None)
+    scheme_schema.pop("required", None)
+
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": False,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "reasoning": {"type": "string"},
+                    "schemes_json": {
+                        "type": "object",
+                        "properties": {
+                            "schemes": {"type": "array", "items": scheme_schema}
+                        },
+                        "required": ["schemes"],
+                    },
+                },
+                "required": ["reasoning", "schemes_json"],
+            },
+        },
+    }
+
+
+def parse_json_tolerant(text: str) -> Tuple[Any, bool]:
+    """
+    Parse LLM JSON output, repairing common defects locally.
+
+    Tries, in order: strict JSON (ignoring text around the value), a Python
+    literal (how DSPy renders dict-valued output fields), JSON with trailing
+    commas and Python literals fixed, then truncated JSON cut back to its
+    last complete object or array and closed. Incomplete trailing items are
+    dropped rather than guessed.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Tuple of (parsed value, whether repair was needed)
+
+    Raises:
+        ValueError: If no JSON value can be recovered
+    """
+    cleaned = _FENCE.sub("", text.strip())
+    start = _find_value_start(cleaned)
+    if start is None:
+        raise ValueError("No JSON object or array found")
+    cleaned = cleaned[start:]
+
+    try:
+        value, _ = json.JSONDecoder().raw_decode(cleaned)
+        return value, False
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        value = ast.literal_eval(cleaned.strip())
+        if isinstance(value, (dict, list)):
+            return value, False
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        pass
+
+    fixed, stack, open_string, cut_points = _scan(cleaned)
+    candidates = []
+    if not stack and open_string is None:
+        candidates.append(fixed)
+    else:
+        # Truncated: prefer the last complete container, then close everything
+        # after dropping the value (or key) the cut went through
+        for position, open_stack in reversed(cut_points[-20:]):
+            candidates.append(_close(fixed[:position], open_stack))
+        if open_string is not None:
+            fixed = fixed[:open_string]
+        candidates.append(_close(_TRAILING_SCALAR.sub("", fixed.rstrip()), stack))
+
+    for candidate in candidates:
+        try:
+            value, _ = json.JSONDecoder().raw_decode(candidate)
+        except json.JSONDecodeError:
+            continue
+        logger.info("Recovered malformed LLM JSON locally")
+        return value, True
+
+    raise ValueError("Could not repair JSON output")
+
+
+def _find_value_start(text: str) -> Optional[int]:
+    """Index of the first '{' or '[' in text."""
+    positions = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    return min(positions) if positions else None
+
+
+def _scan(text: str) -> Tuple[str, List[str], Optional[int], List[Tuple[int, List[str]]]]:
+    """
+    Walk JSON text, fixing trailing commas and Python literals outside strings.
+
+    Returns:
+        Tuple of (fixed text, open brackets at the end, position of the
+        opening quote of a string still open at the end (None if all strings
+        are closed), and (position, open brackets) after each closed container)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    cut_points: List[Tuple[int, List[str]]] = []
+    open_string: Optional[int] = None
+    escaped = False
+    i = 0
+
+    while i < len(text):
+        char = text[i]
+        if open_string is not None:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                open_string = None
+            i += 1
+            continue
+
+        if char == '"':
+            open_string = len(out)
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in "}]":
+            # Drop a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(char)
+            if stack:
+                cut_points.append((len(out), list(stack)))
+            else:
+                break
+            i += 1
+            continue
+        elif char.isalpha():
+            word = _WORD.match(text, i).group(0)
+            out.extend(_LITERALS.get(word, word))
+            i += len(word)
+            continue
+
+        out.append(char)
+        i += 1
+
+    return "".join(out), stack, open_string, cut_points
+
+
+def _close(prefix: str, stack: List[str]) -> str:
+    """Close open brackets after removing a dangling key or comma."""
+    prefix = re.sub(r'"[^"]*"\s*:\s*$', "", prefix.rstrip()).rstrip()
+    if stack and stack[-1] == "{":
+        # A key cut off before its colon
+        prefix = re.sub(r'(?<=[{,])\s*"[^"]*"$', "", prefix).rstrip()
+    prefix = prefix.rstrip(",").rstrip()
+    return prefix + "".join(_CLOSERS[bracket] for bracket in reversed(stack))
@@ -238,6 +238,16 @@ class LLMResponse(BaseModel):
         description="Individual CoT reasoning steps with outputs"
     )
     
+    error: Optional[str] = Field(
+        default=None,
+        description="Error message if the extraction call failed"
+    )
+    
+    parse_failed: bool = Field(
+        default=False,
+        description="Whether the LLM output could not be parsed into schemes"
+    )
+    
     @property
     def needs_escalation(self) -> bool:
         """Check if any scheme needs escalation."""
@@ -248,4 +258,15 @@ class LLMResponse(BaseModel):
         """Calculate average confidence across all schemes."""
         if not self.schemes:
             return 0.0
-        return sum(s.confidence for s in self.schemes) / len(self.schemes)
+        return sum(s.confidence or 0.0 for s in self.schemes) / len(self.schemes)
+    
+    @property
+    def reported_confidence(self) -> Optional[float]:
+        """Average confidence over schemes whose confidence the model actually reported."""
+        reported = [
+            s.confidence for s in self.schemes
+            if "confidence" in s.model_fields_set and s.confidence is not None
+        ]
+        if not reported:
+            return None
+        return sum(reported) / len(reported)
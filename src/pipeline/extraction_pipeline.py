@@ -1,22 +1,114 @@
 """Main extraction pipeline orchestrating PDF processing and scheme extraction."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
 import pandas as pd
 
+from src.cache import hash_file, hash_payload
 from src.config import ExtractionConfig, get_config
 from src.models import ExtractionResult, SchemeHeader, ProcessingMetadata
 from src.extractors.pdf_processor import PDFProcessor
+from src.llm.cascade import CascadeExtractor, CascadeTier
 from src.llm.llm_client import OpenRouterLLM
+from src.llm.resilience import CircuitBreaker
+from src.llm.response_cache import LLMResponseCache
 from src.llm.dspy_pipeline import DSPySchemeExtractor
+from src.llm.field_repair import FieldRepairer
+from src.llm.signatures import ExpertSchemeExtractionSignature
+from src.pipeline.manifest import (
+    RunManifest,
+    EXTRACTION_STAGE,
+    LLM_STAGE,
+    EXTRACTION_STAGE_VERSION,
+    LLM_STAGE_VERSION,
+)
+from src.pipeline.gate import SchemeGate
+from src.pipeline.near_duplicates import NearDuplicateIndex
 from src.pipeline.output_manager import OutputManager
+from src.rate_limiter import TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
 
+class EmailInput(NamedTuple):
+    """One email queued for scheme extraction."""
+    
+    subject: str
+    body: str
+    source_file: str
+    content_key: Optional[str] = None
+
+
+# Per-process components used by batch extraction workers
+_worker_processor: Optional[PDFProcessor] = None
+_worker_output_manager: Optional[OutputManager] = None
+
+
+def _extract_pdf(
+    processor: PDFProcessor,
+    output_manager: OutputManager,
+    pdf_path: Path,
+    save_output: bool
+) -> Tuple[ExtractionResult, ProcessingMetadata]:
+    """
+    Extract a single PDF and optionally save its outputs.
+    
+    Args:
+        processor: PDF processor to extract with
+        output_manager: Output manager to save with
+        pdf_path: Path to PDF file
+        save_output: Whether to save extraction results
+        
+    Returns:
+        Tuple of (ExtractionResult, ProcessingMetadata)
+    """
+    # Create metadata
+    metadata = processor.create_metadata(pdf_path)
+    metadata.processing_started = datetime.now()
+    
+    try:
+        # Extract content
+        result = processor.process(pdf_path)
+        
+        # Save if requested
+        if save_output:
+            output_manager.save_extraction_result(result, metadata)
+        
+        # Update metadata
+        metadata.processing_completed = datetime.now()
+        metadata.success = True
+        
+        logger.info(f"PDF processing complete: {pdf_path.name}")
+        return result, metadata
+        
+    except Exception as e:
+        logger.exception(f"PDF processing failed for {pdf_path.name}: {e}")
+        metadata.processing_completed = datetime.now()
+        metadata.success = False
+        metadata.error_message = str(e)
+        raise
+
+
+def _init_batch_worker(config: ExtractionConfig) -> None:
+    """Build the extraction components once per batch worker process."""
+    global _worker_processor, _worker_output_manager
+    _worker_processor = PDFProcessor(config)
+    _worker_output_manager = OutputManager(config)
+
+
+def _process_pdf_in_worker(
+    pdf_path: Path,
+    save_output: bool
+) -> Tuple[ExtractionResult, ProcessingMetadata]:
+    """Extract a single PDF inside a batch worker process."""
+    logger.info(f"Processing PDF: {pdf_path.name}")
+    return _extract_pdf(_worker_processor, _worker_output_manager, pdf_path, save_output)
+
+
 class ExtractionPipeline:
     """
     Main pipeline orchestrator for end-to-end PDF extraction and scheme generation.
@@ -42,33 +134,152 @@ class ExtractionPipeline:
         self.output_manager = OutputManager(self.config)
         
         # Initialize LLM client
-        self.llm = OpenRouterLLM(
-            api_key=self.config.openrouter_api_key,
-            model=self.config.openrouter_model,
-            temperature=self.config.llm_temperature,
-            max_tokens=self.config.llm_max_tokens,
-            timeout=self.config.llm_timeout,
-            top_p=self.config.llm_top_p,
-            frequency_penalty=self.config.llm_frequency_penalty,
-            presence_penalty=self.config.llm_presence_penalty,
-            enable_logging=self.config.enable_detailed_llm_logging,
-            input_cost_per_1m=self.config.model_input_cost_per_1m_tokens,
-            output_cost_per_1m=self.config.model_output_cost_per_1m_tokens
+        self.response_cache = None
+        if self.config.llm_cache_enabled:
+            self.response_cache = LLMResponseCache(
+                cache_dir=self.config.llm_cache_dir,
+                max_size_mb=self.config.llm_cache_max_mb,
+                ttl_hours=self.config.llm_cache_ttl_hours
+            )
+        
+        self.rate_limiter = None
+        if self.config.llm_rate_limit_rpm or self.config.llm_rate_limit_tpm:
+            self.rate_limiter = TokenBucketRateLimiter(
+                key=self.config.openrouter_api_key,
+                requests_per_minute=self.config.llm_rate_limit_rpm,
+                tokens_per_minute=self.config.llm_rate_limit_tpm
+            )
+        
+        self.llm = self._build_llm(
+            self.config.openrouter_model,
+            self.config.model_input_cost_per_1m_tokens,
+            self.config.model_output_cost_per_1m_tokens
         )
         
         # Initialize scheme extractor (DSPy with CoT or legacy)
         if self.config.enable_chain_of_thought:
             logger.info("Using DSPy Chain-of-Thought extractor")
-            self.scheme_extractor = DSPySchemeExtractor(self.llm,  self.config)
+            extractor_class = DSPySchemeExtractor
             # Create CoT log directory if saving is enabled
             if self.config.save_cot_reasoning:
                 self.config.cot_log_dir.mkdir(parents=True, exist_ok=True)
         else:
             logger.info("Using legacy scheme extractor")
-            self.scheme_extractor = SchemeExtractor(self.llm, self.config)
+            extractor_class = SchemeExtractor
+        
+        self.cascade = None
+        if self.config.llm_cascade_enabled:
+            small_llm = self._build_llm(
+                self.config.llm_cascade_small_model,
+                self.config.llm_cascade_small_input_cost_per_1m,
+                self.config.llm_cascade_small_output_cost_per_1m
+            )
+            self.cascade = CascadeExtractor(
+                [
+                    CascadeTier(
+                        name="small",
+                        extractor=extractor_class(small_llm, self.config),
+                        llm=small_llm,
+                        input_cost_per_1m=self.config.llm_cascade_small_input_cost_per_1m,
+                        output_cost_per_1m=self.config.llm_cascade_small_output_cost_per_1m
+                    ),
+                    CascadeTier(
+                        name="large",
+                        extractor=extractor_class(self.llm, self.config),
+                        llm=self.llm,
+                        input_cost_per_1m=self.config.model_input_cost_per_1m_tokens,
+                        output_cost_per_1m=self.config.model_output_cost_per_1m_tokens
+                    ),
+                ],
+                min_confidence=self.config.llm_cascade_min_confidence
+            )
+            logger.info(
+                f"Cascade routing: {self.config.llm_cascade_small_model} -> "
+                f"{self.config.openrouter_model}"
+            )
+            self.scheme_extractor = self.cascade
+        else:
+            self.scheme_extractor = extractor_class(self.llm, self.config)
+        
+        # Narrow re-asks for missing/invalid fields, on the cheapest model
+        self.field_repairer = None
+        if self.config.llm_field_repair:
+            repair_llm = self.cascade.tiers[0].llm if self.cascade else self.llm
+            self.field_repairer = FieldRepairer(repair_llm, self.config)
+        
+        # Cheap local filter in front of the chain-of-thought call
+        self.gate = None
+        if self.config.scheme_gate_enabled:
+            self.gate = SchemeGate(
+                threshold=self.config.scheme_gate_threshold,
+                audit_log=self.config.scheme_gate_audit_log
+            )
+        
+        # Track completed work so re-runs skip unchanged inputs
+        self.manifest = (
+            RunManifest(self.config.manifest_path)
+            if self.config.incremental_runs else None
+        )
         
         logger.info("Extraction pipeline initialized")
     
+    def _build_llm(
+        self,
+        model: str,
+        input_cost_per_1m: float,
+        output_cost_per_1m: float
+    ) -> OpenRouterLLM:
+        """
+        Create an OpenRouter client for a model with the configured transport settings.
+        
+        The response cache and rate limiter are shared between clients; each
+        client gets its own circuit breaker so one failing model does not
+        pause the others.
+        
+        Args:
+            model: OpenRouter model identifier
+            input_cost_per_1m: Cost per 1M input tokens
+            output_cost_per_1m: Cost per 1M output tokens
+            
+        Returns:
+            Configured OpenRouterLLM
+        """
+        circuit_breaker = None
+        if self.config.llm_circuit_breaker_enabled:
+            circuit_breaker = CircuitBreaker(
+                failure_rate_threshold=self.config.llm_circuit_failure_rate,
+                min_calls=self.config.llm_circuit_min_calls,
+                window_seconds=self.config.llm_circuit_window_seconds,
+                cooldown_seconds=self.config.llm_circuit_cooldown_seconds
+            )
+        
+        return OpenRouterLLM(
+            api_key=self.config.openrouter_api_key,
+            model=model,
+            temperature=self.config.llm_temperature,
+            max_tokens=self.config.llm_max_tokens,
+            timeout=self.config.llm_timeout,
+            top_p=self.config.llm_top_p,
+            frequency_penalty=self.config.llm_frequency_penalty,
+            presence_penalty=self.config.llm_presence_penalty,
+            enable_logging=self.config.enable_detailed_llm_logging,
+            input_cost_per_1m=input_cost_per_1m,
+            output_cost_per_1m=output_cost_per_1m,
+            # One connection per in-flight request avoids reconnect churn
+            pool_size=max(self.config.llm_pool_size, self.config.llm_max_concurrency),
+            response_cache=self.response_cache,
+            bypass_cache=self.config.llm_cache_bypass,
+            max_retries=self.config.max_retries,
+            retry_delay=self.config.retry_delay,
+            max_retry_delay=self.config.max_retry_delay,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=self.rate_limiter,
+            hedge_percentile=(
+                self.config.llm_hedge_percentile if self.config.llm_hedging_enabled else None
+            ),
+            hedge_min_samples=self.config.llm_hedge_min_samples
+        )
+    
     def process_pdf(self, pdf_path: Path, save_output: bool = True) -> ExtractionResult:
         """
         Process a single PDF: extract text and tables.
@@ -83,62 +294,162 @@ class ExtractionPipeline:
         pdf_path = Path(pdf_path)
         logger.info(f"Processing PDF: {pdf_path.name}")
         
-        # Create metadata
-        metadata = self.pdf_processor.create_metadata(pdf_path)
-        metadata.processing_started = datetime.now()
+        pdf_key = self._pdf_key(pdf_path) if save_output else None
+        saved = self._load_saved_output(pdf_key, pdf_path)
+        if saved is not None:
+            return saved
         
+        result, metadata = _extract_pdf(self.pdf_processor, self.output_manager, pdf_path, save_output)
+        if save_output:
+            self._record_extraction(pdf_key, pdf_path, metadata)
+        return result
+    
+    def _pdf_key(self, pdf_path: Path) -> Optional[str]:
+        """Manifest key for a PDF (None when incremental runs are disabled)."""
+        if self.manifest is None:
+            return None
         try:
-            # Extract content
-            result = self.pdf_processor.process(pdf_path)
-            
-            # Save if requested
-            if save_output:
-                self.output_manager.save_extraction_result(result, metadata)
-            
-            # Update metadata
-            metadata.processing_completed = datetime.now()
-            metadata.success = True
-            
-            logger.info(f"PDF processing complete: {pdf_path.name}")
-            return result
-            
-        except Exception as e:
-            logger.exception(f"PDF processing failed for {pdf_path.name}: {e}")
-            metadata.processing_completed = datetime.now()
-            metadata.success = False
-            metadata.error_message = str(e)
-            raise
+            return hash_file(pdf_path)
+        except OSError as e:
+            logger.warning(f"Could not hash {pdf_path.name}: {e}")
+            return None
+    
+    def _load_saved_output(self, pdf_key: Optional[str], pdf_path: Path) -> Optional[ExtractionResult]:
+        """Load the saved extraction of an unchanged PDF instead of extracting it again."""
+        if pdf_key is None:
+            return None
+        
+        entry = self.manifest.get(EXTRACTION_STAGE, pdf_key, EXTRACTION_STAGE_VERSION)
+        if not entry or not Path(entry.get("output_dir", "")).is_dir():
+            return None
+        
+        result = self.output_manager.load_extraction_result(pdf_path, Path(entry["output_dir"]))
+        if result is not None:
+            logger.info(f"Unchanged since last run, loaded saved output: {pdf_path.name}")
+        return result
+    
+    def _record_extraction(
+        self,
+        pdf_key: Optional[str],
+        pdf_path: Path,
+        metadata: ProcessingMetadata
+    ) -> None:
+        """Record a saved extraction in the run manifest."""
+        if pdf_key is None:
+            return
+        self.manifest.record(
+            EXTRACTION_STAGE,
+            pdf_key,
+            EXTRACTION_STAGE_VERSION,
+            pdf_name=pdf_path.name,
+            output_dir=str(metadata.output_directory)
+        )
     
     def process_multiple_pdfs(
         self,
         pdf_paths: List[Path],
-        save_output: bool = True
+        save_output: bool = True,
+        max_workers: Optional[int] = None
     ) -> List[ExtractionResult]:
         """
         Process multiple PDFs.
         
+        With more than one worker, PDFs are extracted concurrently in a
+        process pool. Failed PDFs are logged and skipped; successful results
+        are returned in input order either way. With incremental runs enabled,
+        PDFs whose output was saved by an earlier run are loaded from that
+        output instead of being extracted again.
+        
         Args:
             pdf_paths: List of PDF file paths
             save_output: Whether to save extraction results
+            max_workers: Worker processes (defaults to config.batch_workers)
             
         Returns:
             List of ExtractionResults
         """
-        results = []
+        pdf_paths = [Path(p) for p in pdf_paths]
+        max_workers = max_workers or self.config.batch_workers
         
-        for i, pdf_path in enumerate(pdf_paths, 1):
-            logger.info(f"Processing PDF {i}/{len(pdf_paths)}: {pdf_path.name}")
+        if max_workers > 1 and len(pdf_paths) > 1:
+            results = self._process_pdfs_concurrently(pdf_paths, save_output, max_workers)
+        else:
+            results = []
             
-            try:
-                result = self.process_pdf(pdf_path, save_output=save_output)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Skipping {pdf_path.name} due to error: {e}")
-                continue
+            for i, pdf_path in enumerate(pdf_paths, 1):
+                logger.info(f"Processing PDF {i}/{len(pdf_paths)}: {pdf_path.name}")
+                
+                try:
+                    result = self.process_pdf(pdf_path, save_output=save_output)
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Skipping {pdf_path.name} due to error: {e}")
+                    continue
         
         logger.info(f"Processed {len(results)}/{len(pdf_paths)} PDFs successfully")
         return results
     
+    def _process_pdfs_concurrently(
+        self,
+        pdf_paths: List[Path],
+        save_output: bool,
+        max_workers: int
+    ) -> List[ExtractionResult]:
+        """
+        Extract PDFs across a bounded process pool.
+        
+        Args:
+            pdf_paths: List of PDF file paths
+            save_output: Whether to save extraction results
+            max_workers: Maximum number of concurrent worker processes
+            
+        Returns:
+            Successful ExtractionResults in input order
+        """
+        # Manifest lookups and writes stay in this process
+        pdf_keys = [self._pdf_key(pdf_path) if save_output else None for pdf_path in pdf_paths]
+        saved = [
+            self._load_saved_output(pdf_key, pdf_path)
+            for pdf_key, pdf_path in zip(pdf_keys, pdf_paths)
+        ]
+        pending = [i for i, result in enumerate(saved) if result is None]
+        
+        if not pending:
+            return list(saved)
+        
+        workers = min(max_workers, len(pending))
+        logger.info(f"Processing {len(pending)} PDFs with {workers} worker processes")
+        
+        # Each worker already runs one PDF per core; avoid nested pools
+        worker_config = self.config.model_copy(update={"page_workers": 1, "ocr_workers": 1})
+        
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(worker_config,)
+        ) as executor:
+            futures = {
+                i: executor.submit(_process_pdf_in_worker, pdf_paths[i], save_output)
+                for i in pending
+            }
+            
+            for i, pdf_path in enumerate(pdf_paths, 1):
+                if saved[i - 1] is not None:
+                    results.append(saved[i - 1])
+                    continue
+                try:
+                    result, metadata = futures[i - 1].result()
+                    if save_output:
+                        self._record_extraction(pdf_keys[i - 1], pdf_path, metadata)
+                    results.append(result)
+                    logger.info(f"Completed PDF {i}/{len(pdf_paths)}: {pdf_path.name}")
+                except Exception as e:
+                    logger.error(f"Skipping {pdf_path.name} due to error: {e}")
+                    continue
+        
+        return results
+    
     def extract_schemes_from_result(
         self,
         result: ExtractionResult
@@ -152,24 +463,274 @@ class ExtractionPipeline:
         Returns:
             List of SchemeHeaders
         """
-        subject = result.email_subject or "No Subject"
-        body = result.combined_body
+        email = self._email_from_result(result)
+        logger.info(f"Extracting schemes from: {email.subject[:80]}")
+        
+        return self._extract_schemes_for_email(*email)
+    
+    def _email_from_result(self, result: ExtractionResult) -> EmailInput:
+        """Build the scheme extraction input for an extraction result."""
+        return EmailInput(
+            subject=result.email_subject or "No Subject",
+            body=result.combined_body,
+            source_file=result.pdf_path.name
+        )
+    
+    def extract_schemes_batch(
+        self,
+        emails: List[EmailInput],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[SchemeHeader]]:
+        """
+        Extract schemes for many emails with bounded concurrent LLM requests.
+        
+        LLM calls are network-bound, so they run on a thread pool with at most
+        max_workers requests in flight. A failed request is logged and yields
+        no schemes for that email; the rest of the batch continues. With
+        near-duplicate detection enabled, forwarded or re-printed copies of an
+        email already in the batch reuse its schemes instead of calling the LLM;
+        if the original's call fails, its first duplicate is extracted instead.
+        Emails with no scheme signals are dropped by the gate before the LLM
+        call, and each decision is written to the gate's audit log; the
+        skipped source files are listed in the batch summary.
+        
+        Args:
+            emails: Emails to extract schemes from
+            max_workers: Maximum in-flight requests (defaults to config.llm_max_concurrency)
+            
+        Returns:
+            Mapping of source file to its SchemeHeaders, in input order
+        """
+        max_workers = max_workers or self.config.llm_max_concurrency
+        total = len(emails)
+        duplicate_of = self._find_near_duplicates(emails)
+        failed = set()
+        skipped = set()
+        
+        def extract_one(index: int) -> List[SchemeHeader]:
+            email = emails[index]
+            if index in duplicate_of:
+                return []
+            if self.gate is not None and not self.gate.check(
+                email.subject, email.body, email.source_file
+            ).passed:
+                skipped.add(index)
+                return []
+            logger.info(f"Processing email {index + 1}/{total}: {email.subject[:80]}")
+            try:
+                schemes, succeeded = self._run_email_extraction(*email)
+            except Exception as e:
+                logger.error(f"Scheme extraction failed for {email.source_file}: {e}")
+                schemes, succeeded = [], False
+            if not succeeded:
+                failed.add(index)
+            return schemes
+        
+        def extract_all(indices: List[int]) -> List[List[SchemeHeader]]:
+            if max_workers > 1 and len(indices) > 1:
+                workers = min(max_workers, len(indices))
+                logger.info(f"Extracting schemes for {len(indices)} emails with {workers} concurrent requests")
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(extract_one, indices))
+            return [extract_one(i) for i in indices]
+        
+        scheme_lists = extract_all(list(range(total)))
+        
+        # A failed original hands its near-duplicates back: the first one is
+        # extracted itself and the others copy it instead
+        promoted: Dict[int, int] = {}
+        for i, original in sorted(duplicate_of.items()):
+            if original not in failed:
+                continue
+            if original in promoted:
+                duplicate_of[i] = promoted[original]
+            else:
+                promoted[original] = i
+                del duplicate_of[i]
+        if promoted:
+            logger.info(f"Extracting {len(promoted)} near-duplicates whose original failed")
+            retried = sorted(promoted.values())
+            for i, schemes in zip(retried, extract_all(retried)):
+                scheme_lists[i] = schemes
+        
+        # Copy schemes to near-duplicates, attributed to their own source file
+        for i, original in duplicate_of.items():
+            scheme_lists[i] = [
+                scheme.model_copy(update={"source_file": emails[i].source_file})
+                for scheme in scheme_lists[original]
+            ]
+        
+        schemes_by_file: Dict[str, List[SchemeHeader]] = {}
+        for email, schemes in zip(emails, scheme_lists):
+            schemes_by_file.setdefault(email.source_file, []).extend(schemes)
+        
+        if self.manifest is not None:
+            self.manifest.compact()
+        
+        if skipped:
+            logger.warning(
+                f"Gate skipped {len(skipped)}/{total} emails with no scheme signals "
+                f"(see {self.gate.audit_log}): "
+                + ", ".join(emails[i].source_file for i in sorted(skipped))
+            )
+        
+        if self.cascade is not None:
+            for name, stats in self.cascade.get_tier_stats().items():
+                logger.info(
+                    f"Cascade {name} tier: {stats['accepted']}/{stats['calls']} accepted "
+                    f"({stats['hit_rate']:.0%}), escalations {stats['escalations']}, "
+                    f"cost ${stats.get('cost', 0.0):.4f}"
+                )
+        
+        return schemes_by_file
+    
+    def _find_near_duplicates(self, emails: List[EmailInput]) -> Dict[int, int]:
+        """
+        Map each near-duplicate email to the first earlier email it copies.
+        
+        Args:
+            emails: Emails in batch order
+            
+        Returns:
+            Mapping of duplicate index to original index
+        """
+        if not self.config.near_duplicate_detection or len(emails) < 2:
+            return {}
+        
+        index = NearDuplicateIndex(threshold=self.config.near_duplicate_threshold)
+        duplicate_of = {}
+        for i, email in enumerate(emails):
+            match = index.add(str(i), email.body)
+            if match is not None:
+                original = int(match[0])
+                duplicate_of[i] = original
+                logger.info(
+                    f"{email.source_file} is a near-duplicate of "
+                    f"{emails[original].source_file} (similarity {match[1]:.2f}); reusing its schemes"
+                )
+        
+        if duplicate_of:
+            logger.info(f"Skipping LLM calls for {len(duplicate_of)}/{len(emails)} near-duplicate emails")
+        return duplicate_of
+    
+    def _extract_schemes_for_email(
+        self,
+        subject: str,
+        body: str,
+        source_file: str,
+        content_key: Optional[str] = None
+    ) -> List[SchemeHeader]:
+        """
+        Extract schemes for one email, reusing manifest results for unchanged input.
+        
+        Args:
+            subject: Email subject line
+            body: Email body sent to the LLM
+            source_file: Source filename to attribute schemes to
+            content_key: Stable content hash (defaults to a hash of subject and body)
+            
+        Returns:
+            List of SchemeHeaders
+        """
+        schemes, _ = self._run_email_extraction(subject, body, source_file, content_key)
+        return schemes
+    
+    def _run_email_extraction(
+        self,
+        subject: str,
+        body: str,
+        source_file: str,
+        content_key: Optional[str] = None
+    ) -> Tuple[List[SchemeHeader], bool]:
+        """
+        Extract schemes for one email and report whether the LLM call succeeded.
         
-        logger.info(f"Extracting schemes from: {subject[:80]}")
+        Args:
+            subject: Email subject line
+            body: Email body sent to the LLM
+            source_file: Source filename to attribute schemes to
+            content_key: Stable content hash (defaults to a hash of subject and body)
+            
+        Returns:
+            Tuple of (SchemeHeaders, False if the LLM call failed)
+        """
+        key = None
+        if self.manifest is not None:
+            key = content_key or hash_payload([subject, body])
+            entry = self.manifest.get(LLM_STAGE, key, self._llm_stage_version())
+            if entry is not None:
+                schemes = [
+                    SchemeHeader(**{**data, "source_file": source_file})
+                    for data in entry.get("schemes", [])
+                ]
+                logger.info(f"Reused {len(schemes)} schemes from previous run")
+                return schemes, True
         
         # Call LLM
         llm_response = self.scheme_extractor.extract(subject, body)
         
+        # Patch missing/invalid dates, amounts or vendor without a full re-run
+        if self.field_repairer is not None and llm_response.error is None:
+            llm_response.schemes = self.field_repairer.repair_all(
+                llm_response.schemes, subject, body
+            )
+        
         # Add source file to schemes
         for scheme in llm_response.schemes:
-            scheme.source_file = result.pdf_path.name
+            scheme.source_file = source_file
         
         logger.info(
             f"Extracted {len(llm_response.schemes)} schemes "
             f"(avg confidence: {llm_response.average_confidence:.2f})"
         )
         
-        return llm_response.schemes
+        if llm_response.error is not None:
+            logger.warning(
+                f"LLM extraction failed for {source_file} after retries: {llm_response.error}"
+                + ("; it will be retried on the next run" if key is not None else "")
+            )
+        
+        # Failed calls are retried on the next run
+        if key is not None and llm_response.error is None:
+            self.manifest.record(
+                LLM_STAGE,
+                key,
+                self._llm_stage_version(),
+                source_file=source_file,
+                schemes=[scheme.model_dump(mode="json") for scheme in llm_response.schemes]
+            )
+        
+        return llm_response.schemes, llm_response.error is None
+    
+    def _llm_stage_version(self) -> str:
+        """
+        Version of the LLM stage: changes with the model, sampling settings or prompt.
+        
+        Returns:
+            Hex digest identifying the current LLM stage configuration
+        """
+        signature = ExpertSchemeExtractionSignature
+        return hash_payload({
+            "version": LLM_STAGE_VERSION,
+            "chain_of_thought": self.config.enable_chain_of_thought,
+            "structured_output": self.config.llm_structured_output,
+            "field_repair": self.config.llm_field_repair,
+            "model": self.config.openrouter_model,
+            "cascade": (
+                [self.config.llm_cascade_small_model, self.config.llm_cascade_min_confidence]
+                if self.config.llm_cascade_enabled else None
+            ),
+            "temperature": self.config.llm_temperature,
+            "max_tokens": self.config.llm_max_tokens,
+            "input_token_budget": self.config.llm_input_token_budget,
+            "chunked": self.config.llm_chunked_extraction,
+            "chunk_overlap_tokens": self.config.llm_chunk_overlap_tokens,
+            "instructions": signature.instructions,
+            "fields": {
+                name: field.json_schema_extra
+                for name, field in {**signature.input_fields, **signature.output_fields}.items()
+            },
+        })
     
     def build_scheme_headers_from_output(self) -> pd.DataFrame:
         """
@@ -182,8 +743,10 @@ class ExtractionPipeline:
         """
         logger.info("Building scheme headers from extracted output")
         
-        # Load extracted emails
-        emails_df = self.output_manager.load_extracted_emails()
+        # Load extracted emails (only the newest run of each PDF when incremental)
+        emails_df = self.output_manager.load_extracted_emails(
+            latest_only=self.config.incremental_runs
+        )
         
         if emails_df.empty:
             logger.warning("No extracted emails found in output directory")
@@ -192,29 +755,17 @@ class ExtractionPipeline:
         logger.info(f"Found {len(emails_df)} extracted emails")
         
         # Extract schemes from each email
-        all_schemes = []
-        
-        for idx, row in emails_df.iterrows():
-            subject = row['mail_subject']
-            body = row['mail_body']
-            source_file = row['sourceFile']
-            
-            logger.info(f"Processing email {idx+1}/{len(emails_df)}: {subject[:80]}")
-            
-            try:
-                llm_response = self.scheme_extractor.extract(subject, body)
-                
-                # Add source file
-                for scheme in llm_response.schemes:
-                    scheme.source_file = source_file
-                
-                all_schemes.extend(llm_response.schemes)
-                
-                logger.info(f"Extracted {len(llm_response.schemes)} schemes")
-                
-            except Exception as e:
-                logger.error(f"Scheme extraction failed for {subject[:80]}: {e}")
-                continue
+        emails = [
+            EmailInput(
+                subject=row['mail_subject'],
+                body=row['mail_body'],
+                source_file=row['sourceFile'],
+                content_key=row['content_hash']
+            )
+            for _, row in emails_df.iterrows()
+        ]
+        schemes_by_file = self.extract_schemes_batch(emails)
+        all_schemes = [scheme for schemes in schemes_by_file.values() for scheme in schemes]
         
         # Save schemes
         if all_schemes:
@@ -243,15 +794,10 @@ class ExtractionPipeline:
         
         # Step 2: Extract schemes
         logger.info("Step 2: Extracting schemes...")
-        all_schemes = []
-        
-        for result in extraction_results:
-            try:
-                schemes = self.extract_schemes_from_result(result)
-                all_schemes.extend(schemes)
-            except Exception as e:
-                logger.error(f"Scheme extraction failed for {result.pdf_path.name}: {e}")
-                continue
+        schemes_by_file = self.extract_schemes_batch(
+            [self._email_from_result(result) for result in extraction_results]
+        )
+        all_schemes = [scheme for schemes in schemes_by_file.values() for scheme in schemes]
         
         # Step 3: Save schemes
         logger.info("Step 3: Saving scheme headers...")
@@ -268,6 +814,15 @@ class ExtractionPipeline:
         Get LLM usage statistics.
         
         Returns:
-            Dictionary with token usage stats
+            Dictionary with token usage stats (plus per-tier stats in cascade mode)
         """
-        return self.llm.get_usage_stats()
+        if self.cascade is None:
+            return self.llm.get_usage_stats()
+        
+        tier_stats = self.cascade.get_tier_stats()
+        totals = {}
+        for stats in tier_stats.values():
+            for key, value in stats["usage"].items():
+                totals[key] = totals.get(key, 0) + value
+        totals["cascade"] = tier_stats
+        return totals
@@ -0,0 +1,145 @@
+"""Cheap local gate deciding whether an email is worth the full LLM extraction."""
+
+import json
+import logging
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEME_TERMS = re.compile(
+    r"\b(scheme|offer|discount|cash\s?back|margin|payout|support|claim|"
+    r"price\s+protection|price\s+drop|pdc|bbd|bank\s+offer|exchange|prexo|"
+    r"slab|incentive|rebate|coupon|super\s?coin|sell\s?in|sell\s?out|"
+    r"nlc|mrp|fsn|per\s+unit|valid(ity)?|start\s+date|end\s+date)\b",
+    re.IGNORECASE
+)
+_DATE = re.compile(
+    r"\b\d{1,2}[/\-.]\d{1,2}[/\-.]\d{2,4}\b|"
+    r"\b\d{1,2}(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b",
+    re.IGNORECASE
+)
+_AMOUNT = re.compile(r"(₹|rs\.?|inr)\s?\d|\d+(\.\d+)?\s?%", re.IGNORECASE)
+_TABLE = re.compile(r"^TABLE\b", re.IGNORECASE | re.MULTILINE)
+_AUTO_REPLY = re.compile(
+    r"out of (the )?office|automatic reply|auto[-\s]?reply|on leave|"
+    r"delivery (status notification|has failed)|undeliverable|mailer-daemon",
+    re.IGNORECASE
+)
+_NEWSLETTER = re.compile(
+    r"newsletter|unsubscribe|webinar|view (this email )?in (your )?browser|"
+    r"manage (your )?preferences",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class GateDecision:
+    """Outcome of gating one email."""
+
+    score: float
+    threshold: float
+    passed: bool
+    signals: Dict[str, int] = field(default_factory=dict)
+
+
+class SchemeGate:
+    """
+    Keyword/feature scorer that filters out mails with no scheme content.
+
+    Scheme vocabulary, dates, amounts and tables raise the score (subject
+    terms count double); auto-replies and newsletters lower it. Mails
+    scoring below the threshold skip the chain-of-thought call. Every
+    decision is appended to a JSONL audit log so skips can be reviewed.
+    """
+
+    def __init__(self, threshold: float = 2.0, audit_log: Optional[Path] = None):
+        """
+        Initialize scheme gate.
+
+        Args:
+            threshold: Minimum score for a mail to be sent to the LLM
+            audit_log: JSONL file recording every decision (None disables)
+        """
+        self.threshold = threshold
+        self.audit_log = Path(audit_log) if audit_log else None
+        self._lock = threading.Lock()
+
+        if self.audit_log:
+            self.audit_log.parent.mkdir(parents=True, exist_ok=True)
+
+    def score(self, subject: str, body: str) -> GateDecision:
+        """
+        Score an email without recording the decision.
+
+        Args:
+            subject: Email subject line
+            body: Email body with tables
+
+        Returns:
+            GateDecision
+        """
+        signals = {
+            "subject_terms": len(_SCHEME_TERMS.findall(subject)),
+            "body_terms": len(_SCHEME_TERMS.findall(body)),
+            "dates": len(_DATE.findall(body)),
+            "amounts": len(_AMOUNT.findall(body)),
+            "tables": len(_TABLE.findall(body)),
+            "auto_reply": len(_AUTO_REPLY.findall(subject + "\n" + body)),
+            "newsletter": len(_NEWSLETTER.findall(body)),
+        }
+
+        score = (
+            2.0 * min(signals["subject_terms"], 3)
+            + 1.0 * min(signals["body_terms"], 10)
+            + 1.0 * min(signals["dates"], 5)
+            + 0.5 * min(signals["amounts"], 5)
+            + (2.0 if signals["tables"] else 0.0)
+            - 5.0 * min(signals["auto_reply"], 2)
+            - 2.0 * min(signals["newsletter"], 3)
+        )
+
+        return GateDecision(
+            score=score,
+            threshold=self.threshold,
+            passed=score >= self.threshold,
+            signals=signals
+        )
+
+    def check(self, subject: str, body: str, source_file: str) -> GateDecision:
+        """
+        Score an email and record the decision in the audit log.
+
+        Args:
+            subject: Email subject line
+            body: Email body with tables
+            source_file: Source filename for the audit record
+
+        Returns:
+            GateDecision
+        """
+        decision = self.score(subject, body)
+
+        if not decision.passed:
+            logger.info(
+                f"Gate skipped {source_file} (score {decision.score:.1f} < "
+                f"{self.threshold:.1f}): {subject[:80]}"
+            )
+
+        if self.audit_log:
+            record = {
+                "timestamp": datetime.now().isoformat(),
+                "source_file": source_file,
+                "subject": subject,
+                "decision": "extract" if decision.passed else "skip",
+                **asdict(decision),
+            }
+            with self._lock:
+                with open(self.audit_log, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        return decision
@@ -0,0 +1,133 @@
+"""Persistent run manifest for incremental pipeline runs.
+
+Records which inputs have completed each pipeline stage, keyed by content
+hash and stage version, so re-runs only process new or changed items.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Stage names
+EXTRACTION_STAGE = "extraction"
+LLM_STAGE = "llm"
+
+# Bump when extraction output for the same PDF changes meaningfully
+EXTRACTION_STAGE_VERSION = "1"
+
+# Bump when scheme extraction changes in ways not captured by the prompt hash
+LLM_STAGE_VERSION = "1"
+
+
+class RunManifest:
+    """
+    Append-only JSONL manifest of completed pipeline stages.
+
+    Each record is appended as one line, so completed work survives a crash
+    mid-run. Later lines override earlier ones; compact() rewrites the file
+    with only the latest record per stage and key.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize run manifest.
+
+        Args:
+            path: Path to the manifest JSONL file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the manifest file into memory."""
+        if not self.path.exists():
+            return
+
+        loaded = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    stage = record.pop("stage")
+                    key = record.pop("key")
+                except Exception as e:
+                    logger.warning(f"Skipping malformed manifest line {line_num}: {e}")
+                    continue
+                self._entries.setdefault(stage, {})[key] = record
+                loaded += 1
+
+        logger.info(f"Loaded {loaded} manifest records from {self.path}")
+
+    def get(self, stage: str, key: str, stage_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a completed stage record.
+
+        Args:
+            stage: Stage name
+            key: Content hash of the input
+            stage_version: Current version of the stage
+
+        Returns:
+            Record data if the stage completed at this version, else None
+        """
+        record = self._entries.get(stage, {}).get(key)
+        if record is None or record.get("stage_version") != stage_version:
+            return None
+        return record.get("data", {})
+
+    def record(self, stage: str, key: str, stage_version: str, **data: Any) -> None:
+        """
+        Record that an input completed a stage.
+
+        Args:
+            stage: Stage name
+            key: Content hash of the input
+            stage_version: Version of the stage that produced the data
+            **data: JSON-serializable stage output to keep
+        """
+        record = {
+            "stage_version": stage_version,
+            "recorded_at": datetime.now().isoformat(),
+            "data": data,
+        }
+        line = json.dumps(
+            {"stage": stage, "key": key, **record},
+            ensure_ascii=False,
+            default=str
+        )
+
+        with self._lock:
+            self._entries.setdefault(stage, {})[key] = record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def compact(self) -> None:
+        """Rewrite the manifest keeping only the latest record per stage and key."""
+        with self._lock:
+            if not self._entries:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for stage, entries in self._entries.items():
+                    for key, record in entries.items():
+                        f.write(json.dumps(
+                            {"stage": stage, "key": key, **record},
+                            ensure_ascii=False,
+                            default=str
+                        ) + "\n")
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,196 @@
+"""MinHash/LSH index for spotting near-duplicate emails (forwards, re-prints)."""
+
+import logging
+import re
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Large prime for the universal hash family (2^61 - 1)
+_PRIME = np.uint64((1 << 61) - 1)
+
+# Shingles hashed per batch, bounding memory for very long bodies
+_HASH_BATCH = 4096
+
+_FORWARD_HEADER = re.compile(
+    r"^\s*(>+|from:|sent:|to:|cc:|bcc:|date:|subject:|fw:|fwd:|re:|"
+    r"-+\s*(original|forwarded) message\s*-+|---\s*(ocr\s+)?page\b).*$",
+    re.IGNORECASE | re.MULTILINE
+)
+# Extraction summary appended by OutputManager.load_extracted_emails; its
+# timestamp, page_count and text_length change from run to run
+_SUMMARY_BLOCK = re.compile(r"\n\nSUMMARY:\n\{\n(?: .*\n)*\}\s*\Z")
+# Table labels added by the same loader; the file name carries a per-path hash
+_TABLE_LABEL = re.compile(r"^TABLE FROM \S+\.csv$", re.MULTILINE)
+_WORD = re.compile(r"[a-z0-9]+(?:[./-][a-z0-9]+)*")
+_HAS_DIGIT = re.compile(r"\d")
+
+
+def normalize_for_similarity(text: str) -> List[str]:
+    """
+    Reduce an email body to comparable words.
+
+    Forward/reply headers, quote markers and page markers are dropped so a
+    forwarded copy compares equal to the original, as are the trailing
+    extraction summary and the table file labels, whose per-run numbers and
+    path hashes are not email content.
+
+    Args:
+        text: Email body
+
+    Returns:
+        Lowercase word tokens
+    """
+    text = _TABLE_LABEL.sub("", _SUMMARY_BLOCK.sub("", text))
+    return _WORD.findall(_FORWARD_HEADER.sub(" ", text).lower())
+
+
+class NearDuplicateIndex:
+    """
+    In-memory near-duplicate index over email bodies.
+
+    Bodies are shingled into word n-grams and summarized with MinHash; LSH
+    banding finds candidates, which are confirmed by estimated Jaccard
+    similarity. Because a re-sent circular with new dates or amounts can
+    share almost all of its wording with the old one, the numbers in both
+    bodies must also agree at the same threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        seed: int = 1
+    ):
+        """
+        Initialize near-duplicate index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity to count as a duplicate
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by bands)
+            shingle_size: Words per shingle
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2**31 - 1, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 2**31 - 1, size=num_perm).astype(np.uint64)
+
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._numbers: Dict[str, Set[str]] = {}
+        self._buckets: Dict[Tuple[int, bytes], List[str]] = {}
+
+    def signature(self, words: List[str]) -> np.ndarray:
+        """
+        Compute the MinHash signature of a token list.
+
+        Args:
+            words: Normalized word tokens
+
+        Returns:
+            uint64 array of length num_perm
+        """
+        n = self.shingle_size
+        shingles = {" ".join(words[i:i + n]) for i in range(max(1, len(words) - n + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+
+        signature = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for start in range(0, len(hashes), _HASH_BATCH):
+            batch = hashes[start:start + _HASH_BATCH, None]
+            permuted = (batch * self._a + self._b) % _PRIME
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature
+
+    def find(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed body above the threshold.
+
+        Args:
+            text: Email body
+
+        Returns:
+            Tuple of (key, estimated similarity), or None if no near-duplicate
+        """
+        words = normalize_for_similarity(text)
+        return self._find(self.signature(words), self._number_set(words))
+
+    def add(self, key: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Look up a body and index it if it is not a near-duplicate.
+
+        Args:
+            key: Identifier of the body (e.g. source file)
+            text: Email body
+
+        Returns:
+            The matching (key, similarity) if the body is a near-duplicate,
+            else None (and the body is added to the index)
+        """
+        words = normalize_for_similarity(text)
+        signature = self.signature(words)
+        numbers = self._number_set(words)
+
+        match = self._find(signature, numbers)
+        if match is not None:
+            return match
+
+        self._signatures[key] = signature
+        self._numbers[key] = numbers
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+        return None
+
+    def _find(self, signature: np.ndarray, numbers: Set[str]) -> Optional[Tuple[str, float]]:
+        """Best confirmed candidate from the LSH buckets."""
+        candidates = {
+            key
+            for band_key in self._band_keys(signature)
+            for key in self._buckets.get(band_key, ())
+        }
+
+        best = None
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity < self.threshold:
+                continue
+            if self._jaccard(numbers, self._numbers[key]) < self.threshold:
+                continue
+            if best is None or similarity > best[1]:
+                best = (key, similarity)
+        return best
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        """LSH bucket keys, one per band."""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _number_set(self, words: List[str]) -> Set[str]:
+        """Tokens containing digits (dates, amounts, codes)."""
+        return {w for w in words if _HAS_DIGIT.search(w)}
+
+    @staticmethod
+    def _jaccard(a: Set[str], b: Set[str]) -> float:
+        """Exact Jaccard similarity of two sets (1.0 if both are empty)."""
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
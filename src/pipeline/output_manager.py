@@ -1,18 +1,23 @@
 """Output management for saving extraction results and scheme headers."""
 
+import io
 import json
 import logging
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 import pandas as pd
 
+from src.cache import hash_payload
 from src.config import ExtractionConfig
 from src.models import ExtractionResult, SchemeHeader, ProcessingMetadata
 
 logger = logging.getLogger(__name__)
 
+_TABLE_FILE = re.compile(r"_(?:page(?P<page>\d+)_)?table_(?P<index>\d+)\.csv$")
+
 
 class OutputManager:
     """
@@ -57,6 +62,7 @@ class OutputManager:
         logger.debug(f"Saved text to: {text_file}")
         
         # Save tables as CSV
+        table_files = []
         for idx, table_dict in enumerate(result.tables, 1):
             page = table_dict.get('page', '')
             table_idx = table_dict.get('table_index', idx)
@@ -69,6 +75,7 @@ class OutputManager:
             # Write CSV content
             with open(csv_file, "w", encoding="utf-8") as f:
                 f.write(table_dict.get('csv_content', ''))
+            table_files.append(csv_file.name)
             
             logger.debug(f"Saved table to: {csv_file}")
         
@@ -81,7 +88,9 @@ class OutputManager:
             "table_count": result.table_count,
             "used_ocr": result.used_ocr,
             "email_subject": result.email_subject,
-            "text_length": len(result.full_text)
+            "text_length": len(result.full_text),
+            # Write order, so a reload rebuilds the same combined body
+            "table_files": table_files
         }
         
         with open(summary_file, "w", encoding="utf-8") as f:
@@ -90,6 +99,78 @@ class OutputManager:
         
         logger.info(f"Extraction results saved: {result.table_count} tables, {len(result.full_text)} chars")
     
+    def load_extraction_result(self, pdf_path: Path, output_dir: Path) -> Optional[ExtractionResult]:
+        """
+        Rebuild an ExtractionResult from outputs saved by save_extraction_result.
+        
+        Args:
+            pdf_path: Path to the source PDF
+            output_dir: Run directory the outputs were saved to
+            
+        Returns:
+            ExtractionResult, or None if the saved outputs are missing or unreadable
+        """
+        output_dir = Path(output_dir)
+        summary_files = sorted(output_dir.glob("*_summary.json"))
+        if not summary_files:
+            return None
+        
+        summary_file = summary_files[0]
+        pdf_id = summary_file.name[:-len("_summary.json")]
+        text_file = output_dir / f"{pdf_id}_full_text.txt"
+        
+        try:
+            with open(summary_file, "r", encoding="utf-8") as f:
+                summary = json.load(f)
+            with open(text_file, "r", encoding="utf-8") as f:
+                full_text = f.read()
+            
+            subject = summary.get("email_subject")
+            subject_line = f"Subject: {subject}\n\n"
+            if subject and full_text.startswith(subject_line):
+                full_text = full_text[len(subject_line):]
+            
+            # Saved outputs list their tables in write order; older ones
+            # did not, so their tables are sorted by page and index instead
+            ordered = "table_files" in summary
+            if ordered:
+                csv_files = [output_dir / name for name in summary["table_files"]]
+            else:
+                csv_files = output_dir.glob(f"{pdf_id}*.csv")
+            
+            tables = []
+            for csv_file in csv_files:
+                match = _TABLE_FILE.search(csv_file.name)
+                if not match:
+                    continue
+                csv_content = csv_file.read_text(encoding="utf-8")
+                df = pd.read_csv(io.StringIO(csv_content)) if csv_content.strip() else pd.DataFrame()
+                page = int(match.group("page")) if match.group("page") else None
+                tables.append({
+                    'data': df.to_dict(orient='records'),
+                    'columns': df.columns.tolist(),
+                    'csv_content': csv_content,
+                    'page': page,
+                    'table_index': int(match.group("index")),
+                    'extractor': None,
+                })
+            if not ordered:
+                tables.sort(key=lambda t: (t['page'] or 0, t['table_index']))
+            
+            return ExtractionResult(
+                pdf_path=Path(pdf_path),
+                full_text=full_text,
+                email_subject=subject,
+                tables=tables,
+                page_count=summary.get("page_count", 0),
+                table_count=summary.get("table_count", len(tables)),
+                used_ocr=summary.get("used_ocr", False),
+                extraction_timestamp=datetime.fromisoformat(summary["extraction_timestamp"])
+            )
+        except Exception as e:
+            logger.warning(f"Could not load saved extraction from {output_dir}: {e}")
+            return None
+    
     def save_schemes(
         self,
         schemes: List[SchemeHeader],
@@ -171,70 +252,93 @@ class OutputManager:
         # Also return DataFrame for compatibility
         return pd.DataFrame(scheme_data)
     
-    def load_extracted_emails(self) -> pd.DataFrame:
+    def load_extracted_emails(self, latest_only: bool = False) -> pd.DataFrame:
         """
         Load previously extracted emails from output directory.
         
+        Args:
+            latest_only: Only load the newest timestamped run of each PDF
+        
         Returns:
-            DataFrame with columns: mail_subject, mail_body, sourceFile
+            DataFrame with columns: mail_subject, mail_body, sourceFile, content_hash
         """
         logger.info(f"Loading extracted emails from: {self.config.output_dir}")
         
         email_records = []
         
         # Walk through output directory
+        text_files = []
         for dirpath in Path(self.config.output_dir).rglob("*"):
             if not dirpath.is_dir():
                 continue
             
             # Look for full_text files
-            text_files = list(dirpath.glob("*_full_text.txt"))
+            for text_file in dirpath.glob("*_full_text.txt"):
+                text_files.append((dirpath, text_file))
+        
+        if latest_only:
+            text_files = self._latest_runs(text_files)
+        
+        for dirpath, text_file in text_files:
+            # Extract base name
+            base = text_file.stem.replace("_full_text", "")
             
-            for text_file in text_files:
-                # Extract base name
-                base = text_file.stem.replace("_full_text", "")
-                
-                # Read text content
-                with open(text_file, "r", encoding="utf-8", errors="ignore") as f:
-                    txt_content = f.read()
-                
-                # Extract subject
-                subject = self._extract_subject(txt_content, base)
-                
-                # Collect tables
-                table_files = sorted(dirpath.glob(f"{base}*.csv"))
-                tables_text = ""
-                for csv_file in table_files:
-                    try:
-                        df = pd.read_csv(csv_file)
-                        tables_text += f"\n\nTABLE FROM {csv_file.name}\n{df.to_csv(index=False)}"
-                    except Exception as e:
-                        logger.warning(f"Failed to read table {csv_file}: {e}")
-                
-                # Read summary if exists
-                summary_file = dirpath / f"{base}_summary.json"
-                summary_text = ""
-                if summary_file.exists():
-                    try:
-                        with open(summary_file, "r", encoding="utf-8") as f:
-                            summary_data = json.load(f)
-                        summary_text = f"\n\nSUMMARY:\n{json.dumps(summary_data, indent=2)}"
-                    except Exception as e:
-                        logger.warning(f"Failed to read summary {summary_file}: {e}")
-                
-                # Combine all content
-                full_body = txt_content + tables_text + summary_text
-                source_file = f"{base}.pdf"
-                
-                email_records.append({
-                    "mail_subject": subject,
-                    "mail_body": full_body,
-                    "sourceFile": source_file
-                })
+            # Read text content
+            with open(text_file, "r", encoding="utf-8", errors="ignore") as f:
+                txt_content = f.read()
+            
+            # Extract subject
+            subject = self._extract_subject(txt_content, base)
+            
+            # Collect tables
+            table_files = sorted(dirpath.glob(f"{base}*.csv"))
+            tables_text = ""
+            for csv_file in table_files:
+                try:
+                    df = pd.read_csv(csv_file)
+                    tables_text += f"\n\nTABLE FROM {csv_file.name}\n{df.to_csv(index=False)}"
+                except Exception as e:
+                    logger.warning(f"Failed to read table {csv_file}: {e}")
+            
+            # Read summary if exists
+            summary_file = dirpath / f"{base}_summary.json"
+            summary_text = ""
+            if summary_file.exists():
+                try:
+                    with open(summary_file, "r", encoding="utf-8") as f:
+                        summary_data = json.load(f)
+                    summary_text = f"\n\nSUMMARY:\n{json.dumps(summary_data, indent=2)}"
+                except Exception as e:
+                    logger.warning(f"Failed to read summary {summary_file}: {e}")
+            
+            # Combine all content
+            full_body = txt_content + tables_text + summary_text
+            source_file = f"{base}.pdf"
+            
+            email_records.append({
+                "mail_subject": subject,
+                "mail_body": full_body,
+                "sourceFile": source_file,
+                # Summary carries a per-run timestamp; hash content only
+                "content_hash": hash_payload([subject, txt_content + tables_text])
+            })
         
         logger.info(f"Loaded {len(email_records)} extracted emails")
         return pd.DataFrame(email_records)
     
+    def _latest_runs(self, text_files: List[Tuple[Path, Path]]) -> List[Tuple[Path, Path]]:
+        """Keep only the newest timestamped run directory for each extracted PDF."""
+        latest = {}
+        for dirpath, text_file in text_files:
+            key = (dirpath.parent, text_file.name)
+            if key not in latest or dirpath.name > latest[key][0].name:
+                latest[key] = (dirpath, text_file)
+        
+        skipped = len(text_files) - len(latest)
+        if skipped:
+            logger.info(f"Skipping {skipped} superseded run directories")
+        return sorted(latest.values())
+    
     def _extract_subject(self, text: str, fallback: str) -> str:
         """Extract subject from text or use fallback."""
         for line in text.splitlines():
@@ -0,0 +1,218 @@
+"""
+Cross-process token-bucket rate limiting for API calls.
+
+Several pipeline processes can share one API key. Each limiter keeps its
+bucket state in a small JSON file under an OS file lock, so every process
+using the same key draws from the same request and token budgets.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import msvcrt
+    HAS_MSVCRT = True
+except ImportError:
+    HAS_MSVCRT = False
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to reserve tokens before a call
+CHARS_PER_TOKEN = 4
+
+# Longest single sleep while waiting, so refunds from other processes are seen
+MAX_WAIT_SLICE = 5.0
+
+
+def estimate_message_tokens(messages: Iterable[Dict[str, Any]]) -> int:
+    """
+    Estimate prompt tokens for chat messages without a tokenizer.
+
+    Args:
+        messages: Chat messages with 'content'
+
+    Returns:
+        Approximate token count
+    """
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // CHARS_PER_TOKEN + 1
+
+
+class TokenBucketRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute buckets shared across processes.
+
+    Each bucket holds up to one minute of budget and refills continuously.
+    acquire() blocks until both buckets can cover the call; settle() returns
+    any over-reserved tokens once actual usage is known.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        state_dir: Optional[Path] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            key: Identity of the shared budget (e.g. the API key; only its hash is stored)
+            requests_per_minute: Request limit (None = unlimited)
+            tokens_per_minute: Token limit (None = unlimited)
+            state_dir: Directory for the shared state file (defaults to the temp dir)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        state_dir = Path(state_dir or tempfile.gettempdir())
+        state_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = state_dir / f"ratelimit_{digest}.json"
+        self.lock_path = state_dir / f"ratelimit_{digest}.lock"
+
+        # Threads in this process serialize before taking the file lock
+        self._thread_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(self.requests_per_minute or self.tokens_per_minute)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request and the given tokens are available, then take them.
+
+        Args:
+            tokens: Tokens to reserve for the call (prompt estimate + max output)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        waited = 0.0
+        while True:
+            with self._locked_state() as state:
+                wait = self._wait_needed(state, tokens)
+                if wait <= 0:
+                    state["requests"] -= 1
+                    state["tokens"] -= tokens
+                    if waited > 0:
+                        logger.info(f"Rate limiter released call after {waited:.1f}s")
+                    return waited
+
+            sleep_for = min(wait, MAX_WAIT_SLICE)
+            time.sleep(sleep_for)
+            waited += sleep_for
+
+    def settle(self, reserved_tokens: int, actual_tokens: Optional[int]) -> None:
+        """
+        Correct the token bucket once actual usage is known.
+
+        Args:
+            reserved_tokens: Tokens taken by acquire()
+            actual_tokens: Tokens the call really used (None if unknown)
+        """
+        if not self.tokens_per_minute or actual_tokens is None:
+            return
+
+        with self._locked_state() as state:
+            state["tokens"] = min(
+                float(self.tokens_per_minute),
+                state["tokens"] + reserved_tokens - actual_tokens
+            )
+
+    def _wait_needed(self, state: Dict[str, float], tokens: int) -> float:
+        """Seconds until both buckets can cover the call (0 if now)."""
+        wait = 0.0
+        if self.requests_per_minute and state["requests"] < 1:
+            wait = max(wait, (1 - state["requests"]) * 60.0 / self.requests_per_minute)
+        if self.tokens_per_minute and state["tokens"] < tokens:
+            wait = max(wait, (tokens - state["tokens"]) * 60.0 / self.tokens_per_minute)
+        return wait
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, float]]:
+        """Load, refill and yield bucket state under the lock, then save it."""
+        with self._thread_lock:
+            with open(self.lock_path, "a+b") as lock_file:
+                self._lock_file(lock_file)
+                try:
+                    state = self._refill(self._read_state())
+                    yield state
+                    self._write_state(state)
+                finally:
+                    self._unlock_file(lock_file)
+
+    def _refill(self, state: Optional[Dict[str, float]]) -> Dict[str, float]:
+        """Add budget accrued since the last update (new buckets start full)."""
+        now = time.time()
+        rpm = float(self.requests_per_minute or 0)
+        tpm = float(self.tokens_per_minute or 0)
+
+        if state is None:
+            return {"requests": rpm, "tokens": tpm, "updated": now}
+
+        elapsed = max(0.0, now - state.get("updated", now))
+        return {
+            "requests": min(rpm, state.get("requests", rpm) + elapsed * rpm / 60.0),
+            "tokens": min(tpm, state.get("tokens", tpm) + elapsed * tpm / 60.0),
+            "updated": now,
+        }
+
+    def _read_state(self) -> Optional[Dict[str, float]]:
+        """Read shared state (None if missing or unreadable)."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, state: Dict[str, float]) -> None:
+        """Write shared state atomically."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _lock_file(self, lock_file) -> None:
+        """Take an exclusive OS lock on the lock file."""
+        if HAS_FCNTL:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        elif HAS_MSVCRT:
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    return
+                except OSError:
+                    # LK_LOCK gives up after ~10s; keep waiting
+                    continue
+
+    def _unlock_file(self, lock_file) -> None:
+        """Release the OS lock."""
+        if HAS_FCNTL:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        elif HAS_MSVCRT:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,22 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from src.config import ExtractionConfig
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Configuration with every directory under tmp_path and no LLM cache."""
+    return ExtractionConfig(
+        openrouter_api_key="test-key",
+        input_dir=tmp_path / "input",
+        output_dir=tmp_path / "output",
+        final_output_dir=tmp_path / "out",
+        logs_dir=tmp_path / "logs",
+        cot_log_dir=tmp_path / "logs" / "cot",
+        llm_log_dir=tmp_path / "logs" / "llm",
+        scheme_gate_audit_log=tmp_path / "logs" / "gate.jsonl",
+        llm_cache_enabled=False,
+        incremental_runs=True,
+    )
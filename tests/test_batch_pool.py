@@ -0,0 +1,38 @@
+"""Tests for multi-PDF extraction across the batch process pool."""
+
+from src.pipeline.extraction_pipeline import ExtractionPipeline
+from tests.test_document_session import make_pdf
+
+
+def make_pdfs(config, tmp_path):
+    """PDFs of very different sizes so pool workers finish out of order."""
+    config.camelot_enabled = False
+    config.extraction_cache_enabled = False
+    paths = []
+    for i, page_count in enumerate([40, 1, 25, 2, 10, 1]):
+        pages = [f"Subject: Scheme {i}"] + [f"Mail {i} page {n}" for n in range(2, page_count + 1)]
+        paths.append(make_pdf(tmp_path / f"mail{i}.pdf", pages))
+    return paths
+
+
+def test_pool_results_keep_input_order(config, tmp_path):
+    pdf_paths = make_pdfs(config, tmp_path)
+    pipeline = ExtractionPipeline(config)
+
+    pooled = pipeline.process_multiple_pdfs(pdf_paths, save_output=False, max_workers=3)
+    sequential = pipeline.process_multiple_pdfs(pdf_paths, save_output=False, max_workers=1)
+
+    assert [r.pdf_path for r in pooled] == pdf_paths
+    assert [r.email_subject for r in pooled] == [f"Scheme {i}" for i in range(6)]
+    assert [r.full_text for r in pooled] == [r.full_text for r in sequential]
+    assert [r.page_count for r in pooled] == [40, 1, 25, 2, 10, 1]
+
+
+def test_pool_interleaves_saved_and_new_results_in_input_order(config, tmp_path):
+    pdf_paths = make_pdfs(config, tmp_path)
+    ExtractionPipeline(config).process_multiple_pdfs(pdf_paths[1::2], max_workers=1)
+
+    results = ExtractionPipeline(config).process_multiple_pdfs(pdf_paths, max_workers=3)
+
+    assert [r.pdf_path for r in results] == pdf_paths
+    assert [r.email_subject for r in results] == [f"Scheme {i}" for i in range(6)]
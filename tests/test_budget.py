@@ -0,0 +1,71 @@
+"""Tests for token budgeting and chunking of email bodies."""
+
+import random
+
+from src.llm.budget import InputBudgeter, OMISSION_MARKER, TokenCounter
+
+# One counter for all tests (tiktoken may try to download its encoding)
+COUNTER = TokenCounter()
+
+
+def make_body(seed: int) -> str:
+    """Random email body of paragraphs and tables."""
+    rnd = random.Random(seed)
+    words = ["scheme", "offer", "discount", "valid", "01/04/2025", "Rs 500", "10%",
+             "vendor", "the", "and", "support", "claim", "model", "regards"]
+    blocks = ["Subject: Scheme update\nFrom: vendor"]
+    for _ in range(rnd.randint(5, 40)):
+        if rnd.random() < 0.3:
+            rows = [" | ".join(rnd.choice(words) for _ in range(4)) for _ in range(rnd.randint(2, 60))]
+            blocks.append("TABLE 1\nFSN | Model | Support | Period\n" + "\n".join(rows))
+        else:
+            blocks.append(" ".join(rnd.choice(words) for _ in range(rnd.randint(5, 300))))
+    return "\n\n".join(blocks)
+
+
+def test_chunks_fit_budget_including_separators():
+    for seed in range(50):
+        budgeter = InputBudgeter(500, COUNTER)
+        for chunk in budgeter.chunk(make_body(seed), overlap_tokens=100):
+            assert budgeter.counter.count(chunk) <= budgeter.token_budget
+
+
+def test_chunks_keep_every_word():
+    for seed in range(50):
+        budgeter = InputBudgeter(500, COUNTER)
+        body = make_body(seed)
+        chunk_words = {word for chunk in budgeter.chunk(body) for word in chunk.split()}
+        assert set(body.split()) <= chunk_words
+
+
+def test_chunks_are_not_repacked():
+    budgeter = InputBudgeter(500, COUNTER)
+    for chunk in budgeter.chunk(make_body(7)):
+        assert budgeter.pack(chunk) == chunk
+        assert OMISSION_MARKER not in chunk
+
+
+def test_packed_body_fits_budget_including_separators_and_markers():
+    for seed in range(50):
+        for budget in (120, 500):
+            budgeter = InputBudgeter(budget, COUNTER)
+            body = make_body(seed)
+            packed = budgeter.pack(body)
+            assert budgeter.counter.count(packed) <= budget
+            if COUNTER.count(body) > budget:
+                assert packed.startswith("Subject: Scheme update")
+
+
+def test_short_body_is_unchanged():
+    budgeter = InputBudgeter(500, COUNTER)
+    assert budgeter.chunk("Subject: hi\n\nshort body") == ["Subject: hi\n\nshort body"]
+    assert budgeter.pack("short body") == "short body"
+
+
+def test_oversized_word_is_sliced_within_budget():
+    budgeter = InputBudgeter(500, COUNTER)
+    word = "x" * 5000
+    chunks = budgeter.chunk(f"Subject: hi\n\n{word}", overlap_tokens=0)
+
+    assert all(budgeter.counter.count(chunk) <= 500 for chunk in chunks)
+    assert "".join(chunk.split("\n\n", 1)[1].replace("\n", "") for chunk in chunks) == word
@@ -0,0 +1,82 @@
+"""Tests for the size-bounded disk cache and payload hashing."""
+
+import os
+import random
+import time
+
+from src.cache import DiskCache, hash_payload
+
+
+def test_overwriting_a_key_keeps_the_size_exact(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_size_bytes=10_000_000)
+    cache.set("ab01", "x" * 100)
+
+    for i in range(50):
+        cache.set("ab01", "y" * (100 + i))
+        cache.set(f"cd{i:02d}", i)
+
+    assert cache._size_bytes == cache._scan_size()
+
+
+def test_random_operations_track_disk_size_and_limit(tmp_path):
+    rng = random.Random(0)
+    cache = DiskCache(tmp_path / "cache", max_size_bytes=20_000)
+    keys = [f"{i:02x}{i:02x}" for i in range(40)]
+
+    for _ in range(500):
+        key = rng.choice(keys)
+        if rng.random() < 0.7:
+            cache.set(key, "v" * rng.randint(0, 1500))
+        else:
+            cache.get(key)
+        if cache._size_bytes is not None:
+            assert cache._size_bytes == cache._scan_size()
+            assert cache._size_bytes <= cache.max_size_bytes
+
+
+def test_round_trip_and_ttl(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_size_bytes=1_000_000, ttl_seconds=60)
+    cache.set("ab01", {"schemes": [1, 2]})
+
+    assert cache.get("ab01") == {"schemes": [1, 2]}
+    assert cache.get("ab02") is None
+
+    cache.ttl_seconds = -1
+    assert cache.get("ab01") is None
+
+
+def test_eviction_removes_least_recently_used_first(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_size_bytes=3000)
+    for age, key in ((300, "aa01"), (200, "bb02"), (100, "cc03")):
+        cache.set(key, "v" * 800)
+        stamp = time.time() - age
+        os.utime(cache._entry_path(key), (stamp, stamp))
+    # Reading refreshes aa01, so bb02 is now the oldest entry
+    cache.get("aa01")
+
+    cache.set("dd04", "v" * 800)
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") is not None
+
+
+def test_hash_payload_ignores_key_order():
+    assert hash_payload({"a": 1, "b": [1, 2]}) == hash_payload({"b": [1, 2], "a": 1})
+    assert hash_payload({"a": 1}) != hash_payload({"a": 2})
+
+
+def test_expired_and_unreadable_entries_leave_the_size_exact(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_size_bytes=1_000_000, ttl_seconds=60)
+    for key in ("aa01", "bb02", "cc03"):
+        cache.set(key, "v" * 500)
+    cache.set("aa01", "w" * 500)
+    cache._entry_path("bb02").write_text("{not json", encoding="utf-8")
+    cache._size_bytes = cache._scan_size()
+
+    assert cache.get("bb02") is None
+    cache.ttl_seconds = -1
+    assert cache.get("cc03") is None
+
+    assert not cache._entry_path("bb02").exists()
+    assert not cache._entry_path("cc03").exists()
+    assert cache._size_bytes == cache._scan_size()
@@ -0,0 +1,67 @@
+"""Tests for cascade routing between model tiers."""
+
+from src.llm.cascade import CascadeExtractor, CascadeTier
+from src.models import LLMResponse, SchemeHeader
+
+
+class FakeExtractor:
+    """Extractor returning a fixed response and counting calls."""
+
+    def __init__(self, response: LLMResponse):
+        self.response = response
+        self.calls = 0
+
+    def extract(self, email_subject: str, email_body: str) -> LLMResponse:
+        self.calls += 1
+        return self.response
+
+
+def make_cascade(small_response: LLMResponse, min_confidence: float = 0.8):
+    small = FakeExtractor(small_response)
+    large = FakeExtractor(LLMResponse(schemes=[SchemeHeader(scheme_name="large")]))
+    cascade = CascadeExtractor(
+        [CascadeTier("small", small), CascadeTier("large", large)],
+        min_confidence=min_confidence
+    )
+    return cascade, small, large
+
+
+def test_scheme_without_reported_confidence_is_accepted():
+    cascade, _, large = make_cascade(LLMResponse(schemes=[SchemeHeader(scheme_name="small")]))
+
+    response = cascade.extract("subject", "body")
+
+    assert response.schemes[0].scheme_name == "small"
+    assert large.calls == 0
+    assert cascade.get_tier_stats()["small"]["hit_rate"] == 1.0
+
+
+def test_low_reported_confidence_escalates():
+    cascade, _, large = make_cascade(
+        LLMResponse(schemes=[SchemeHeader(scheme_name="small", confidence=0.4)])
+    )
+
+    response = cascade.extract("subject", "body")
+
+    assert response.schemes[0].scheme_name == "large"
+    assert large.calls == 1
+    assert cascade.get_tier_stats()["small"]["escalations"] == {"low_confidence": 1}
+
+
+def test_empty_response_is_accepted():
+    cascade, _, large = make_cascade(LLMResponse(schemes=[]))
+
+    assert cascade.extract("subject", "body").schemes == []
+    assert large.calls == 0
+
+
+def test_failed_or_unparsed_response_escalates():
+    for response, reason in (
+        (LLMResponse(schemes=[], error="timeout"), "error"),
+        (LLMResponse(schemes=[], parse_failed=True), "parse_failed"),
+        (LLMResponse(schemes=[SchemeHeader(needs_escalation=True)]), "needs_escalation"),
+    ):
+        cascade, _, large = make_cascade(response)
+        cascade.extract("subject", "body")
+        assert large.calls == 1
+        assert cascade.get_tier_stats()["small"]["escalations"] == {reason: 1}
@@ -0,0 +1,95 @@
+"""Tests for concurrent scheme extraction across emails."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.llm.llm_client import OpenRouterLLM
+from src.llm.llm_logger import LLMLogger
+from src.models import LLMResponse, SchemeHeader
+from src.pipeline.extraction_pipeline import EmailInput, ExtractionPipeline
+from tests.test_llm_client import make_response
+
+
+def make_pipeline(config, delays, failing=()):
+    """Pipeline whose extractor sleeps per subject and tracks requests in flight."""
+    config.near_duplicate_detection = False
+    pipeline = ExtractionPipeline(config)
+    pipeline.gate = None
+    pipeline.field_repairer = None
+    pipeline.manifest = None
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def extract(subject, body):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            time.sleep(delays[subject])
+            if subject in failing:
+                raise RuntimeError("upstream timeout")
+            return LLMResponse(schemes=[SchemeHeader(scheme_name=subject)])
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    pipeline.scheme_extractor.extract = extract
+    return pipeline, state
+
+
+def test_results_keep_input_order_with_bounded_concurrency(config):
+    # Earlier emails are slower, so requests complete in reverse order
+    delays = {f"Scheme {i}": 0.01 * (8 - i) for i in range(8)}
+    pipeline, state = make_pipeline(config, delays)
+    emails = [EmailInput(subject, f"body {subject}", f"{i}.pdf") for i, subject in enumerate(delays)]
+
+    schemes = pipeline.extract_schemes_batch(emails, max_workers=3)
+
+    assert list(schemes) == [f"{i}.pdf" for i in range(8)]
+    assert [s[0].scheme_name for s in schemes.values()] == list(delays)
+    assert 1 < state["peak"] <= 3
+
+
+def test_failed_request_yields_no_schemes_and_the_batch_continues(config):
+    delays = {"A": 0.0, "B": 0.0, "C": 0.0}
+    pipeline, _ = make_pipeline(config, delays, failing={"B"})
+    emails = [EmailInput(subject, f"body {subject}", f"{subject}.pdf") for subject in delays]
+
+    schemes = pipeline.extract_schemes_batch(emails, max_workers=2)
+
+    assert schemes["B.pdf"] == []
+    assert [s.scheme_name for s in schemes["A.pdf"] + schemes["C.pdf"]] == ["A", "C"]
+
+
+def test_logger_call_ids_are_unique_across_threads(tmp_path):
+    llm_logger = LLMLogger(log_dir=tmp_path, enable_file_logging=False)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        call_ids = list(executor.map(
+            lambda i: llm_logger.log_request("test/model", [{"role": "user", "content": str(i)}], 0.0, 10),
+            range(400)
+        ))
+
+    assert len(set(call_ids)) == 400
+    assert llm_logger.call_counter == 400
+
+
+def test_last_call_is_tracked_per_thread():
+    client = OpenRouterLLM(api_key="test-key", model="test/model", enable_logging=False, max_retries=0)
+    barrier = threading.Barrier(2)
+
+    def post(url, json=None, timeout=None):
+        prompt = json["messages"][-1]["content"]
+        return make_response(200, {"choices": [{"message": {"content": prompt}}], "usage": {}})
+
+    client.session.post = post
+
+    def call(prompt):
+        client(prompt=prompt)
+        # Both threads have finished their call before either reads last_call
+        barrier.wait()
+        return client.last_call["response"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(call, ["first", "second"])) == ["first", "second"]
@@ -0,0 +1,102 @@
+"""Tests for the fused line-streaming ContentCleaner."""
+
+import random
+import re
+
+from src.cleaners.text_cleaners import (
+    EMAIL_HEADER_PREFIXES,
+    GMAIL_NOISE_RE,
+    SEPARATOR_LINE_RE,
+    ContentCleaner,
+    DisclaimerFilter,
+)
+
+LINES = [
+    "Subject: Price drop scheme",
+    "From: Category Team <team@example.com>",
+    "Sent: Monday, 6 October 2026",
+    "To: partner@example.com",
+    "Support of Rs 500 per unit on listed FSNs",
+    "Valid from 01/10/2026 to 15/10/2026",
+    "If you are not the intended recipient, please notify the sender immediately.",
+    "CAUTION: External email. Think before you click links.",
+    "Disclaimer: this email and any files transmitted with it are confidential.",
+    "unauthorized use of this message is prohibited",
+    "[image: logo.png]",
+    "  [cid:image001.png@01D]  ",
+    "<image002.jpg>",
+    "----------",
+    "-----",
+    "",
+    "",
+    "   ",
+    "\t",
+    "  indented scheme line  ",
+    "Regards,",
+]
+
+
+def reference_clean(text: str) -> str:
+    """The filters applied one after another on whole strings, as before fusion."""
+    lines = [line for line in text.split("\n") if not line.startswith(EMAIL_HEADER_PREFIXES)]
+
+    disclaimer = DisclaimerFilter()
+    kept, in_disclaimer = [], False
+    for line in lines:
+        if disclaimer.looks_like_disclaimer(line):
+            in_disclaimer = True
+            continue
+        if in_disclaimer:
+            if SEPARATOR_LINE_RE.match(line) or not line.strip():
+                in_disclaimer = False
+            continue
+        kept.append(line)
+
+    text = "\n".join(line for line in kept if not GMAIL_NOISE_RE.match(line))
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def test_cleans_headers_disclaimers_and_noise():
+    text = "\n".join([
+        "",
+        "  Subject: Price drop scheme",
+        "From: Category Team",
+        "Support of Rs 500 per unit",
+        "",
+        "",
+        "",
+        "[image: logo.png]",
+        "If you are not the intended recipient, please notify the sender immediately.",
+        "still part of the disclaimer",
+        "",
+        "Regards,",
+        "   ",
+    ])
+
+    assert ContentCleaner().clean_text(text) == (
+        "Subject: Price drop scheme\nSupport of Rs 500 per unit\n\nRegards,"
+    )
+
+
+def test_matches_the_sequential_filters():
+    rng = random.Random(0)
+    cleaner = ContentCleaner()
+    for _ in range(3000):
+        text = "\n".join(rng.choice(LINES) for _ in range(rng.randint(0, 25)))
+        assert cleaner.clean_text(text) == reference_clean(text), text
+
+
+def test_filters_stream_lines_lazily():
+    consumed = []
+
+    def source():
+        for line in ["Subject: hi", "From: a", "body", "more"]:
+            consumed.append(line)
+            yield line
+
+    lines = source()
+    for filter_obj in ContentCleaner().filters:
+        lines = filter_obj.filter_lines(lines)
+
+    assert next(lines) == "Subject: hi"
+    assert consumed == ["Subject: hi"]
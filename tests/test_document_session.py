@@ -0,0 +1,105 @@
+"""Tests for the shared PDF document session."""
+
+from pathlib import Path
+from typing import List
+
+import pdfplumber
+
+from src.extractors import document
+from src.extractors.document import PDFDocumentSession
+from src.extractors.pdf_processor import PDFProcessor
+
+
+def make_pdf(path: Path, pages: List[str]) -> Path:
+    """Write a minimal text-only PDF with one line of text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(out)
+    return path
+
+
+def count_parses(monkeypatch):
+    """Record every pdfplumber open and page text extraction."""
+    calls = {"open": 0, "extract_text": 0}
+    real_open = pdfplumber.open
+    real_extract_text = pdfplumber.page.Page.extract_text
+
+    def counting_open(*args, **kwargs):
+        calls["open"] += 1
+        return real_open(*args, **kwargs)
+
+    def counting_extract_text(self, *args, **kwargs):
+        calls["extract_text"] += 1
+        return real_extract_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(document.pdfplumber, "open", counting_open)
+    monkeypatch.setattr(pdfplumber.page.Page, "extract_text", counting_extract_text)
+    return calls
+
+
+def test_page_text_is_parsed_once(monkeypatch, tmp_path):
+    pdf_path = make_pdf(tmp_path / "mail.pdf", ["Subject: Price drop scheme", "Support Rs 500"])
+    calls = count_parses(monkeypatch)
+
+    with PDFDocumentSession(pdf_path) as session:
+        assert session.page_count == 2
+        first = [session.page_text(n) for n in (1, 2)]
+        second = [session.page_text(n) for n in (1, 2)]
+        session.page_tables(1)
+        session.page_tables(1)
+
+    assert first == second == ["Subject: Price drop scheme", "Support Rs 500"]
+    assert calls == {"open": 1, "extract_text": 2}
+
+
+def test_processor_opens_the_document_once(config, monkeypatch, tmp_path):
+    config.camelot_enabled = False
+    config.extraction_cache_enabled = False
+    pages = ["Subject: Price drop scheme", "Support Rs 500 per unit", "Valid till 31/10/2026"]
+    pdf_path = make_pdf(tmp_path / "mail.pdf", pages)
+    calls = count_parses(monkeypatch)
+
+    result = PDFProcessor(config).process(pdf_path)
+
+    assert calls == {"open": 1, "extract_text": 3}
+    assert result.page_count == 3
+    assert result.email_subject == "Price drop scheme"
+    assert "Valid till 31/10/2026" in result.full_text
+
+
+def test_close_releases_handles_and_allows_reopening(tmp_path):
+    pdf_path = make_pdf(tmp_path / "mail.pdf", ["one", "two"])
+    session = PDFDocumentSession(pdf_path)
+    assert len(session.pdfium) == session.page_count == 2
+
+    session.close()
+
+    assert session._plumber is None and session._pdfium is None
+    assert session.page_count == 2
+    session.close()
@@ -0,0 +1,88 @@
+"""Tests for targeted scheme field repair."""
+
+from types import SimpleNamespace
+
+from src.llm.field_repair import FieldRepairer
+from src.models import SchemeHeader
+
+
+class FakeModule:
+    """Stand-in for a dspy.Predict module returning a fixed prediction."""
+
+    def __init__(self, **outputs):
+        self.outputs = outputs
+        self.calls = 0
+
+    def __call__(self, **inputs):
+        self.calls += 1
+        return SimpleNamespace(**self.outputs)
+
+
+def make_repairer(config):
+    repairer = FieldRepairer(llm=None, config=config)
+    repairer.date_module = FakeModule(
+        starting_at="2025-04-01", ending_at="2025-04-30",
+        duration_start_date=None, duration_end_date=None, price_drop_date=None
+    )
+    repairer.financial_module = FakeModule(discount_type="PERCENTAGE", brand_support_absolute=5000.0)
+    repairer.vendor_module = FakeModule(vendors_json='[{"name": "Acme Corp"}]')
+    return repairer
+
+
+def complete_scheme(**overrides):
+    fields = dict(
+        scheme_name="Summer offer", vendor_name="Acme Corp", scheme_type="BUY_SIDE",
+        scheme_period="Duration", start_date="01/04/2025", end_date="30/04/2025",
+        discount_type="Absolute", brand_support_absolute="Not Applicable",
+    )
+    fields.update(overrides)
+    return SchemeHeader(**fields)
+
+
+def test_absent_answers_do_not_trigger_repair(config):
+    repairer = make_repairer(config)
+    scheme = complete_scheme(
+        start_date="Not Specified", end_date="Not Specified",
+        discount_type="Not Specified", vendor_name="Not Specified",
+        scheme_type="ONE_OFF", brand_support_absolute="Not Applicable",
+        scheme_subtype="PDC", price_drop_date="Not Applicable",
+    )
+
+    assert repairer.find_issues(scheme) == {}
+    assert repairer.repair(scheme, "subject", "body") is scheme
+
+
+def test_missing_fields_are_repaired(config):
+    repairer = make_repairer(config)
+    scheme = complete_scheme(start_date=None, end_date="2025/04/30", vendor_name="")
+
+    repaired = repairer.repair(scheme, "subject", "body")
+
+    assert repaired.start_date == "01/04/2025"
+    assert repaired.end_date == "30/04/2025"
+    assert repaired.duration == "01/04/2025 to 30/04/2025"
+    assert repaired.vendor_name == "Acme Corp"
+
+
+def test_identical_reasks_are_sent_once_per_email(config):
+    repairer = make_repairer(config)
+    schemes = [
+        complete_scheme(scheme_name=f"Offer {i}", vendor_name="", scheme_type="ONE_OFF",
+                        brand_support_absolute="TBD")
+        for i in range(3)
+    ]
+
+    repaired = repairer.repair_all(schemes, "subject", "body")
+
+    assert [s.vendor_name for s in repaired] == ["Acme Corp"] * 3
+    assert [s.brand_support_absolute for s in repaired] == ["5000"] * 3
+    assert repairer.vendor_module.calls == 1
+
+
+def test_percentage_discount_is_not_guessed(config):
+    repairer = make_repairer(config)
+    scheme = complete_scheme(discount_type="percent off MRP or NLC")
+
+    repaired = repairer.repair(scheme, "subject", "Discount of 10% on MRP")
+
+    assert repaired.discount_type == "percent off MRP or NLC"
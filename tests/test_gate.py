@@ -0,0 +1,100 @@
+"""Tests for the scheme gate scoring, threshold and batch reporting."""
+
+import json
+import logging
+
+from src.models import LLMResponse, SchemeHeader
+from src.pipeline.extraction_pipeline import EmailInput, ExtractionPipeline
+from src.pipeline.gate import SchemeGate
+
+TABLE_ONLY_BODY = (
+    "Hi team,\n\nPlease find below.\n\n"
+    "TABLE FROM q3-1a2b3c4d_page1_table_0.csv\n"
+    "Model | Rs 1,200 | 5%\n"
+    "Model B | Rs 900 | 3%\n"
+)
+AUTO_REPLY_BODY = "I am out of the office until Monday with limited access to email."
+NEWSLETTER_BODY = (
+    "Our monthly newsletter is here. View this email in your browser. "
+    "Unsubscribe or manage your preferences at any time."
+)
+
+
+def test_subject_only_keywords_pass():
+    decision = SchemeGate().score("Price Protection Scheme - Diwali", "PFA")
+
+    assert decision.passed
+    assert decision.signals["subject_terms"] == 2
+    assert decision.signals["body_terms"] == 0
+    assert decision.score == 4.0
+
+
+def test_table_only_amounts_pass():
+    decision = SchemeGate().score("Fwd: Q3", TABLE_ONLY_BODY)
+
+    assert decision.passed
+    assert decision.signals["subject_terms"] == 0
+    assert decision.signals["body_terms"] == 0
+    assert decision.signals["tables"] == 1
+    assert decision.signals["amounts"] == 4
+
+
+def test_auto_replies_and_newsletters_are_skipped():
+    gate = SchemeGate()
+
+    assert not gate.score("Automatic reply: Scheme", AUTO_REPLY_BODY).passed
+    assert not gate.score("October edition", NEWSLETTER_BODY).passed
+
+
+def test_threshold_is_inclusive():
+    # One subject term scores exactly 2.0
+    assert SchemeGate(threshold=2.0).score("Offer", "").passed
+    assert not SchemeGate(threshold=2.5).score("Offer", "").passed
+
+
+def test_scores_are_capped_per_signal():
+    decision = SchemeGate().score("", "scheme " * 50)
+
+    assert decision.signals["body_terms"] == 50
+    assert decision.score == 10.0
+
+
+def test_every_decision_is_audited(tmp_path):
+    audit_log = tmp_path / "gate.jsonl"
+    gate = SchemeGate(audit_log=audit_log)
+
+    gate.check("Scheme", "", "a.pdf")
+    gate.check("Hello", "", "b.pdf")
+
+    records = [json.loads(line) for line in audit_log.read_text().splitlines()]
+    assert [(r["source_file"], r["decision"]) for r in records] == [
+        ("a.pdf", "extract"),
+        ("b.pdf", "skip"),
+    ]
+
+
+def test_skipped_emails_are_listed_in_the_batch_summary(config, caplog):
+    pipeline = ExtractionPipeline(config)
+    pipeline.field_repairer = None
+    pipeline.manifest = None
+    calls = []
+
+    def extract(subject, body):
+        calls.append(subject)
+        return LLMResponse(schemes=[SchemeHeader(scheme_name=subject)])
+
+    pipeline.scheme_extractor.extract = extract
+    emails = [
+        EmailInput("Price Protection Scheme", "PFA", "scheme.pdf"),
+        EmailInput("Automatic reply: Scheme", AUTO_REPLY_BODY, "ooo.pdf"),
+        EmailInput("Fwd: Q3", TABLE_ONLY_BODY, "table.pdf"),
+        EmailInput("October edition", NEWSLETTER_BODY, "news.pdf"),
+    ]
+
+    with caplog.at_level(logging.WARNING, logger="src.pipeline.extraction_pipeline"):
+        schemes = pipeline.extract_schemes_batch(emails, max_workers=2)
+
+    assert sorted(calls) == ["Fwd: Q3", "Price Protection Scheme"]
+    assert schemes["ooo.pdf"] == [] and schemes["news.pdf"] == []
+    assert "Gate skipped 2/4 emails with no scheme signals" in caplog.text
+    assert "ooo.pdf, news.pdf" in caplog.text
@@ -0,0 +1,148 @@
+"""Tests for hedged LLM requests and the accounting of losing copies."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.llm.hedging import LatencyTracker, run_hedged
+from src.llm.llm_client import OpenRouterLLM
+from src.llm.llm_logger import LLMLogger
+from tests.test_llm_client import RecordingLimiter, make_response
+
+USAGE = {"prompt_tokens": 30, "completion_tokens": 10, "total_tokens": 40}
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out waiting for condition"
+        time.sleep(0.01)
+
+
+def slow_then_fast(release, results=("slow", "fast")):
+    """Callable whose first invocation blocks until released."""
+    calls = []
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            calls.append(len(calls))
+            number = calls[-1]
+        if number == 0:
+            release.wait(5)
+        return results[min(number, 1)]
+
+    return call, calls
+
+
+def test_fast_call_is_not_hedged():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result, outcome = run_hedged(executor, lambda: "done", 1.0, on_loser=lambda f: None)
+
+    assert result == "done"
+    assert not outcome.fired
+
+
+def test_duplicate_wins_and_the_original_is_handed_to_on_loser():
+    release = threading.Event()
+    call, calls = slow_then_fast(release)
+    losers = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result, outcome = run_hedged(executor, call, 0.05, on_loser=losers.append)
+        assert (result, outcome.fired, outcome.hedge_won) == ("fast", True, True)
+        assert losers == []
+        release.set()
+        wait_for(lambda: losers)
+
+    assert losers[0].result() == "slow"
+    assert len(calls) == 2
+
+
+def test_first_error_is_raised_when_both_copies_fail():
+    def fail():
+        time.sleep(0.1)
+        raise TimeoutError("upstream timeout")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(TimeoutError):
+            run_hedged(executor, fail, 0.01, on_loser=lambda f: None)
+
+
+def test_latency_percentile_waits_for_enough_samples():
+    tracker = LatencyTracker(window=10)
+    for latency in range(1, 5):
+        tracker.record(float(latency))
+
+    assert tracker.percentile(95, min_samples=5) is None
+    tracker.record(5.0)
+    assert tracker.percentile(95, min_samples=5) == 5.0
+    assert tracker.percentile(50) == 3.0
+
+
+def test_losing_copy_is_billed_in_history_logger_and_limiter(tmp_path):
+    limiter = RecordingLimiter()
+    client = OpenRouterLLM(
+        api_key="test-key",
+        model="test/model",
+        max_retries=0,
+        llm_logger=LLMLogger(
+            log_dir=tmp_path,
+            enable_file_logging=False,
+            input_cost_per_1m_tokens=1.0,
+            output_cost_per_1m_tokens=2.0,
+        ),
+        rate_limiter=limiter,
+        hedge_percentile=95,
+        hedge_min_samples=1,
+    )
+    client.latency_tracker.record(0.05)
+    release = threading.Event()
+    post_once, _ = slow_then_fast(release, results=(
+        make_response(200, {"choices": [{"message": {"content": "slow"}}], "usage": USAGE}),
+        make_response(200, {"choices": [{"message": {"content": "fast"}}], "usage": USAGE}),
+    ))
+    client.session.post = lambda url, json=None, timeout=None: post_once()
+
+    assert client(prompt="scheme mail") == ["fast"]
+    release.set()
+    wait_for(lambda: client.get_usage_stats()["hedge_losers"] == 1)
+
+    stats = client.get_usage_stats()
+    assert stats["total_tokens"] == 80
+    assert stats["num_calls"] == 2
+    hedge_stats = client.llm_logger.get_hedge_stats()
+    assert (hedge_stats["hedges_fired"], hedge_stats["hedge_wins"]) == (1, 1)
+    assert hedge_stats["hedge_extra_tokens"] == 40
+    assert hedge_stats["hedge_extra_cost"] == pytest.approx((30 * 1.0 + 10 * 2.0) / 1_000_000)
+    reserved = limiter.acquired[0]
+    assert sorted(limiter.settled) == [(reserved, 40), (reserved, 40)]
+
+
+def test_losing_copy_without_usage_releases_its_reservation(tmp_path):
+    limiter = RecordingLimiter()
+    client = OpenRouterLLM(
+        api_key="test-key",
+        model="test/model",
+        max_retries=0,
+        enable_logging=False,
+        rate_limiter=limiter,
+        hedge_percentile=95,
+        hedge_min_samples=1,
+    )
+    client.latency_tracker.record(0.05)
+    release = threading.Event()
+    post_once, _ = slow_then_fast(release, results=(
+        make_response(200, {"choices": [{"message": {"content": "slow"}}], "usage": None}),
+        make_response(200, {"choices": [{"message": {"content": "fast"}}], "usage": USAGE}),
+    ))
+    client.session.post = lambda url, json=None, timeout=None: post_once()
+
+    assert client(prompt="scheme mail") == ["fast"]
+    release.set()
+    wait_for(lambda: client.get_usage_stats()["hedge_losers"] == 1)
+
+    reserved = limiter.acquired[0]
+    assert sorted(limiter.settled) == [(reserved, 0), (reserved, 40)]
@@ -0,0 +1,90 @@
+"""Tests for skipping unchanged PDFs on incremental runs."""
+
+from src.models import ExtractionResult
+from src.pipeline.extraction_pipeline import ExtractionPipeline
+
+
+def make_pipeline(config, monkeypatch):
+    """Pipeline whose PDF processor returns a fixed result and counts calls."""
+    pipeline = ExtractionPipeline(config)
+    calls = []
+
+    def fake_process(pdf_path):
+        calls.append(pdf_path)
+        return ExtractionResult(
+            pdf_path=pdf_path,
+            full_text="Scheme body\nline two",
+            email_subject="Price drop scheme",
+            tables=[
+                {"csv_content": "FSN,Support\nA1,500\n", "page": 2, "table_index": 1},
+                {"csv_content": "Model,Payout\nX,10%\n", "page": 10, "table_index": 1},
+            ],
+            page_count=10,
+            table_count=2,
+        )
+
+    monkeypatch.setattr(pipeline.pdf_processor, "process", fake_process)
+    return pipeline, calls
+
+
+def run_dirs(config):
+    return sorted(p for p in config.output_dir.rglob("*") if p.is_dir())
+
+
+def test_unchanged_pdf_is_loaded_not_extracted(config, monkeypatch, tmp_path):
+    pdf_path = tmp_path / "mail.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 test")
+
+    pipeline, calls = make_pipeline(config, monkeypatch)
+    first = pipeline.process_pdf(pdf_path)
+    dirs = run_dirs(config)
+
+    rerun, rerun_calls = make_pipeline(config, monkeypatch)
+    second = rerun.process_pdf(pdf_path)
+
+    assert len(calls) == 1
+    assert rerun_calls == []
+    assert run_dirs(config) == dirs
+    assert second.full_text == first.full_text
+    assert second.email_subject == first.email_subject
+    assert second.page_count == 10
+    assert [t["csv_content"] for t in second.tables] == [t["csv_content"] for t in first.tables]
+    assert second.combined_body == first.combined_body
+
+
+def test_changed_pdf_is_extracted_again(config, monkeypatch, tmp_path):
+    pdf_path = tmp_path / "mail.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 test")
+    pipeline, calls = make_pipeline(config, monkeypatch)
+    pipeline.process_pdf(pdf_path)
+
+    pdf_path.write_bytes(b"%PDF-1.4 changed")
+    pipeline.process_pdf(pdf_path)
+
+    assert len(calls) == 2
+
+
+def test_reloaded_tables_keep_their_extraction_order(config, monkeypatch, tmp_path):
+    pdf_path = tmp_path / "mail.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 test")
+    pipeline, _ = make_pipeline(config, monkeypatch)
+    tables = [
+        {"csv_content": "Model,Payout\nX,10%\n", "page": 3, "table_index": 2},
+        {"csv_content": "FSN,Support\nA1,500\n", "page": 2, "table_index": 1},
+        {"csv_content": "Bank,Offer\nHDFC,5%\n"},
+    ]
+    monkeypatch.setattr(
+        pipeline.pdf_processor,
+        "process",
+        lambda path: ExtractionResult(
+            pdf_path=path, full_text="Scheme body", tables=tables, page_count=3, table_count=3
+        ),
+    )
+    first = pipeline.process_pdf(pdf_path)
+
+    rerun, rerun_calls = make_pipeline(config, monkeypatch)
+    second = rerun.process_pdf(pdf_path)
+
+    assert rerun_calls == []
+    assert [t["csv_content"] for t in second.tables] == [t["csv_content"] for t in tables]
+    assert second.combined_body == first.combined_body
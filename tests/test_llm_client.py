@@ -0,0 +1,83 @@
+"""Tests for OpenRouterLLM request handling with a mocked HTTP session."""
+
+import json
+
+import pytest
+import requests
+
+from src.llm.llm_client import OpenRouterLLM
+
+RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}}}
+
+
+class RecordingLimiter:
+    """Rate limiter that records reservations and settlements."""
+
+    def __init__(self):
+        self.acquired = []
+        self.settled = []
+
+    def acquire(self, tokens: int = 0) -> float:
+        self.acquired.append(tokens)
+        return 0.0
+
+    def settle(self, reserved_tokens, actual_tokens):
+        self.settled.append((reserved_tokens, actual_tokens))
+
+
+def make_response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    response.url = "https://openrouter.ai/api/v1/chat/completions"
+    return response
+
+
+OK = {"choices": [{"message": {"content": "{}"}}], "usage": {"total_tokens": 42}}
+
+
+def make_client(responses):
+    limiter = RecordingLimiter()
+    client = OpenRouterLLM(
+        api_key="test-key",
+        model="test/model",
+        enable_logging=False,
+        max_retries=0,
+        rate_limiter=limiter,
+    )
+    payloads = []
+
+    def post(url, json=None, timeout=None):
+        payloads.append(dict(json))
+        return responses.pop(0)
+
+    client.session.post = post
+    return client, limiter, payloads
+
+
+def test_response_format_rejection_falls_back_and_settles():
+    client, limiter, payloads = make_client([
+        make_response(400, {"error": {"message": "response_format json_schema is not supported"}}),
+        make_response(200, OK),
+    ])
+
+    assert client(prompt="hi", response_format=RESPONSE_FORMAT) == ["{}"]
+
+    assert "response_format" in payloads[0]
+    assert "response_format" not in payloads[1]
+    assert client.response_format_supported is False
+    reserved = limiter.acquired[0]
+    assert limiter.settled == [(reserved, 0), (reserved, 42)]
+
+
+def test_unrelated_bad_request_keeps_structured_output():
+    client, limiter, payloads = make_client([
+        make_response(400, {"error": {"message": "maximum context length exceeded"}}),
+    ])
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client(prompt="hi", response_format=RESPONSE_FORMAT)
+
+    assert len(payloads) == 1
+    assert client.response_format_supported is True
+    assert limiter.settled == [(limiter.acquired[0], 0)]
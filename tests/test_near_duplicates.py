@@ -0,0 +1,124 @@
+"""Tests for near-duplicate detection and scheme reuse in batch extraction."""
+
+import json
+
+from src.models import ExtractionResult, LLMResponse, ProcessingMetadata, SchemeHeader
+from src.pipeline.extraction_pipeline import EmailInput, ExtractionPipeline
+from src.pipeline.near_duplicates import NearDuplicateIndex, normalize_for_similarity
+from src.pipeline.output_manager import OutputManager
+
+BODY = (
+    "Dear partner, we are pleased to share the price drop scheme for the festive "
+    "season on all listed footwear models. Support of Rs 500 per unit will be "
+    "passed on sales between 01/10/2026 and 15/10/2026 for the FSNs in the "
+    "attached sheet, subject to the usual claim process and documentation. "
+    "Please confirm acceptance by replying to this email at the earliest."
+)
+FORWARD = "---------- Forwarded message ---------\nFrom: Category Team\n\n" + BODY
+REPLY = "> quoted line\nSent: Monday\n\n" + BODY
+
+
+def with_summary(body, timestamp, page_count):
+    """Body as built by OutputManager.load_extracted_emails."""
+    summary = {
+        "extraction_timestamp": timestamp,
+        "page_count": page_count,
+        "table_count": 0,
+        "used_ocr": False,
+        "text_length": len(body) + page_count,
+    }
+    return body + f"\n\nSUMMARY:\n{json.dumps(summary, indent=2)}"
+
+
+def test_summary_numbers_are_not_compared():
+    first = with_summary(BODY, "2026-10-01T09:15:02.123456", 2)
+    second = with_summary(FORWARD, "2026-10-14T17:40:55.654321", 3)
+
+    assert normalize_for_similarity(first) == normalize_for_similarity(BODY)
+
+    index = NearDuplicateIndex(threshold=0.9)
+    assert index.add("first", first) is None
+    assert index.add("second", second)[0] == "first"
+
+
+def test_saved_copies_with_tables_are_duplicates(config, tmp_path):
+    output_manager = OutputManager(config)
+    table = {"csv_content": "FSN,Support\nSHOE1234,500\nSHOE5678,450\n", "page": 2, "table_index": 1}
+    for pdf_id, text, timestamp in [
+        ("scheme-1a2b3c4d", BODY, "20261001_091502"),
+        ("Fwd_scheme-9f8e7d6c", FORWARD, "20261014_174055"),
+    ]:
+        output_dir = config.output_dir / pdf_id / timestamp
+        output_dir.mkdir(parents=True)
+        output_manager.save_extraction_result(
+            ExtractionResult(
+                pdf_path=tmp_path / f"{pdf_id}.pdf",
+                full_text=text,
+                email_subject="Price drop scheme",
+                tables=[table],
+                page_count=2,
+                table_count=1,
+            ),
+            ProcessingMetadata(pdf_id=pdf_id, pdf_filename=f"{pdf_id}.pdf", output_directory=output_dir),
+        )
+
+    emails_df = output_manager.load_extracted_emails()
+    emails = [
+        EmailInput(row["mail_subject"], row["mail_body"], row["sourceFile"])
+        for _, row in emails_df.iterrows()
+    ]
+
+    assert all("TABLE FROM" in email.body for email in emails)
+    assert len(ExtractionPipeline(config)._find_near_duplicates(emails)) == 1
+
+
+def test_summary_like_text_inside_the_body_is_kept():
+    body = "SUMMARY:\n{\n  \"support\": 500\n}\n\nmore text follows"
+
+    assert "500" in normalize_for_similarity(body)
+
+
+def make_pipeline(config, failing_bodies):
+    pipeline = ExtractionPipeline(config)
+    pipeline.gate = None
+    pipeline.field_repairer = None
+    pipeline.manifest = None
+    calls = []
+
+    def extract(subject, body):
+        calls.append(body)
+        if body in failing_bodies:
+            return LLMResponse(error="upstream timeout")
+        return LLMResponse(schemes=[SchemeHeader(scheme_name=subject)])
+
+    pipeline.scheme_extractor.extract = extract
+    return pipeline, calls
+
+
+def test_duplicates_reuse_the_original_schemes(config):
+    pipeline, calls = make_pipeline(config, failing_bodies=set())
+    emails = [
+        EmailInput("Scheme", BODY, "a.pdf"),
+        EmailInput("Fwd: Scheme", FORWARD, "b.pdf"),
+    ]
+
+    schemes = pipeline.extract_schemes_batch(emails, max_workers=1)
+
+    assert calls == [BODY]
+    assert [s.source_file for s in schemes["b.pdf"]] == ["b.pdf"]
+
+
+def test_duplicate_is_extracted_when_original_fails(config):
+    pipeline, calls = make_pipeline(config, failing_bodies={BODY})
+    emails = [
+        EmailInput("Scheme", BODY, "a.pdf"),
+        EmailInput("Fwd: Scheme", FORWARD, "b.pdf"),
+        EmailInput("Re: Scheme", REPLY, "c.pdf"),
+    ]
+
+    schemes = pipeline.extract_schemes_batch(emails, max_workers=2)
+
+    assert calls == [BODY, FORWARD]
+    assert schemes["a.pdf"] == []
+    assert [s.scheme_name for s in schemes["b.pdf"]] == ["Fwd: Scheme"]
+    assert [(s.scheme_name, s.source_file) for s in schemes["c.pdf"]] == [("Fwd: Scheme", "c.pdf")]
@@ -0,0 +1,92 @@
+"""Tests for OCR page handling with rendering and tesseract stubbed out."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.extractors.text_extractors import OCRTextExtractor, _omp_thread_limit
+
+
+class FakeSession:
+    """Document session exposing a page list in place of a pdfium handle."""
+
+    def __init__(self, page_count: int):
+        self.pdfium = list(range(page_count))
+
+
+class StubOCRExtractor(OCRTextExtractor):
+    """OCR extractor that fails on chosen pages instead of running tesseract."""
+
+    def __init__(self, fail_pages, max_workers=1):
+        super().__init__(max_workers=max_workers)
+        self.fail_pages = set(fail_pages)
+        self.omp_limits = []
+
+    def _render_page(self, pdf, page_num):
+        if page_num in self.fail_pages:
+            raise RuntimeError("render failed")
+        return page_num
+
+    def _ocr_image(self, pil_image):
+        self.omp_limits.append(os.environ.get("OMP_THREAD_LIMIT"))
+        if -pil_image in self.fail_pages:
+            raise RuntimeError("tesseract failed")
+        return f"page {pil_image}"
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_failed_pages_are_skipped_in_both_paths(monkeypatch, max_workers):
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    extractor = StubOCRExtractor(fail_pages={2, -4}, max_workers=max_workers)
+
+    page_texts = extractor.extract_pages(None, session=FakeSession(5))
+
+    assert page_texts == {1: "page 1", 3: "page 3", 5: "page 5"}
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+def test_parallel_ocr_limits_omp_threads_only_while_running(monkeypatch):
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    extractor = StubOCRExtractor(fail_pages=set(), max_workers=2)
+
+    extractor.extract_pages(None, session=FakeSession(3))
+
+    assert extractor.omp_limits == ["1", "1", "1"]
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+def test_overlapping_pools_keep_the_omp_limit_until_the_last_finishes(monkeypatch):
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    first, second = _omp_thread_limit(1), _omp_thread_limit(1)
+
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert os.environ.get("OMP_THREAD_LIMIT") == "1"
+
+    second.__exit__(None, None, None)
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+def test_concurrent_ocr_pools_all_run_with_the_omp_limit(monkeypatch):
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    extractors = [StubOCRExtractor(fail_pages=set(), max_workers=2) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(
+            lambda extractor: extractor.extract_pages(None, session=FakeSession(20)),
+            extractors
+        ))
+
+    assert all(limit == "1" for extractor in extractors for limit in extractor.omp_limits)
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+
+def test_user_omp_limit_is_left_alone(monkeypatch):
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "4")
+
+    with _omp_thread_limit(1):
+        assert os.environ["OMP_THREAD_LIMIT"] == "4"
+
+    assert os.environ["OMP_THREAD_LIMIT"] == "4"
@@ -0,0 +1,73 @@
+"""Tests for the MODELs OpenRouterClient rate-limit bookkeeping."""
+
+import pytest
+import requests
+
+from MODELs import openrouter_client
+from MODELs.openrouter_client import OpenRouterClient
+from tests.test_llm_client import OK, RecordingLimiter, make_response
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(openrouter_client.time, "sleep", lambda seconds: None)
+
+
+def make_client(responses, max_retries=3):
+    client = OpenRouterClient(api_key="test-key", max_retries=max_retries)
+    limiter = RecordingLimiter()
+    client.rate_limiter = limiter
+    client.session.post = lambda url, json=None, timeout=None: responses.pop(0)
+    return client, limiter
+
+
+def test_retried_attempts_release_their_reservation():
+    client, limiter = make_client([
+        make_response(503, {"error": "unavailable"}),
+        make_response(200, OK),
+    ])
+
+    result = client.create_completion("test/model", "hello", max_tokens=10)
+
+    assert result["success"]
+    reserved = limiter.acquired[0]
+    assert limiter.settled == [(reserved, 0), (reserved, 42)]
+
+
+def test_failed_attempt_releases_its_reservation():
+    client, limiter = make_client([make_response(401, {"error": "unauthorized"})])
+
+    result = client.create_completion("test/model", "hello", max_tokens=10)
+
+    assert not result["success"]
+    assert limiter.settled == [(limiter.acquired[0], 0)]
+
+
+def test_malformed_env_limit_is_ignored(monkeypatch):
+    monkeypatch.setenv("LLM_RATE_LIMIT_RPM", "sixty")
+    assert openrouter_client._env_int("LLM_RATE_LIMIT_RPM") is None
+    monkeypatch.setenv("LLM_RATE_LIMIT_RPM", "60")
+    assert openrouter_client._env_int("LLM_RATE_LIMIT_RPM") == 60
+
+
+def test_timed_out_attempt_keeps_its_reservation():
+    def post(url, json=None, timeout=None):
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    client, limiter = make_client([], max_retries=2)
+    client.session.post = post
+
+    result = client.create_completion("test/model", "hello", max_tokens=10)
+
+    assert not result["success"]
+    assert len(limiter.acquired) == 2
+    assert limiter.settled == []
+
+
+def test_null_usage_keeps_the_reservation():
+    client, limiter = make_client([make_response(200, {**OK, "usage": None})])
+
+    result = client.create_completion("test/model", "hello", max_tokens=10)
+
+    assert result["success"]
+    assert limiter.settled == [(limiter.acquired[0], None)]
@@ -0,0 +1,72 @@
+"""Tests for page-sharded parallel pdfplumber extraction."""
+
+from src.extractors import parallel
+from src.extractors.document import PDFDocumentSession
+from src.extractors.parallel import extract_pages_parallel, shard_pages
+from src.extractors.pdf_processor import PDFProcessor
+from tests.test_document_session import count_parses, make_pdf
+
+PAGES = [f"Page {n} support Rs {n}00 per unit" for n in range(1, 12)]
+
+
+def test_shards_are_contiguous_and_cover_every_page():
+    for page_count in range(0, 30):
+        for shard_count in range(1, 9):
+            shards = shard_pages(page_count, shard_count)
+            assert [p for shard in shards for p in shard] == list(range(1, page_count + 1))
+            assert len(shards) <= shard_count
+
+
+def test_parallel_pages_match_sequential(tmp_path):
+    pdf_path = make_pdf(tmp_path / "mail.pdf", PAGES)
+
+    pages = extract_pages_parallel(pdf_path, len(PAGES), max_workers=2)
+
+    with PDFDocumentSession(pdf_path) as session:
+        expected = {n: (session.page_text(n), session.page_tables(n)) for n in range(1, 12)}
+    assert pages == expected
+
+
+def test_preloaded_pages_are_not_parsed_again(monkeypatch, tmp_path):
+    pdf_path = make_pdf(tmp_path / "mail.pdf", PAGES)
+
+    with PDFDocumentSession(pdf_path) as session:
+        session.preload_pages(max_workers=2)
+        calls = count_parses(monkeypatch)
+        texts = [session.page_text(n) for n in range(1, 12)]
+
+    assert texts == PAGES
+    assert calls["extract_text"] == 0
+
+
+def test_pool_failure_falls_back_to_sequential_parsing(monkeypatch, tmp_path):
+    pdf_path = make_pdf(tmp_path / "mail.pdf", PAGES)
+
+    def broken_pool(*args, **kwargs):
+        raise OSError("cannot start worker processes")
+
+    monkeypatch.setattr(parallel, "extract_pages_parallel", broken_pool)
+    with PDFDocumentSession(pdf_path) as session:
+        session.preload_pages(max_workers=2)
+        assert session._page_text == {}
+        assert [session.page_text(n) for n in range(1, 12)] == PAGES
+
+
+def test_sharded_processing_matches_sequential(config, monkeypatch, tmp_path):
+    config.camelot_enabled = False
+    config.extraction_cache_enabled = False
+    pdf_path = make_pdf(tmp_path / "mail.pdf", PAGES)
+    sequential = PDFProcessor(config).process(pdf_path)
+
+    config.page_workers = 2
+    config.parallel_page_threshold = 4
+    sharded = PDFProcessor(config).process(pdf_path)
+
+    def broken_pool(*args, **kwargs):
+        raise OSError("cannot start worker processes")
+
+    monkeypatch.setattr(parallel, "extract_pages_parallel", broken_pool)
+    fallback = PDFProcessor(config).process(pdf_path)
+
+    assert sharded.full_text == fallback.full_text == sequential.full_text
+    assert sharded.tables == fallback.tables == sequential.tables
@@ -0,0 +1,68 @@
+"""Tests for the single-pass phrase matcher."""
+
+import random
+
+from src.cleaners.phrase_matcher import PhraseMatcher
+from src.cleaners.text_cleaners import DISCLAIMER_KEY_PHRASES, DisclaimerFilter
+
+
+def random_texts(phrases, count=3000, seed=0):
+    """Texts mixing phrases, phrase fragments, case changes and noise."""
+    rnd = random.Random(seed)
+    fragments = list(phrases) + [p[: len(p) // 2] for p in phrases] + [
+        "scheme", "offer", " ", "\n", "  ", "Rs 500", "the", "email", "and any files",
+    ]
+    texts = []
+    for _ in range(count):
+        parts = [rnd.choice(fragments) for _ in range(rnd.randint(0, 8))]
+        text = "".join(p.upper() if rnd.random() < 0.2 else p for p in parts)
+        texts.append(text)
+    return texts
+
+
+def test_exact_matcher_agrees_with_substring_checks():
+    phrases = DISCLAIMER_KEY_PHRASES + ["disclaimer notice", "caution"]
+    matcher = PhraseMatcher(phrases, flexible_whitespace=False)
+    for text in random_texts(phrases):
+        expected = {p for p in phrases if p in text.lower()}
+        assert matcher.distinct_matches(text) == expected
+        assert matcher.contains_any(text) == bool(expected)
+
+
+def test_overlapping_phrases_are_counted():
+    matcher = PhraseMatcher(DISCLAIMER_KEY_PHRASES, flexible_whitespace=False)
+    text = "Please delete this email and any files transmitted with it are confidential."
+
+    assert matcher.distinct_matches(text) == {
+        "delete this email",
+        "this email and any files transmitted with it are confidential",
+    }
+    assert DisclaimerFilter().looks_like_disclaimer(text)
+
+
+def test_limit_stops_early():
+    matcher = PhraseMatcher(["ab", "bc", "cd"])
+    assert len(matcher.distinct_matches("abcd", limit=2)) == 2
+
+
+def test_flexible_matcher_agrees_with_normalized_substring_checks():
+    phrases = ["intended recipient", "strictly prohibited", "intended"]
+    prefixes = ["disclaimer:", "caution:"]
+    matcher = PhraseMatcher(phrases, prefixes=prefixes)
+    for text in random_texts(phrases + prefixes, seed=1):
+        low = " ".join(text.lower().split())
+        expected = any(p in low for p in phrases) or low.startswith(tuple(prefixes))
+        assert matcher.contains_any(text) == expected
+
+
+def test_disclaimer_filter_matches_reference():
+    def reference(text):
+        text_lower = text.lower()
+        count = sum(1 for phrase in DISCLAIMER_KEY_PHRASES if phrase in text_lower)
+        if count >= 2:
+            return True
+        return len(text) > 500 and "\n\n" not in text and count > 0
+
+    disclaimer_filter = DisclaimerFilter()
+    for text in random_texts(DISCLAIMER_KEY_PHRASES, seed=2):
+        assert disclaimer_filter.looks_like_disclaimer(text) == reference(text)
@@ -0,0 +1,166 @@
+"""Tests for PII masking and sequential/parallel redaction runs."""
+
+import json
+import random
+import re
+
+import pytest
+
+from run_redaction import PIIMasker, process_extracted_files
+
+
+def test_masks_each_kind_of_pii():
+    masker = PIIMasker()
+    text = "Call Rohit Sharma on 9876543210 or mail rohit.s@vendor.com; Puma Kumar team."
+
+    masked = masker.apply_pii_masking(text)
+
+    assert masked == "Call [PERSON_1] on [PHONE_1] or mail [EMAIL_1]@vendor.com; Puma Kumar team."
+
+
+def test_name_is_masked_everywhere_once_seen_away_from_a_company():
+    masker = PIIMasker()
+
+    text = "Regards, Manish, category lead.\nFlipkart Manish desk."
+
+    masked = masker.apply_pii_masking(text)
+
+    assert masked == "Regards, [PERSON_1], category lead.\nFlipkart [PERSON_1] desk."
+
+
+def test_name_masked_elsewhere_is_masked_inside_a_longer_name():
+    masker = PIIMasker()
+    text = "Please call Rohit tomorrow about the offer.\nFlipkart Rohit Sharma desk."
+
+    assert masker.apply_pii_masking(text) == (
+        "Please call [PERSON_1] tomorrow about the offer.\nFlipkart [PERSON_1] Sharma desk."
+    )
+    assert PIIMasker().apply_pii_masking("Thanks Manish for the update on claims.\nPuma Manish Kumar") == (
+        "Thanks [PERSON_1] for the update on claims.\nPuma [PERSON_1] Kumar"
+    )
+
+
+def test_repeated_values_share_a_token():
+    masker = PIIMasker()
+
+    masked = masker.apply_pii_masking("a@x.com b@y.com a@x.com 1234567890 1234567890")
+
+    assert masked == "[EMAIL_1]@x.com [EMAIL_2]@y.com [EMAIL_1]@x.com [PHONE_1] [PHONE_1]"
+
+
+def test_keyed_tokens_do_not_depend_on_order_or_masker():
+    values = [f"user{i}@example.com" for i in range(20)]
+    shuffled = values[:]
+    random.Random(0).shuffle(shuffled)
+
+    first = PIIMasker(b"key")
+    second = PIIMasker(b"key")
+    first.apply_pii_masking(" ".join(values))
+    second.apply_pii_masking(" ".join(shuffled))
+
+    assert first.get_mapping() == second.get_mapping()
+    assert PIIMasker(b"other").mask_email(values[0]) != first.mask_email(values[0])
+
+
+def reference_mask(masker, text):
+    """Masking as done by the original sequential replace loops."""
+    text = re.sub(r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
+                  lambda m: masker.mask_email(m.group(1)), text)
+    text = re.sub(r'\b(\d{10})\b', lambda m: masker.mask_phone(m.group(1)), text)
+    for name in masker.common_names:
+        for match in re.finditer(rf'\b({name}(?:\s+[A-Z][a-z]+)?)\b', text):
+            full_name = match.group(1)
+            window = text[max(0, match.start() - 20):match.end() + 20]
+            if not any(company in window for company in masker.preserve_companies):
+                text = text.replace(full_name, masker.mask_name(full_name))
+    return text
+
+
+def visible_words(masked):
+    """Words left in masked text, ignoring how tokens are numbered."""
+    return re.findall(r"\w+", re.sub(r"\[(?:EMAIL|PHONE|PERSON)_\w+\]", " ", masked))
+
+
+def random_email_text(rng, names, companies):
+    """
+    Lines of PII separated by filler lines.
+
+    A company only ever sits right next to one name: the original loop
+    measured the 20-character window on text it had partly masked already,
+    so its result near a company also depended on the token lengths.
+    """
+    fillers = [
+        "Please find the revised claim sheet attached here",
+        "the offer runs for the whole sale period",
+        "support is settled after the period closes",
+    ]
+    name = lambda: rng.choice(names)
+    company = lambda: rng.choice(companies)
+    segments = [
+        lambda: name(), lambda: f"{name()} {name()}", lambda: f"{name()} Team",
+        lambda: f"{company()} {name()}", lambda: f"{name()} {company()}",
+        lambda: f"Thanks {name()}", lambda: f"{name()}, {name()} and {name()}",
+        lambda: f"user{rng.randint(0, 5)}@x{rng.randint(0, 2)}.com",
+        lambda: str(rng.randint(10**9, 10**9 + 5)),
+    ]
+    return "\n".join(
+        f"{rng.choice(segments)()}\n{rng.choice(fillers)}" for _ in range(rng.randint(1, 8))
+    )
+
+
+def test_masks_the_same_words_as_the_original_masker():
+    rng = random.Random(0)
+    names = PIIMasker().common_names
+    companies = PIIMasker().preserve_companies
+    for _ in range(2000):
+        text = random_email_text(rng, names, companies)
+
+        expected = visible_words(reference_mask(PIIMasker(), text))
+
+        assert visible_words(PIIMasker().apply_pii_masking(text)) == expected, text
+
+
+def make_input_tree(root):
+    for i in range(4):
+        folder = root / f"email_{i}"
+        folder.mkdir(parents=True)
+        (folder / f"email_{i}_full_text.txt").write_text(
+            f"Subject: Scheme {i}\n\nHi Aditya Verma,\nPlease call 98765432{i:02d}.\n"
+            f"Contact vendor{i}@brand.com\n",
+            encoding="utf-8",
+        )
+        (folder / f"email_{i}_table_1.csv").write_text(
+            f"owner,phone\nSonika,91234567{i:02d}\n", encoding="utf-8"
+        )
+
+
+def read_tree(root):
+    return {
+        str(path.relative_to(root)): path.read_text(encoding="utf-8")
+        for path in sorted(root.rglob("*")) if path.is_file()
+    }
+
+
+def test_parallel_run_matches_sequential_run_with_same_key(tmp_path, monkeypatch):
+    monkeypatch.setenv("PII_TOKEN_KEY", "test-key")
+    make_input_tree(tmp_path / "in")
+
+    process_extracted_files(tmp_path / "in", tmp_path / "sequential", workers=1)
+    process_extracted_files(tmp_path / "in", tmp_path / "parallel", workers=2)
+
+    sequential = read_tree(tmp_path / "sequential")
+    assert sequential == read_tree(tmp_path / "parallel")
+    assert "9876543200" not in sequential["email_0/email_0_full_text.txt"]
+
+
+def test_parallel_run_without_key_falls_back_to_sequential(tmp_path, monkeypatch):
+    monkeypatch.delenv("PII_TOKEN_KEY", raising=False)
+    make_input_tree(tmp_path / "in")
+
+    process_extracted_files(tmp_path / "in", tmp_path / "first", workers=2)
+    process_extracted_files(tmp_path / "in", tmp_path / "second", workers=2)
+
+    first = read_tree(tmp_path / "first")
+    assert first == read_tree(tmp_path / "second")
+    mapping = json.loads(first["pii_mapping.json"])
+    assert sorted(mapping["phones"].values())[0] == "PHONE_1"
@@ -0,0 +1,97 @@
+"""Tests for retry backoff and the LLM circuit breaker."""
+
+import random
+import threading
+import time
+from email.utils import formatdate
+
+from src.llm.resilience import CircuitBreaker, backoff_delay, parse_retry_after
+
+
+def test_parse_retry_after_seconds_and_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 25 <= parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+
+def test_backoff_is_bounded_and_respects_retry_after():
+    random.seed(0)
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, 1.0, 8.0) <= 8.0
+        assert 5.0 <= backoff_delay(attempt, 1.0, 8.0, retry_after=5.0) <= 8.0
+
+
+def test_opens_once_failure_rate_reaches_threshold():
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, min_calls=4, cooldown_seconds=60)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_probe_success_closes_and_probe_failure_reopens():
+    breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.acquire()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.acquire()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_acquire_waits_for_cooldown():
+    breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0.2)
+    breaker.record_failure()
+
+    started = time.monotonic()
+    breaker.acquire()
+
+    assert time.monotonic() - started >= 0.15
+
+
+def test_only_one_probe_is_dispatched_while_half_open():
+    breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0.05)
+    breaker.record_failure()
+    breaker.acquire()
+    dispatched = []
+
+    def caller():
+        breaker.acquire()
+        dispatched.append(time.monotonic())
+
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    assert dispatched == []
+
+    breaker.record_success()
+    for thread in threads:
+        thread.join(timeout=1)
+    assert len(dispatched) == 3
+
+
+def test_release_frees_the_probe_slot():
+    breaker = CircuitBreaker(min_calls=1, cooldown_seconds=0.05)
+    breaker.record_failure()
+    breaker.acquire()
+    breaker.release()
+
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (breaker.acquire(), done.set()))
+    thread.start()
+
+    assert done.wait(timeout=1)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
@@ -0,0 +1,85 @@
+"""Tests for the on-disk LLM response cache."""
+
+from src.llm.llm_client import OpenRouterLLM
+from src.llm.llm_logger import LLMLogger
+from src.llm.response_cache import LLMResponseCache
+from tests.test_llm_client import make_response
+
+
+def make_client(tmp_path, temperature=0.0, **kwargs):
+    """Client whose API echoes the prompt and counts requests sent."""
+    client = OpenRouterLLM(
+        api_key="test-key",
+        model="test/model",
+        temperature=temperature,
+        max_retries=0,
+        llm_logger=LLMLogger(log_dir=tmp_path / "logs", enable_file_logging=False),
+        response_cache=LLMResponseCache(tmp_path / "cache"),
+        **kwargs
+    )
+    sent = []
+
+    def post(url, json=None, timeout=None):
+        sent.append(json["messages"][-1]["content"])
+        return make_response(200, {
+            "choices": [{"message": {"content": f"answer {len(sent)}"}}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+        })
+
+    client.session.post = post
+    return client, sent
+
+
+def test_repeated_request_is_served_from_the_cache(tmp_path):
+    client, sent = make_client(tmp_path)
+
+    first = client(prompt="scheme mail")
+    second = client(prompt="scheme mail")
+    other = client(prompt="another mail")
+
+    assert first == second == ["answer 1"]
+    assert other == ["answer 2"]
+    assert sent == ["scheme mail", "another mail"]
+    assert client.history[1]["cached"] is True
+    assert client.history[1]["usage"] == {}
+    assert client.llm_logger.get_cache_stats() == {
+        "cache_hits": 1, "cache_misses": 2, "cache_hit_rate": 1 / 3
+    }
+
+
+def test_cached_responses_survive_a_new_client(tmp_path):
+    client, _ = make_client(tmp_path)
+    client(prompt="scheme mail")
+
+    rerun, sent = make_client(tmp_path)
+
+    assert rerun(prompt="scheme mail") == ["answer 1"]
+    assert sent == []
+
+
+def test_sampled_requests_are_not_cached(tmp_path):
+    client, sent = make_client(tmp_path, temperature=0.7)
+
+    client(prompt="scheme mail")
+    client(prompt="scheme mail")
+
+    assert sent == ["scheme mail", "scheme mail"]
+
+
+def test_bypass_skips_the_read_but_refreshes_the_entry(tmp_path):
+    client, sent = make_client(tmp_path)
+    client(prompt="scheme mail")
+
+    assert client(prompt="scheme mail", bypass_cache=True) == ["answer 2"]
+    assert client(prompt="scheme mail") == ["answer 2"]
+    assert sent == ["scheme mail", "scheme mail"]
+
+
+def test_key_depends_on_payload_and_base_url_not_key_order(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache")
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+    reordered = dict(reversed(list(payload.items())))
+
+    assert cache.key_for(payload, "https://a") == cache.key_for(reordered, "https://a")
+    assert cache.key_for(payload, "https://a") != cache.key_for(payload, "https://b")
+    assert cache.key_for(payload, "https://a") != cache.key_for({**payload, "max_tokens": 10}, "https://a")
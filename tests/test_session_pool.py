@@ -0,0 +1,89 @@
+"""Tests for pooled keep-alive connections in OpenRouterLLM."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.llm.llm_client import OpenRouterLLM
+from src.pipeline.extraction_pipeline import ExtractionPipeline
+
+
+class ChatHandler(BaseHTTPRequestHandler):
+    """Keep-alive chat completions endpoint recording client connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        request = json.loads(self.rfile.read(length))
+        self.server.connections.add(self.client_address)
+        self.server.auth.add(self.headers.get("Authorization"))
+        body = json.dumps({
+            "choices": [{"message": {"content": request["messages"][-1]["content"]}}],
+            "usage": {"total_tokens": 3},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ChatHandler)
+    httpd.connections = set()
+    httpd.auth = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_client(server, pool_size):
+    return OpenRouterLLM(
+        api_key="test-key",
+        model="test/model",
+        base_url=f"http://127.0.0.1:{server.server_port}",
+        enable_logging=False,
+        max_retries=0,
+        pool_size=pool_size,
+    )
+
+
+def test_sequential_calls_reuse_one_connection(server):
+    client = make_client(server, pool_size=4)
+
+    responses = [client(prompt=f"call {i}") for i in range(10)]
+
+    assert responses == [[f"call {i}"] for i in range(10)]
+    assert len(server.connections) == 1
+    assert server.auth == {"Bearer test-key"}
+
+
+def test_concurrent_calls_stay_within_the_pool(server):
+    client = make_client(server, pool_size=3)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        responses = list(executor.map(lambda i: client(prompt=f"call {i}"), range(60)))
+
+    assert responses == [[f"call {i}"] for i in range(60)]
+    assert len(server.connections) <= 3
+
+
+def test_pool_grows_to_the_configured_concurrency(config):
+    config.llm_pool_size = 2
+    config.llm_max_concurrency = 6
+
+    pipeline = ExtractionPipeline(config)
+
+    adapter = pipeline.llm.session.get_adapter("https://openrouter.ai/api/v1")
+    assert adapter._pool_maxsize == 6
@@ -0,0 +1,84 @@
+"""Tests for the tolerant JSON parser used on LLM scheme output."""
+
+import json
+import random
+
+import pytest
+
+from src.llm.structured_output import parse_json_tolerant
+
+VALUES = ["x", "a, b", 'q"uote', "{[}]", "tab\tnew\nline", None, True, False, 12.5, -3]
+
+
+def test_clean_json_is_not_repaired():
+    assert parse_json_tolerant('{"schemes": []}') == ({"schemes": []}, False)
+
+
+def test_fences_and_surrounding_text_are_ignored():
+    text = 'Here you go:\n```json\n{"schemes": [{"scheme_name": "A"}]}\n```'
+
+    assert parse_json_tolerant(text)[0] == {"schemes": [{"scheme_name": "A"}]}
+
+
+def test_python_literal_is_accepted():
+    assert parse_json_tolerant("{'schemes': [{'over_and_above': True, 'max_cap': None}]}")[0] == {
+        "schemes": [{"over_and_above": True, "max_cap": None}]
+    }
+
+
+def test_trailing_commas_and_literals_are_fixed():
+    value, repaired = parse_json_tolerant('{"schemes": [{"a": true, "b": None,},],}')
+
+    assert repaired
+    assert value == {"schemes": [{"a": True, "b": None}]}
+
+
+def test_truncated_output_keeps_complete_items_only():
+    text = '{"schemes": [{"scheme_name": "A", "max_cap": 500}, {"scheme_name": "B", "max_cap": 12'
+
+    assert parse_json_tolerant(text) == ({"schemes": [{"scheme_name": "A", "max_cap": 500}]}, True)
+
+
+def test_value_cut_off_in_first_item_is_dropped():
+    assert parse_json_tolerant('{"schemes": [{"scheme_name": "A", "confidence": 0.8')[0] == {
+        "schemes": [{"scheme_name": "A"}]
+    }
+    assert parse_json_tolerant('{"schemes": [{"scheme_name": "A", "vendor_name": "Pum')[0] == {
+        "schemes": [{"scheme_name": "A"}]
+    }
+
+
+def test_text_without_json_raises():
+    with pytest.raises(ValueError):
+        parse_json_tolerant("no schemes found")
+
+
+def test_truncation_fuzz_never_invents_values():
+    rng = random.Random(0)
+    for _ in range(2000):
+        schemes = [
+            {f"field_{j}": rng.choice(VALUES) for j in range(rng.randint(1, 4))}
+            for _ in range(rng.randint(1, 5))
+        ]
+        text = json.dumps({"reasoning": "r", "schemes_json": {"schemes": schemes}})
+        if rng.random() < 0.5 and "{[}]" not in text:
+            text = text.replace("}", ",}").replace("]", ",]")
+        text = text[:rng.randint(1, len(text))]
+
+        try:
+            value, _ = parse_json_tolerant(text)
+        except ValueError:
+            continue
+
+        recovered = value.get("schemes_json", {}).get("schemes", []) if isinstance(value, dict) else []
+        if not recovered:
+            continue
+        # Every item but the first may only be recovered whole; a first item
+        # cut short keeps only its complete fields
+        assert recovered[:-1] == schemes[:len(recovered) - 1]
+        last = recovered[-1]
+        if len(recovered) > 1 or last != schemes[0]:
+            assert last == schemes[len(recovered) - 1] or (
+                len(recovered) == 1
+                and all(last[key] == schemes[0][key] for key in last)
+            )
@@ -0,0 +1,85 @@
+"""Tests for vectorized table cleaning against the per-cell reference."""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from src.cleaners.table_cleaners import DISCLAIMER_KEYWORDS, TableCleaner
+
+CLEANER = TableCleaner()
+
+
+def reference_clean_cell(val):
+    """Per-cell cleaning as done before vectorization."""
+    if CLEANER._is_empty_value(val):
+        return ""
+    if isinstance(val, str):
+        if any(keyword in val.lower() for keyword in DISCLAIMER_KEYWORDS):
+            return ""
+        if val.startswith("[image:") or val.startswith("[cid:"):
+            return ""
+        return val.strip()
+    return val
+
+
+def reference_clean(df):
+    """Column-by-column cleaning as done before vectorization."""
+    cleaned = df.copy()
+    for col in cleaned.columns:
+        cleaned[col] = cleaned[col].apply(reference_clean_cell)
+    cleaned = cleaned[~cleaned.apply(
+        lambda row: all(CLEANER._is_empty_value(v) for v in row), axis=1
+    )]
+    cleaned = cleaned.loc[:, ~cleaned.apply(
+        lambda col: all(CLEANER._is_empty_value(v) for v in col), axis=0
+    )]
+    return None if cleaned.empty else cleaned
+
+
+def assert_same_table(expected, actual):
+    if expected is None or actual is None:
+        assert expected is None and actual is None, (expected, actual)
+        return
+    assert expected.shape == actual.shape
+    assert list(expected.index) == list(actual.index)
+    assert list(expected.columns) == list(actual.columns)
+    for i in range(expected.shape[1]):
+        for x, y in zip(expected.iloc[:, i], actual.iloc[:, i]):
+            if isinstance(x, float) and np.isnan(x):
+                assert np.isnan(y)
+            else:
+                assert x == y, (expected, actual)
+
+
+def test_matches_per_cell_reference_on_random_tables():
+    rnd = random.Random(1)
+    values = ["  a ", "", "   ", None, np.nan, "CONFIDENTIAL note", "[image: x]", " [image: x]",
+              "[IMAGE: y]", " [cid:1]", "[cid:2]", "Rs 500", "x", 5, 3.5, [], [1], "Caution!",
+              "intended  recipient", "Intended Recipient", pd.NA]
+    for trial in range(500):
+        rows, cols = rnd.randint(1, 6), rnd.randint(1, 5)
+        df = pd.DataFrame(
+            [[rnd.choice(values) for _ in range(cols)] for _ in range(rows)],
+            columns=[f"c{j}" for j in range(cols)]
+        )
+        if trial % 7 == 0:
+            df["num"] = np.where(np.arange(rows) % 2, np.nan, 1.0)
+        assert_same_table(reference_clean(df), CLEANER.clean(df))
+
+
+def test_object_columns_without_strings():
+    for df in (
+        pd.DataFrame({"qty": [1, 2], "price": [10.5, None]}, dtype=object),
+        pd.DataFrame([[pd.NA], [4.5]]),
+        pd.DataFrame({"a": [None, None]}, dtype=object),
+    ):
+        assert_same_table(reference_clean(df), CLEANER.clean(df))
+
+
+def test_gmail_prefix_is_case_sensitive_and_anchored():
+    df = pd.DataFrame({"a": [" [image: x]", "[IMAGE: y]", "[image: z]"], "b": ["1", "2", "3"]})
+
+    cleaned = CLEANER.clean(df)
+
+    assert list(cleaned["a"]) == ["[image: x]", "[IMAGE: y]", ""]